@@ -0,0 +1,415 @@
+"""
+Benchmark suite for the hot paths, run at several data sizes so that the scaling curve is visible.
+
+Usage (from the repository root):
+    python -m benchmarks.bench --output bench.json
+    python -m benchmarks.bench --baseline bench.json --threshold 0.25
+
+With --baseline the run fails (exit status 1) when a benchmark is more than
+--threshold slower than in the baseline at some size, or when its scaling
+exponent grew by more than --exponent-tolerance (e.g. linear to quadratic).
+
+Startup time (a fresh interpreter opening the menu or running a CLI command)
+is measured too, and fails the run when it exceeds --startup-budget
+milliseconds beyond the bare interpreter start.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+from src.controllers.base_controller import BaseController
+from src.controllers.tournament_controller import TournamentController
+from src.dtos.player_dto import PlayerDTO
+from src.dtos.tournament_dto import TournamentDTO
+from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.time_control import TimeControl
+from src.utils.synthetic import generate_players, generate_swiss_tournament
+from src.views.tournament_view import TournamentView
+
+DEFAULT_SIZES = (32, 128, 512)
+SWISS_ROUNDS = 7
+# Tournaments in the data file of the persistence and statistics benchmarks
+FILE_TOURNAMENTS = 10
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Python arguments of each startup measurement, run from the repository root
+STARTUP_COMMANDS = {
+    'startup.interpreter': ['-c', 'pass'],
+    'startup.menu': ['-c', 'from src.views import MainView; MainView()'],
+    'startup.cli_help': ['main.py', '--help'],
+    'startup.cli_controller': ['-c', 'import src.cli; from src.controllers.tournament_controller '
+                                     'import TournamentController; TournamentController()'],
+}
+DEFAULT_STARTUP_BUDGET_MS = 100.0
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark: a function taking the Fixtures of one size and returning the callable to time."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class Fixtures:
+    """Deterministic data of one size, built on first use and shared by the benchmarks."""
+
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self.seed = seed
+        self.__cache = {}
+        self.__data_dir = None
+
+    def __get(self, key: str, build):
+        if key not in self.__cache:
+            self.__cache[key] = build()
+        return self.__cache[key]
+
+    @property
+    def players(self) -> list:
+        """Players of the tournaments."""
+        return self.__get('players', lambda: generate_players(self.size, random.Random(self.seed)))
+
+    @property
+    def played_swiss(self):
+        """A Swiss tournament with all its rounds played."""
+        return self.__get('played_swiss', lambda: generate_swiss_tournament(
+            "Bench Swiss", self.players, SWISS_ROUNDS, random.Random(self.seed)))
+
+    @property
+    def pending_swiss(self):
+        """A Swiss tournament with its last round still to be paired."""
+        return self.__get('pending_swiss', lambda: generate_swiss_tournament(
+            "Bench Swiss", self.players, SWISS_ROUNDS, random.Random(self.seed), SWISS_ROUNDS - 1))
+
+    @property
+    def played_swiss_dict(self) -> dict:
+        return self.__get('played_swiss_dict', lambda: TournamentDTO.to_dict(self.played_swiss))
+
+    @property
+    def file_data(self) -> list:
+        """Contents of the tournaments.json used by the persistence and statistics benchmarks."""
+        def build():
+            data = []
+            for number in range(FILE_TOURNAMENTS):
+                copy = dict(self.played_swiss_dict)
+                copy['name'] = f"Bench Swiss {number}"
+                data.append(copy)
+            return data
+        return self.__get('file_data', build)
+
+    @property
+    def data_dir(self) -> str:
+        """Temporary data directory holding tournaments.json."""
+        if self.__data_dir is None:
+            self.__data_dir = tempfile.mkdtemp(prefix='chess-bench-')
+            self.controller(BaseController)._save_data(self.file_data, 'tournaments.json')
+        return self.__data_dir
+
+    def controller(self, controller_class):
+        """Create a controller reading and writing the fixture data directory."""
+        controller = controller_class()
+        controller.data_path = self.data_dir + '/'
+        return controller
+
+    def cleanup(self) -> None:
+        if self.__data_dir is not None:
+            shutil.rmtree(self.__data_dir, ignore_errors=True)
+            self.__data_dir = None
+
+
+@benchmark('dto.tournament_to_dict')
+def bench_tournament_to_dict(fixtures: Fixtures):
+    tournament = fixtures.played_swiss
+    return lambda: TournamentDTO.to_dict(tournament)
+
+
+@benchmark('dto.tournament_from_dict')
+def bench_tournament_from_dict(fixtures: Fixtures):
+    data = fixtures.played_swiss_dict
+    return lambda: TournamentDTO.from_dict(data)
+
+
+@benchmark('dto.player_round_trip')
+def bench_player_round_trip(fixtures: Fixtures):
+    players = fixtures.players
+    return lambda: [PlayerDTO.from_dict(PlayerDTO.to_dict(player)) for player in players]
+
+
+@benchmark('controller.load_data')
+def bench_load_data(fixtures: Fixtures):
+    controller = fixtures.controller(BaseController)
+    return lambda: controller._load_data('tournaments.json')
+
+
+@benchmark('controller.save_data')
+def bench_save_data(fixtures: Fixtures):
+    controller = fixtures.controller(BaseController)
+    data = fixtures.file_data
+    return lambda: controller._save_data(data, 'tournaments.json')
+
+
+@benchmark('swiss.generate_pairings')
+def bench_swiss_pairings(fixtures: Fixtures):
+    tournament = fixtures.pending_swiss
+    return lambda: tournament.generate_swiss_pairings(SWISS_ROUNDS)
+
+
+@benchmark('eliminatory.generate_bracket_pairings')
+def bench_bracket_pairings(fixtures: Fixtures):
+    tournament = EliminatoryTournament("Bench Cup", "Bench", "2026-01-01", "2026-01-02", TimeControl.CLASSIC)
+    for player in fixtures.players:
+        tournament.add_player(player)
+    return lambda: tournament.generate_bracket_pairings(1)
+
+
+@benchmark('statistics.get_player_statistics')
+def bench_player_statistics(fixtures: Fixtures):
+    controller = fixtures.controller(TournamentController)
+    player_name = fixtures.players[0].name
+    return lambda: controller.get_player_statistics("Bench Swiss 0", player_name)
+
+
+@benchmark('statistics.get_all_players_statistics')
+def bench_all_players_statistics(fixtures: Fixtures):
+    controller = fixtures.controller(TournamentController)
+    return lambda: controller.get_all_players_statistics("Bench Swiss 0")
+
+
+@benchmark('view.calculate_player_scores')
+def bench_calculate_player_scores(fixtures: Fixtures):
+    view = TournamentView()
+    tournament = fixtures.played_swiss
+    return lambda: view._calculate_player_scores(tournament, SWISS_ROUNDS)
+
+
+def measure(func, repeat: int, min_time: float) -> float:
+    """
+    Time a callable as timeit does: enough calls per sample to last min_time, best of repeat samples.
+
+    Returns:
+        float: Seconds per call.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    return min([elapsed] + timer.repeat(repeat - 1, number)) / number if repeat > 1 else elapsed / number
+
+
+def scaling_exponent(timings: dict) -> float | None:
+    """
+    Estimate how time grows with size: ~1 for linear, ~2 for quadratic.
+
+    Uses the least-squares slope of log(time) over log(size).
+
+    Args:
+        timings (dict): Size -> seconds per call.
+
+    Returns:
+        float | None: The exponent, or None with fewer than 2 sizes.
+    """
+    points = [(math.log(int(size)), math.log(seconds)) for size, seconds in timings.items() if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_suite(sizes: list, names: list, repeat: int, min_time: float, seed: int = 0) -> dict:
+    """
+    Run the selected benchmarks at every size.
+
+    Returns:
+        dict: Benchmark name -> {'seconds': {size: seconds per call}, 'exponent': float | None}.
+    """
+    results = {name: {'seconds': {}, 'exponent': None} for name in names}
+    for size in sizes:
+        fixtures = Fixtures(size, seed)
+        try:
+            for name in names:
+                seconds = measure(BENCHMARKS[name](fixtures), repeat, min_time)
+                results[name]['seconds'][str(size)] = seconds
+                print(f"{name:<42}{size:>7}{seconds * 1000:>12.3f} ms", flush=True)
+        finally:
+            fixtures.cleanup()
+
+    for entry in results.values():
+        entry['exponent'] = scaling_exponent(entry['seconds'])
+    return results
+
+
+def measure_startup(repeat: int) -> dict:
+    """
+    Time fresh interpreters running each startup command (best of repeat runs).
+
+    Returns:
+        dict: Command name -> {'seconds', 'overhead_seconds'}; the overhead excludes the bare interpreter start.
+    """
+    timings = {}
+    for name, arguments in STARTUP_COMMANDS.items():
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *arguments], cwd=REPOSITORY_ROOT, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+
+    interpreter = timings['startup.interpreter']
+    return {
+        name: {'seconds': seconds, 'overhead_seconds': max(0.0, seconds - interpreter)}
+        for name, seconds in timings.items()
+    }
+
+
+def check_startup(startup: dict, budget_ms: float, baseline: dict | None, threshold: float) -> list:
+    """
+    Check startup overheads against the budget and, if given, the baseline run.
+
+    Returns:
+        list: Descriptions of the violations; empty if there are none.
+    """
+    problems = []
+    for name, entry in startup.items():
+        overhead_ms = entry['overhead_seconds'] * 1000
+        if overhead_ms > budget_ms:
+            problems.append(f"{name}: {overhead_ms:.1f} ms over the interpreter start (budget {budget_ms:.0f} ms)")
+        base = (baseline or {}).get(name)
+        # A few milliseconds of process start-up noise are not a regression
+        if base and overhead_ms > base['overhead_seconds'] * 1000 * (1 + threshold) + 5:
+            problems.append(f"{name}: {base['overhead_seconds'] * 1000:.1f} ms -> {overhead_ms:.1f} ms")
+    return problems
+
+
+def compare(results: dict, baseline: dict, threshold: float, exponent_tolerance: float) -> list:
+    """
+    Compare a run against a baseline run.
+
+    Args:
+        results (dict): Benchmarks of this run, as returned by run_suite().
+        baseline (dict): Benchmarks of the baseline run.
+        threshold (float): Allowed slowdown (0.25 allows 25% slower).
+        exponent_tolerance (float): Allowed growth of the scaling exponent.
+
+    Returns:
+        list: Descriptions of the regressions; empty if there are none.
+    """
+    regressions = []
+    for name, entry in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for size, seconds in entry['seconds'].items():
+            base_seconds = base['seconds'].get(size)
+            if base_seconds and seconds > base_seconds * (1 + threshold):
+                regressions.append(f"{name} at size {size}: {base_seconds * 1000:.3f} ms -> "
+                                   f"{seconds * 1000:.3f} ms ({seconds / base_seconds - 1:+.0%})")
+        exponent, base_exponent = entry['exponent'], base.get('exponent')
+        if exponent is not None and base_exponent is not None and exponent > base_exponent + exponent_tolerance:
+            regressions.append(f"{name} scaling: exponent {base_exponent:.2f} -> {exponent:.2f}")
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths at several data sizes.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="comma-separated player counts")
+    parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5, help="samples per benchmark (the best one is kept)")
+    parser.add_argument('--min-time', type=float, default=0.1, help="minimum seconds per sample")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON results of a previous run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown against the baseline")
+    parser.add_argument('--exponent-tolerance', type=float, default=0.5, help="allowed growth of the scaling exponent")
+    parser.add_argument('--startup-budget', type=float, default=DEFAULT_STARTUP_BUDGET_MS,
+                        help="allowed startup milliseconds beyond the bare interpreter start")
+    parser.add_argument('--no-startup', action='store_true', help="skip the startup measurements")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if not names:
+        parser.error(f"No benchmark matches '{args.filter}'.")
+
+    results = run_suite(sizes, names, max(1, args.repeat), args.min_time, args.seed)
+
+    startup = {} if args.no_startup else measure_startup(max(1, args.repeat))
+    for name, entry in startup.items():
+        print(f"{name:<42}{entry['seconds'] * 1000:>12.1f} ms  (+{entry['overhead_seconds'] * 1000:.1f} ms)")
+
+    print(f"\n{'benchmark':<42}{'exponent':>9}")
+    for name, entry in results.items():
+        exponent = entry['exponent']
+        print(f"{name:<42}{exponent:>9.2f}" if exponent is not None else f"{name:<42}{'-':>9}")
+
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'sizes': sizes,
+            'repeat': args.repeat,
+            'min_time': args.min_time,
+        },
+        'benchmarks': results,
+        'startup': startup,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=4)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    startup_problems = check_startup(startup, args.startup_budget, (baseline or {}).get('startup'), args.threshold)
+    if startup_problems:
+        print("\nStartup time over budget:")
+        for problem in startup_problems:
+            print(f"  {problem}")
+        return 1
+
+    if baseline is not None:
+        regressions = compare(results, baseline.get('benchmarks', {}), args.threshold, args.exponent_tolerance)
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regression against {args.baseline} (threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+End-to-end load test: generate a synthetic data set and drive the controller APIs against it.
+
+Usage (from the repository root):
+    python -m benchmarks.load_test --players 10000 --tournaments 100
+    python -m benchmarks.load_test --data-dir /tmp/synthetic --reuse --json report.json
+"""
+import argparse
+import json
+import math
+import random
+import shutil
+import tempfile
+import time
+
+from src.controllers.player_controller import PlayerController
+from src.controllers.tournament_controller import TournamentController
+from src.entities.swiss_tournament import SwissTournament
+from src.entities.time_control import TimeControl
+from src.utils.synthetic import generate_dataset, sample_result
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Get a percentile by the nearest-rank method.
+
+    Args:
+        values (list): The measurements, in any order.
+        fraction (float): Percentile between 0 and 1 (0.99 for p99).
+
+    Returns:
+        float: The measurement at that rank, or 0.0 if there are none.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(fraction * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: dict) -> dict:
+    """Get count, mean and p50/p90/p99/max in milliseconds for each operation."""
+    summary = {}
+    for operation, values in latencies.items():
+        summary[operation] = {
+            'count': len(values),
+            'mean_ms': sum(values) / len(values) * 1000 if values else 0.0,
+            'p50_ms': percentile(values, 0.50) * 1000,
+            'p90_ms': percentile(values, 0.90) * 1000,
+            'p99_ms': percentile(values, 0.99) * 1000,
+            'max_ms': max(values, default=0.0) * 1000,
+        }
+    return summary
+
+
+class LoadTest:
+    """Drives the controllers against a data directory and records the latency of every call."""
+
+    def __init__(self, data_path: str, seed: int = 0):
+        self.players = PlayerController()
+        self.tournaments = TournamentController()
+        self.players.data_path = self.tournaments.data_path = data_path.rstrip('/') + '/'
+        self.rng = random.Random(seed)
+        self.latencies = {}
+
+    def timed(self, operation: str, func, *args):
+        """Call func(*args), recording its latency under operation."""
+        start = time.perf_counter()
+        result = func(*args)
+        self.latencies.setdefault(operation, []).append(time.perf_counter() - start)
+        return result
+
+    def run_reads(self, samples: int) -> None:
+        """Time the read paths: player search and queries, tournament lookups, standings and statistics."""
+        records = self.players._load_data()
+        names = [t.get('name') for t in self.tournaments._load_data()]
+        for _ in range(samples):
+            player_name = self.rng.choice(records)['name']
+            self.timed('search_players', self.players.search_players, player_name[:4], 10)
+            rating = self.rng.randint(1200, 2400)
+            self.timed('query_players', self.players.query_players, 'classic', rating, rating + 100, None, None, None, 50)
+
+            tournament_name = self.rng.choice(names)
+            self.timed('get_tournament_by_name', self.tournaments.get_tournament_by_name, tournament_name)
+            self.timed('get_standings', self.tournaments.get_standings, tournament_name, None, 10)
+            self.timed('get_all_players_statistics', self.tournaments.get_all_players_statistics, tournament_name)
+
+    def run_live_tournament(self, name: str, size: int, num_rounds: int, results_per_round: int) -> None:
+        """
+        Run a new Swiss tournament through the controllers: pair, save, enter results, read standings.
+
+        Only results_per_round results per round go through the timed
+        update_match_result (each one rewrites tournaments.json); the rest of
+        the round is then saved in a single untimed update.
+        """
+        tournament = SwissTournament(name, "Carga", "2026-03-01", "2026-03-07", TimeControl.CLASSIC, num_rounds)
+        for player in self.rng.sample(self.players.get_all_players(), size):
+            tournament.add_player(player)
+        self.timed('create_tournament', self.tournaments.create_tournament, tournament)
+
+        for _ in range(num_rounds):
+            round_number, pairings, _ = self.timed('generate_round_pairings', self.tournaments.generate_round_pairings, name)
+            self.timed('save_round_pairings', self.tournaments.save_round_pairings, name, round_number, pairings)
+
+            pending = [i for i, (_, black) in enumerate(pairings) if black is not None]
+            results = {
+                i: sample_result(pairings[i][0].rating.classic, pairings[i][1].rating.classic, self.rng)
+                for i in pending
+            }
+            for match_index in pending[:results_per_round]:
+                self.timed('update_match_result', self.tournaments.update_match_result,
+                           name, round_number, match_index, results[match_index])
+
+            rest = pending[results_per_round:]
+            if rest:
+                tournament = self.tournaments.get_tournament_by_name(name)
+                matches = tournament.get_round(round_number).matches
+                for match_index in rest:
+                    matches[match_index].result = results[match_index]
+                self.tournaments.update_tournament(name, tournament)
+
+            self.timed('get_standings', self.tournaments.get_standings, name, None, 10)
+        self.timed('get_all_players_statistics', self.tournaments.get_all_players_statistics, name)
+
+
+def print_report(setup: dict, summary: dict) -> None:
+    """Print the latency table."""
+    print(f"\nData set: {setup['players']} players, {setup['tournaments']} tournaments, "
+          f"{setup['games']} games (generated in {setup['generation_s']:.1f} s)")
+    print(f"\n{'operation':<28}{'count':>7}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for operation, stats in summary.items():
+        print(f"{operation:<28}{stats['count']:>7}{stats['mean_ms']:>10.1f}{stats['p50_ms']:>10.1f}"
+              f"{stats['p90_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+    print("\n(latencies in ms)")
+
+
+def main(argv: list | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="Generate a synthetic data set and measure controller latencies.")
+    parser.add_argument('--players', type=int, default=10000, help="players in the registry")
+    parser.add_argument('--tournaments', type=int, default=100, help="played tournaments")
+    parser.add_argument('--size', type=int, default=100, help="players per tournament")
+    parser.add_argument('--rounds', type=int, default=7, help="rounds per Swiss tournament")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--samples', type=int, default=50, help="timed calls per read operation")
+    parser.add_argument('--live', type=int, default=1, help="new tournaments run through the controllers")
+    parser.add_argument('--results-per-round', type=int, default=10, help="timed result entries per live round")
+    parser.add_argument('--data-dir', help="directory for the data set (a temporary one if omitted)")
+    parser.add_argument('--reuse', action='store_true', help="use the data set already in --data-dir")
+    parser.add_argument('--json', help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='chess-load-')
+    start = time.perf_counter()
+    if args.reuse:
+        setup = _describe_dataset(data_dir)
+    else:
+        setup = generate_dataset(data_dir, args.players, args.tournaments, args.size, args.rounds, seed=args.seed)
+    setup['generation_s'] = time.perf_counter() - start
+
+    try:
+        load = LoadTest(data_dir, args.seed)
+        load.run_reads(args.samples)
+        for number in range(1, args.live + 1):
+            load.run_live_tournament(f"Carga {number}", args.size, args.rounds, args.results_per_round)
+    finally:
+        if args.data_dir is None:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    summary = summarize(load.latencies)
+    print_report(setup, summary)
+    report = {'setup': setup, 'latencies': summary}
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=4)
+    return report
+
+
+def _describe_dataset(data_dir: str) -> dict:
+    """Count the players, tournaments and games of an existing data set."""
+    reader = TournamentController()
+    reader.data_path = data_dir.rstrip('/') + '/'
+    tournaments = reader._load_data()
+    return {
+        'data_path': data_dir,
+        'players': len(reader._load_data('players.json')),
+        'tournaments': len(tournaments),
+        'games': sum(len(r.get('matches', [])) for t in tournaments for r in t.get('rounds_data', [])),
+    }
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Memory profile of loading tournaments, separating JSON decoding from entity hydration.
+
+Usage (from the repository root):
+    python -m benchmarks.memory_profile --data-dir src/data --output memory.json
+    python -m benchmarks.memory_profile --data-dir src/data --baseline memory.json --threshold 0.1
+
+Without --data-dir a synthetic data set is generated. With --baseline the run
+fails (exit status 1) when an operation's peak or retained memory grew past
+the threshold.
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+
+from src.controllers.tournament_controller import TournamentController
+from src.dtos.tournament_dto import TournamentDTO
+from src.utils.memory_diagnostics import MemoryTracker, diff_reports, load_reports
+from src.utils.synthetic import generate_dataset
+
+
+def run_workload(data_dir: str, tracker: MemoryTracker) -> None:
+    """Measure decoding, hydration and the main controller reads of the tournaments in data_dir."""
+    controller = TournamentController()
+    controller.data_path = data_dir.rstrip('/') + '/'
+
+    # Decoded dicts alone, then the entities built from already decoded dicts
+    data = tracker.run('json.load:tournaments.json', controller._load_data)
+    tracker.run('TournamentDTO.from_dict (all)', lambda: [TournamentDTO.from_dict(t) for t in data])
+    if not data:
+        return
+    largest = max(data, key=lambda t: sum(len(r.get('matches', [])) for r in t.get('rounds_data', [])))['name']
+    del data
+
+    tracker.run('TournamentController.get_all_tournaments', controller.get_all_tournaments)
+    tracker.run('TournamentController.get_tournament_by_name', controller.get_tournament_by_name, largest)
+    tracker.run('TournamentController.get_all_players_statistics', controller.get_all_players_statistics, largest)
+
+
+def print_reports(reports: list) -> None:
+    for report in reports:
+        print(f"\n{report['operation']}  ({report['elapsed_s'] * 1000:.0f} ms)")
+        print(f"  peak {report['peak_bytes'] / 2 ** 20:.1f} MiB, retained {report['retained_bytes'] / 2 ** 20:.1f} MiB")
+        for site in report['top_sites'][:3]:
+            print(f"  {site['size_bytes'] / 2 ** 20:8.1f} MiB  {site['site']}")
+        added = {name: entry['added'] for name, entry in report['objects'].items() if entry['added']}
+        if added:
+            print("  objects: " + ", ".join(f"{name} {count:+d}" for name, count in added.items()))
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile the memory used to load and query tournaments.")
+    parser.add_argument('--data-dir', help="data directory to profile (a synthetic one if omitted)")
+    parser.add_argument('--players', type=int, default=2000, help="registry size of the synthetic data set")
+    parser.add_argument('--tournaments', type=int, default=20, help="tournaments of the synthetic data set")
+    parser.add_argument('--top', type=int, default=10, help="allocation sites per operation")
+    parser.add_argument('--output', help="write the reports as JSON to this file")
+    parser.add_argument('--baseline', help="reports of a previous run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1, help="allowed growth of peak or retained memory")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='chess-memory-')
+    try:
+        if args.data_dir is None:
+            generate_dataset(data_dir, args.players, args.tournaments)
+        tracker = MemoryTracker(top=args.top)
+        run_workload(data_dir, tracker)
+    finally:
+        if args.data_dir is None:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print_reports(tracker.reports)
+    if args.output:
+        tracker.save(args.output)
+
+    if args.baseline:
+        differences = diff_reports(load_reports(args.baseline), tracker.reports, args.threshold)
+        regressions = [entry for entry in differences if entry['regression']]
+        for entry in regressions:
+            print(f"\nRegression in {entry['operation']}: peak {entry['old_peak_bytes']} -> {entry['new_peak_bytes']} B, "
+                  f"retained {entry['old_retained_bytes']} -> {entry['new_retained_bytes']} B")
+        if regressions:
+            return 1
+        print(f"\nNo memory regression against {args.baseline} (threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
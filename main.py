@@ -1,8 +1,14 @@
-from src.views import MainView
+import sys
 
 
 def main():
     """Entry point for the chess tournament management system."""
+    # With arguments, run a single non-interactive command (see src/cli.py)
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    from src.views import MainView
     app = MainView()
     app.run()
 
@@ -0,0 +1,381 @@
+"""
+Non-interactive command line interface: calls the controllers directly, without any view.
+
+Examples:
+    python main.py pair "Aberto de Verão"
+    python main.py enter-results "Aberto de Verão" resultados.txt
+    cat resultados.txt | python main.py enter-results "Aberto de Verão" -
+    python main.py standings "Aberto de Verão" --limit 10 --format csv
+    python main.py export "Aberto de Verão" -o aberto.json
+    python main.py import aberto.json --replace
+    python main.py export-site site/
+    python main.py export-trf "Aberto de Verão" -o aberto.trf
+    python main.py import-trf arquivo/*.trf
+    python main.py stats "Aberto de Verão" --format json
+    python main.py serve --port 8000
+    python main.py ingest --port 7000
+"""
+import argparse
+import csv
+import json
+import sys
+
+# Accepted spellings of each result in result files
+RESULT_ALIASES = {
+    "1-0": "1-0",
+    "0-1": "0-1",
+    "0.5-0.5": "0.5-0.5",
+    "1/2-1/2": "0.5-0.5",
+    "½-½": "0.5-0.5",
+    "=": "0.5-0.5",
+}
+
+
+def parse_results(lines) -> dict:
+    """
+    Parse result lines of the form 'BOARD RESULT' (boards numbered from 1).
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        lines: Iterable of text lines (an open file or sys.stdin).
+
+    Returns:
+        dict: Match index (board - 1) -> result ('1-0', '0-1' or '0.5-0.5').
+
+    Raises:
+        ValueError: If a line is malformed, a result is unknown or a board is repeated.
+    """
+    results = {}
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split()
+        if len(parts) != 2 or not parts[0].isdigit() or int(parts[0]) < 1:
+            raise ValueError(f"Linha {line_number}: esperado 'MESA RESULTADO', recebido '{line}'.")
+        board, result = int(parts[0]), RESULT_ALIASES.get(parts[1])
+        if result is None:
+            raise ValueError(f"Linha {line_number}: resultado inválido '{parts[1]}'.")
+        if board - 1 in results:
+            raise ValueError(f"Linha {line_number}: mesa {board} repetida.")
+        results[board - 1] = result
+    return results
+
+
+def _open_input(path: str):
+    """Open a file for reading, or stdin for '-'."""
+    return sys.stdin if path == '-' else open(path, encoding='utf-8')
+
+
+def _tournament_controller(args):
+    from src.controllers.tournament_controller import TournamentController
+    controller = TournamentController()
+    if args.data_dir:
+        controller.data_path = args.data_dir.rstrip('/') + '/'
+    return controller
+
+
+def _get_tournament(controller, name: str):
+    tournament = controller.get_tournament_by_name(name)
+    if tournament is None:
+        raise ValueError(f"Torneio '{name}' não encontrado.")
+    return tournament
+
+
+def _write_rows(header: list, rows: list, output_format: str) -> None:
+    """Print rows as an aligned table, JSON records or CSV."""
+    if output_format == 'json':
+        json.dump([dict(zip(header, row)) for row in rows], sys.stdout, indent=4, ensure_ascii=False)
+        print()
+    elif output_format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(header)
+        writer.writerows(rows)
+    else:
+        widths = [max(len(str(value)) for value in column) for column in zip(header, *rows)]
+        for row in [header] + rows:
+            print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip())
+
+
+def command_pair(args) -> int:
+    """Generate and save the pairings of the next round."""
+    controller = _tournament_controller(args)
+    round_number, pairings, _ = controller.generate_round_pairings(args.tournament, args.time_budget)
+    if not args.dry_run:
+        controller.save_round_pairings(args.tournament, round_number, pairings)
+
+    rows = [
+        [board, white.name, black.name if black is not None else "BYE"]
+        for board, (white, black) in enumerate(pairings, 1)
+    ]
+    if args.format == 'text':
+        print(f"Rodada {round_number}" + (" (não salva)" if args.dry_run else ""))
+    _write_rows(['mesa', 'brancas', 'pretas'], rows, args.format)
+    return 0
+
+
+def command_enter_results(args) -> int:
+    """Enter the results of a round from a file or stdin, in a single save."""
+    controller = _tournament_controller(args)
+    with _open_input(args.file) as file:
+        results = parse_results(file)
+
+    round_number = args.round
+    if round_number is None:
+        rounds = _get_tournament(controller, args.tournament).rounds
+        if not rounds:
+            raise ValueError("O torneio ainda não tem rodadas.")
+        round_number = rounds[-1].round_
+
+    count = controller.update_match_results(args.tournament, round_number, results)
+    print(f"{count} resultados registrados na rodada {round_number}.", file=sys.stderr)
+    return 0
+
+
+def command_standings(args) -> int:
+    """Print the standings."""
+    controller = _tournament_controller(args)
+    standings = controller.get_standings(args.tournament, args.round, args.limit)
+    rows = [
+        [position, entry['player'].name, entry['score'], entry['matches_played']]
+        for position, entry in enumerate(standings, 1)
+    ]
+    _write_rows(['posicao', 'jogador', 'pontos', 'partidas'], rows, args.format)
+    return 0
+
+
+def command_stats(args) -> int:
+    """Print the statistics of every player (or one player)."""
+    controller = _tournament_controller(args)
+    if args.player:
+        statistics = [(args.player, controller.get_player_statistics(args.tournament, args.player))]
+    else:
+        statistics = [(player.name, stats) for player, stats in controller.get_all_players_statistics(args.tournament)]
+
+    header = ['jogador', 'pontos', 'partidas', 'vitorias', 'empates', 'derrotas',
+              'media_adversarios', 'performance', 'variacao_rating']
+    keys = ['points', 'games_played', 'wins', 'draws', 'losses',
+            'average_opponent_rating', 'performance_rating', 'rating_change']
+    rows = [
+        [name] + [round(value, 2) if isinstance(value, float) else value for value in map(stats.get, keys)]
+        for name, stats in statistics
+    ]
+    _write_rows(header, rows, args.format)
+    return 0
+
+
+def command_export(args) -> int:
+    """Write tournaments as JSON, in the format of tournaments.json."""
+    from src.dtos.tournament_dto import TournamentDTO
+
+    controller = _tournament_controller(args)
+    if args.all:
+        data = [TournamentDTO.to_dict(t) for t in controller.get_all_tournaments()]
+    elif args.tournament:
+        data = TournamentDTO.to_dict(_get_tournament(controller, args.tournament))
+    else:
+        raise ValueError("Informe o nome do torneio ou --all.")
+
+    if args.output and args.output != '-':
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+    else:
+        json.dump(data, sys.stdout, indent=4)
+        print()
+    return 0
+
+
+def command_import(args) -> int:
+    """Create (or with --replace, overwrite) tournaments from a JSON file or stdin."""
+    from src.dtos.tournament_dto import TournamentDTO
+
+    controller = _tournament_controller(args)
+    with _open_input(args.file) as file:
+        data = json.load(file)
+
+    # Everything is checked before the first tournament is saved
+    records = data if isinstance(data, list) else [data]
+    tournaments = []
+    for tournament_data in records:
+        TournamentDTO.validate(tournament_data)
+        try:
+            tournaments.append(TournamentDTO.from_dict(tournament_data))
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            raise ValueError(f"Torneio inválido '{tournament_data.get('name')}': {type(e).__name__}: {e}") from None
+
+    for tournament in tournaments:
+        if args.replace and controller.get_tournament_by_name(tournament.name) is not None:
+            controller.update_tournament(tournament.name, tournament)
+            print(f"Torneio '{tournament.name}' substituído.", file=sys.stderr)
+        else:
+            controller.create_tournament(tournament)
+            print(f"Torneio '{tournament.name}' importado.", file=sys.stderr)
+    return 0
+
+
+def command_export_trf(args) -> int:
+    """Write a tournament as a FIDE TRF report."""
+    from src.dtos.trf_dto import TrfDTO
+
+    tournament = _get_tournament(_tournament_controller(args), args.tournament)
+    if args.output and args.output != '-':
+        with open(args.output, 'w', encoding='utf-8') as file:
+            TrfDTO.write(tournament, file)
+    else:
+        TrfDTO.write(tournament, sys.stdout)
+    return 0
+
+
+def command_import_trf(args) -> int:
+    """Create tournaments from FIDE TRF reports, parsed in parallel and saved at once."""
+    from src.dtos.trf_dto import TrfDTO
+
+    controller = _tournament_controller(args)
+    tournaments = TrfDTO.read_files(args.files, args.time_control, args.workers)
+    count = controller.create_tournaments(tournaments)
+    print(f"{count} torneios importados.", file=sys.stderr)
+    return 0
+
+
+def command_export_site(args) -> int:
+    """Update the static website (see src/site_export.py)."""
+    from src.site_export import SiteExporter
+
+    exporter = SiteExporter(args.output, args.data_dir, args.workers)
+    counts = exporter.export(args.tournament or None)
+    print(f"{counts['written']} páginas gravadas, {counts['unchanged']} sem alteração, "
+          f"{counts['removed']} removidas.", file=sys.stderr)
+    return 0
+
+
+def command_serve(args) -> int:
+    """Run the HTTP/JSON API (see src/server.py) until interrupted."""
+    import asyncio
+    from src.server import ApiServer
+
+    server = ApiServer(args.data_dir, args.max_pending_writes)
+    address = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Servindo em {address} (Ctrl+C para encerrar)", file=sys.stderr)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+def command_ingest(args) -> int:
+    """Run the result ingestion service (see src/ingest.py) until interrupted."""
+    import asyncio
+    from src.ingest import ResultIngestor
+
+    ingestor = ResultIngestor(args.data_dir, args.batch_window)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"Recebendo resultados em {address} (Ctrl+C para encerrar)", file=sys.stderr)
+    try:
+        asyncio.run(ingestor.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    stats = ingestor.stats
+    print(f"{stats['ok']} resultados gravados em {stats['writes']} gravações, "
+          f"{stats['duplicate']} repetidos, {stats['error']} recusados.", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py', description="Gerenciador de torneios de xadrez (modo não interativo).")
+    parser.add_argument('--data-dir', help="diretório dos arquivos de dados (padrão: src/data)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    formats = ('text', 'json', 'csv')
+
+    pair = commands.add_parser('pair', help="gera e salva o emparceiramento da próxima rodada")
+    pair.add_argument('tournament')
+    pair.add_argument('--time-budget', type=float, help="segundos para a busca de emparceiramento Swiss")
+    pair.add_argument('--dry-run', action='store_true', help="apenas exibe, sem salvar")
+    pair.add_argument('--format', choices=formats, default='text')
+    pair.set_defaults(handler=command_pair)
+
+    results = commands.add_parser('enter-results', help="registra resultados de um arquivo ('-' para stdin)")
+    results.add_argument('tournament')
+    results.add_argument('file', help="linhas 'MESA RESULTADO', ex.: '3 1-0'")
+    results.add_argument('--round', type=int, help="rodada (padrão: a última)")
+    results.set_defaults(handler=command_enter_results)
+
+    standings = commands.add_parser('standings', help="exibe a classificação")
+    standings.add_argument('tournament')
+    standings.add_argument('--round', type=int, help="última rodada contabilizada")
+    standings.add_argument('--limit', type=int)
+    standings.add_argument('--format', choices=formats, default='text')
+    standings.set_defaults(handler=command_standings)
+
+    stats = commands.add_parser('stats', help="exibe as estatísticas dos jogadores")
+    stats.add_argument('tournament')
+    stats.add_argument('--player', help="apenas este jogador")
+    stats.add_argument('--format', choices=formats, default='text')
+    stats.set_defaults(handler=command_stats)
+
+    export = commands.add_parser('export', help="exporta torneios em JSON")
+    export.add_argument('tournament', nargs='?')
+    export.add_argument('--all', action='store_true', help="exporta todos os torneios")
+    export.add_argument('-o', '--output', help="arquivo de saída (padrão: stdout)")
+    export.set_defaults(handler=command_export)
+
+    import_ = commands.add_parser('import', help="importa torneios de um arquivo JSON ('-' para stdin)")
+    import_.add_argument('file')
+    import_.add_argument('--replace', action='store_true', help="substitui torneios com o mesmo nome")
+    import_.set_defaults(handler=command_import)
+
+    export_trf = commands.add_parser('export-trf', help="exporta um torneio no formato TRF da FIDE")
+    export_trf.add_argument('tournament')
+    export_trf.add_argument('-o', '--output', help="arquivo de saída (padrão: stdout)")
+    export_trf.set_defaults(handler=command_export_trf)
+
+    import_trf = commands.add_parser('import-trf', help="importa torneios de arquivos TRF da FIDE")
+    import_trf.add_argument('files', nargs='+')
+    import_trf.add_argument('--workers', type=int, help="processos de leitura (padrão: um por CPU)")
+    import_trf.add_argument('--time-control', choices=('classic', 'rapid', 'blitz'), default='classic',
+                            help="ritmo dos arquivos que não o informam")
+    import_trf.set_defaults(handler=command_import_trf)
+
+    site = commands.add_parser('export-site', help="atualiza o site estático (HTML e JSON) dos torneios")
+    site.add_argument('output', help="diretório do site")
+    site.add_argument('--tournament', action='append', help="apenas este torneio (pode repetir)")
+    site.add_argument('--workers', type=int, default=8, help="threads de gravação")
+    site.set_defaults(handler=command_export_site)
+
+    serve = commands.add_parser('serve', help="inicia a API HTTP/JSON local")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    serve.add_argument('--unix', help="escuta em um socket Unix em vez de TCP")
+    serve.add_argument('--max-pending-writes', type=int, default=64,
+                       help="gravações em espera antes de responder 503")
+    serve.set_defaults(handler=command_serve)
+
+    ingest = commands.add_parser('ingest', help="recebe resultados de tabuleiros eletrônicos e terminais")
+    ingest.add_argument('--host', default='127.0.0.1')
+    ingest.add_argument('--port', type=int, default=7000)
+    ingest.add_argument('--unix', help="escuta em um socket Unix em vez de TCP")
+    ingest.add_argument('--batch-window', type=float, default=0.05,
+                        help="segundos de espera por mais resultados antes de gravar")
+    ingest.set_defaults(handler=command_ingest)
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Run one CLI command.
+
+    Args:
+        argv (list | None): Command line arguments (sys.argv[1:] if None).
+
+    Returns:
+        int: Exit status (0 on success, 1 on error).
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 1
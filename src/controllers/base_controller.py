@@ -1,4 +1,14 @@
 import json
+import os
+import tempfile
+import time
+
+from src.utils.metrics import METRICS
+
+
+class DataFileError(ValueError):
+    """Raised when a data file exists but cannot be decoded."""
+
 
 class BaseController:
     """Base controller class providing common functionalities for all controllers."""
@@ -12,14 +22,80 @@ class BaseController:
         filename = filename or self.filename
         try:
             with open(self.data_path + filename, 'r') as file:
-                return json.load(file)
+                if not METRICS.enabled:
+                    return json.load(file)
+                return self._measured_load(file, filename)
         except FileNotFoundError:
             return []
         except json.JSONDecodeError:
-            raise ValueError(f"Error decoding JSON from file: {filename}")
+            raise DataFileError(f"Error decoding JSON from file: {filename}")
 
     def _save_data(self, data: dict | list, filename: str | None = None) -> None:
-        """Save data to a JSON file."""
+        """
+        Save data to a JSON file.
+
+        The data is written to a temporary file that then replaces the target,
+        so readers in other threads or processes always see a complete file.
+        """
+        filename = filename or self.filename
+        path = self.data_path + filename
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f".{filename}.")
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                if METRICS.enabled:
+                    self._measured_save(file, filename, data)
+                else:
+                    json.dump(data, file, indent=4)
+            if os.path.exists(path):
+                os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+            else:
+                os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @staticmethod
+    def _measured_load(file, filename: str) -> dict | list:
+        """Read and decode a data file, recording read and decode time and bytes read."""
+        start = time.perf_counter()
+        text = file.read()
+        decode_start = time.perf_counter()
+        data = json.loads(text)
+        end = time.perf_counter()
+        METRICS.record(f"load:{filename}", end - start)
+        METRICS.count('json.decode_s', end - decode_start)
+        METRICS.count('json.bytes_read', len(text.encode()))
+        return data
+
+    @staticmethod
+    def _measured_save(file, filename: str, data: dict | list) -> None:
+        """Encode and write a data file, recording encode and write time and bytes written."""
+        start = time.perf_counter()
+        text = json.dumps(data, indent=4)
+        write_start = time.perf_counter()
+        file.write(text)
+        end = time.perf_counter()
+        METRICS.record(f"save:{filename}", end - start)
+        METRICS.count('json.encode_s', write_start - start)
+        METRICS.count('json.bytes_written', len(text.encode()))
+
+    def _file_signature(self, filename: str | None = None) -> tuple | None:
+        """
+        Get a cheap signature of a data file, used to detect changes on disk.
+
+        Every save replaces the file, so the inode tells apart two saves that
+        fall within the same timestamp tick and have the same size.
+
+        Returns:
+            tuple | None: (modification time in ns, size, inode) or None if the file does not exist.
+        """
         filename = filename or self.filename
-        with open(self.data_path + filename, 'w') as file:
-            json.dump(data, file, indent=4)
+        try:
+            stat = os.stat(self.data_path + filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
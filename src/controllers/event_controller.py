@@ -0,0 +1,310 @@
+import os
+
+from .base_controller import BaseController
+from .tournament_controller import TournamentController
+from src.entities.event import Event
+from src.entities.swiss_tournament import SwissTournament
+from src.dtos.event_dto import EventDTO
+from src.dtos.tournament_dto import TournamentDTO
+
+
+def _pair_section(tournament_data: dict) -> tuple:
+    """
+    Generate and add the next round of one section, in a worker process.
+
+    Top-level so that it can be sent to a process pool; it receives and
+    returns plain dicts, which are cheap to pickle.
+
+    Args:
+        tournament_data (dict): The section, as stored in tournaments.json.
+
+    Returns:
+        tuple: (round_number, pairings, updated tournament dict). Pairings are
+            tuples (white_name, black_name); black_name is None for a bye.
+
+    Raises:
+        ValueError: If the section cannot be paired.
+    """
+    tournament = TournamentDTO.from_dict(tournament_data)
+    if not isinstance(tournament, SwissTournament):
+        raise ValueError("Only Swiss sections can be paired by the event.")
+    if len(tournament.players) < 2:
+        raise ValueError("At least 2 players are required to generate pairings.")
+
+    rounds = tournament.rounds
+    if rounds and any(game.result is None for game in rounds[-1].matches):
+        raise ValueError(f"Round {rounds[-1].round_} still has games without a result.")
+
+    round_number = tournament.get_current_round_number()
+    if round_number > tournament.num_rounds:
+        raise ValueError(f"Tournament has only {tournament.num_rounds} rounds. All rounds completed.")
+
+    pairings = tournament.generate_swiss_pairings(round_number)
+    tournament.add_round(TournamentController._build_round(round_number, pairings))
+    names = [(white.name, black.name if black is not None else None) for white, black in pairings]
+    return round_number, names, TournamentDTO.to_dict(tournament)
+
+
+class EventController(BaseController):
+    """Controller for managing multi-section events."""
+
+    def __init__(self):
+        super().__init__()
+        self.filename = 'events.json'
+        self.tournaments_filename = 'tournaments.json'
+
+    def create_event(self, event: Event) -> None:
+        """
+        Create a new event.
+
+        Args:
+            event (Event): The event object to create.
+
+        Raises:
+            ValueError: If an event with the same name exists, a section is not found or data format is invalid.
+        """
+        events = self._load_data()
+        if not isinstance(events, list):
+            raise ValueError("Invalid data format.")
+
+        if event.name in [e.get('name') for e in events]:
+            raise ValueError("Event with this name already exists.")
+
+        self._check_sections(event.sections)
+        events.append(EventDTO.to_dict(event))
+        self._save_data(events)
+
+    def get_all_events(self) -> list:
+        """
+        Retrieve all events.
+
+        Returns:
+            list: A list of Event objects.
+
+        Raises:
+            ValueError: If data format is invalid.
+        """
+        events = self._load_data()
+        if not isinstance(events, list):
+            raise ValueError("Invalid data format.")
+        return [EventDTO.from_dict(event) for event in events]
+
+    def get_event_by_name(self, name: str) -> Event | None:
+        """
+        Retrieve an event by its name.
+
+        Args:
+            name (str): The name of the event.
+
+        Returns:
+            Event | None: The event object if found, None otherwise.
+        """
+        events = self._load_data()
+        if not isinstance(events, list):
+            raise ValueError("Invalid data format.")
+
+        for event_data in events:
+            if event_data.get('name') == name:
+                return EventDTO.from_dict(event_data)
+        return None
+
+    def update_event(self, old_name: str, event: Event) -> None:
+        """
+        Update an existing event.
+
+        Args:
+            old_name (str): The current name of the event.
+            event (Event): The updated event object.
+
+        Raises:
+            ValueError: If event or a section is not found, or data format is invalid.
+        """
+        events = self._load_data()
+        if not isinstance(events, list):
+            raise ValueError("Invalid data format.")
+
+        for i, event_data in enumerate(events):
+            if event_data.get('name') == old_name:
+                self._check_sections(event.sections)
+                events[i] = EventDTO.to_dict(event)
+                self._save_data(events)
+                return
+        raise ValueError(f"Event '{old_name}' not found.")
+
+    def delete_event(self, name: str) -> None:
+        """
+        Delete an event. Its section tournaments are kept.
+
+        Args:
+            name (str): The name of the event.
+
+        Raises:
+            ValueError: If event is not found or data format is invalid.
+        """
+        events = self._load_data()
+        if not isinstance(events, list):
+            raise ValueError("Invalid data format.")
+
+        remaining = [e for e in events if e.get('name') != name]
+        if len(remaining) == len(events):
+            raise ValueError(f"Event '{name}' not found.")
+        self._save_data(remaining)
+
+    def add_section(self, event_name: str, tournament_name: str) -> None:
+        """
+        Add an existing Swiss tournament to an event as a section.
+
+        Args:
+            event_name (str): The name of the event.
+            tournament_name (str): The name of the section tournament.
+
+        Raises:
+            ValueError: If event or tournament is not found, or the tournament is not Swiss.
+        """
+        event = self.get_event_by_name(event_name)
+        if event is None:
+            raise ValueError(f"Event '{event_name}' not found.")
+        event.add_section(tournament_name)
+        self.update_event(event_name, event)
+
+    def remove_section(self, event_name: str, tournament_name: str) -> None:
+        """
+        Remove a section from an event. The tournament itself is kept.
+
+        Args:
+            event_name (str): The name of the event.
+            tournament_name (str): The name of the section tournament.
+
+        Raises:
+            ValueError: If event or section is not found.
+        """
+        event = self.get_event_by_name(event_name)
+        if event is None:
+            raise ValueError(f"Event '{event_name}' not found.")
+        event.remove_section(tournament_name)
+        self.update_event(event_name, event)
+
+    def pair_event(self, event_name: str, max_workers: int | None = None) -> dict:
+        """
+        Generate the next round of every section concurrently and save them all in a single write.
+
+        Sections are paired in a process pool, so the round turnaround is
+        bounded by the slowest section rather than by the sum of all of them.
+        A section that cannot be paired (missing results, all rounds played)
+        is reported and left unchanged; the others are still saved.
+
+        Args:
+            event_name (str): The name of the event.
+            max_workers (int | None): Worker processes (one per CPU if None; 1 pairs in this process).
+
+        Returns:
+            dict: Section name -> {'round_number', 'pairings', 'error'}. Pairings are
+                tuples (white_name, black_name), black_name None for a bye; 'error'
+                is None when the section was paired.
+
+        Raises:
+            ValueError: If event or a section is not found, or data format is invalid.
+        """
+        event = self.get_event_by_name(event_name)
+        if event is None:
+            raise ValueError(f"Event '{event_name}' not found.")
+
+        tournaments = self._load_data(self.tournaments_filename)
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        position = {t.get('name'): i for i, t in enumerate(tournaments)}
+        missing = [name for name in event.sections if name not in position]
+        if missing:
+            raise ValueError(f"Section '{missing[0]}' not found.")
+
+        sections = [(name, tournaments[position[name]]) for name in event.sections]
+        workers = min(len(sections), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            outcomes = [self._run_section(data) for _, data in sections]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_pair_section, data) for _, data in sections]
+                outcomes = [self._wait_section(future) for future in futures]
+
+        report = {}
+        changed = False
+        for (name, _), (outcome, error) in zip(sections, outcomes):
+            if error is not None:
+                report[name] = {'round_number': None, 'pairings': [], 'error': error}
+                continue
+            round_number, pairings, tournament_data = outcome
+            tournaments[position[name]] = tournament_data
+            changed = True
+            report[name] = {'round_number': round_number, 'pairings': pairings, 'error': None}
+
+        if changed:
+            self._save_data(tournaments, self.tournaments_filename)
+        return report
+
+    def get_event_standings(self, event_name: str, limit: int | None = None) -> dict:
+        """
+        Get the standings of every section of an event, decoding tournaments.json once.
+
+        Args:
+            event_name (str): The name of the event.
+            limit (int | None): Maximum number of entries per section (all if None).
+
+        Returns:
+            dict: Section name -> score entries ({'player', 'score', 'matches_played'}), leader first.
+
+        Raises:
+            ValueError: If event or a section is not found.
+        """
+        event = self.get_event_by_name(event_name)
+        if event is None:
+            raise ValueError(f"Event '{event_name}' not found.")
+
+        tournaments = self._load_data(self.tournaments_filename)
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        by_name = {t.get('name'): t for t in tournaments}
+        standings = {}
+        for name in event.sections:
+            if name not in by_name:
+                raise ValueError(f"Section '{name}' not found.")
+            standings[name] = TournamentDTO.from_dict(by_name[name]).get_standings(limit=limit)
+        return standings
+
+    def _check_sections(self, sections: list) -> None:
+        """
+        Check that every section exists and is a Swiss tournament.
+
+        Raises:
+            ValueError: If a section is not found or is not Swiss.
+        """
+        if not sections:
+            return
+        tournaments = self._load_data(self.tournaments_filename)
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        types = {t.get('name'): t.get('type') for t in tournaments}
+        for name in sections:
+            if name not in types:
+                raise ValueError(f"Tournament '{name}' not found.")
+            if types[name] != 'swiss':
+                raise ValueError(f"Section '{name}' must be a Swiss tournament.")
+
+    @staticmethod
+    def _run_section(data: dict) -> tuple:
+        """Pair one section in this process, returning (outcome, error message)."""
+        try:
+            return _pair_section(data), None
+        except ValueError as e:
+            return None, str(e)
+
+    @staticmethod
+    def _wait_section(future) -> tuple:
+        """Wait for one section paired in the pool, returning (outcome, error message)."""
+        try:
+            return future.result(), None
+        except ValueError as e:
+            return None, str(e)
@@ -1,6 +1,8 @@
 from .base_controller import BaseController
 from src.entities.player import Player
 from src.dtos.player_dto import PlayerDTO
+from src.utils.name_index import NameIndex
+from src.utils.player_index import PlayerAttributeIndex
 
 class PlayerController(BaseController):
     """Controller for managing player-related operations."""
@@ -8,6 +10,11 @@ class PlayerController(BaseController):
     def __init__(self):
         super().__init__()
         self.filename = 'players.json'
+        self.index_filename = 'players.idx'
+        self._records = None
+        self._records_signature = None
+        self._name_index = None
+        self._attribute_index = None
 
     def register_player(self, player: Player):
         """
@@ -23,9 +30,20 @@ class PlayerController(BaseController):
         if player_data.get('name') in [player.get('name') for player in players]:
             raise ValueError("Player with this name already exists.")
 
+        index = self._get_name_index(players)
+        attribute_index = self._get_attribute_index(players)
         players.append(player_data)
         self._save_data(players)
 
+        # Keep the caches in step with the file instead of rebuilding them
+        self._records = players
+        self._records_signature = self._file_signature()
+        attribute_index.add(player_data)
+        self._attribute_index = (self._records_signature, attribute_index)
+        index.add(player_data['name'])
+        index.source = self._records_signature
+        index.save(self.data_path + self.index_filename)
+
     def get_all_players(self) -> list:
         """
         Retrieve all registered players.
@@ -36,4 +54,122 @@ class PlayerController(BaseController):
         all_players = self._load_data()
         if not isinstance(all_players, list):
             raise ValueError("Invalid data format.")
-        return [PlayerDTO.from_dict(player) for player in all_players]
\ No newline at end of file
+        return [PlayerDTO.from_dict(player) for player in all_players]
+
+    def get_players_page(self, offset: int = 0, limit: int = 20, name_filter: str | None = None,
+                         exclude: set | None = None) -> tuple:
+        """
+        Get one page of the registered players, in registration order.
+
+        Only the players of the page are converted to Player objects, so list
+        screens cost the same whatever the size of the registry.
+
+        Args:
+            offset (int): Number of players (after filtering) to skip.
+            limit (int): Maximum number of players to return.
+            name_filter (str | None): Keep only players whose name contains this text,
+                ignoring case and accents.
+            exclude (set | None): Names of players to leave out (e.g. those already in a tournament).
+
+        Returns:
+            tuple: (list of Player objects, total number of players matching the filter).
+
+        Raises:
+            ValueError: If offset is negative or limit is not positive.
+        """
+        if offset < 0 or limit < 1:
+            raise ValueError("Offset must be non-negative and limit positive.")
+        records = self._get_records()
+        if not name_filter and not exclude:
+            return [PlayerDTO.from_dict(record) for record in records[offset:offset + limit]], len(records)
+
+        if name_filter:
+            player_ids = self._get_name_index(records).containing(name_filter)
+        else:
+            player_ids = range(len(records))
+        if exclude:
+            player_ids = [player_id for player_id in player_ids if records[player_id].get('name') not in exclude]
+        page = player_ids[offset:offset + limit]
+        return [PlayerDTO.from_dict(records[player_id]) for player_id in page], len(player_ids)
+
+    def search_players(self, query: str, limit: int = 10) -> list:
+        """
+        Search players by name, ignoring case and accents and tolerating typos.
+
+        Args:
+            query (str): Full name, prefix of any word of the name, or an approximate spelling.
+            limit (int): Maximum number of players to return.
+
+        Returns:
+            list: Matching Player objects, best matches first.
+        """
+        records = self._get_records()
+        index = self._get_name_index(records)
+        return [PlayerDTO.from_dict(records[player_id]) for player_id, _ in index.search(query, limit)]
+
+    def query_players(self, rating_type: str | None = None, min_rating: int | None = None,
+                      max_rating: int | None = None, min_birth_year: int | None = None,
+                      max_birth_year: int | None = None, gender: str | None = None,
+                      limit: int | None = None) -> list:
+        """
+        Find players by rating range, birth year range and gender.
+
+        Backs the player query screen. With a rating type, players come ordered by that rating, highest first,
+        so limit gives the top-K of the selection.
+
+        Args:
+            rating_type (str | None): 'classic', 'rapid' or 'blitz'.
+            min_rating (int | None): Minimum rating, inclusive.
+            max_rating (int | None): Maximum rating, inclusive.
+            min_birth_year (int | None): Earliest birth year, inclusive.
+            max_birth_year (int | None): Latest birth year, inclusive.
+            gender (str | None): Gender to match.
+            limit (int | None): Maximum number of players to return.
+
+        Returns:
+            list: Matching Player objects.
+
+        Raises:
+            ValueError: If the criteria are invalid.
+        """
+        records = self._get_records()
+        index = self._get_attribute_index(records)
+        player_ids = index.query(rating_type, min_rating, max_rating,
+                                 min_birth_year, max_birth_year, gender, limit)
+        return [PlayerDTO.from_dict(records[player_id]) for player_id in player_ids]
+
+    def _get_records(self) -> list:
+        """Get the raw player records, decoding players.json only when it changed on disk."""
+        signature = self._file_signature()
+        if self._records is None or signature != self._records_signature:
+            records = self._load_data()
+            if not isinstance(records, list):
+                raise ValueError("Invalid data format.")
+            self._records = records
+            self._records_signature = signature
+        return self._records
+
+    def _get_name_index(self, records: list) -> NameIndex:
+        """
+        Get the name index matching the current players.json.
+
+        The index is read from its on-disk file when that file mirrors the
+        current registry, and rebuilt (and rewritten) otherwise.
+        """
+        signature = self._file_signature()
+        index = self._name_index
+        if index is None or index.source != signature:
+            index = NameIndex.load(self.data_path + self.index_filename)
+            if index is None or index.source != signature or len(index) != len(records):
+                index = NameIndex.build(record.get('name', '') for record in records)
+                index.source = signature
+                index.save(self.data_path + self.index_filename)
+            self._name_index = index
+        return index
+
+    def _get_attribute_index(self, records: list) -> PlayerAttributeIndex:
+        """Get the attribute index matching the current players.json, rebuilding it when the file changed."""
+        signature = self._file_signature()
+        if self._attribute_index is None or self._attribute_index[0] != signature:
+            self._attribute_index = (signature, PlayerAttributeIndex.build(records))
+        return self._attribute_index[1]
@@ -0,0 +1,184 @@
+from .base_controller import BaseController
+from src.dtos.tournament_dto import TournamentDTO
+from src.utils.player_index import birth_year
+from src.utils.rating_math import RESULT_SCORES, expected_scores, k_factor
+
+
+class RatingController(BaseController):
+    """Controller for updating registry ratings from finished tournaments."""
+
+    def __init__(self):
+        super().__init__()
+        self.filename = 'players.json'
+        self.tournaments_filename = 'tournaments.json'
+        self.rated_filename = 'rated_tournaments.json'
+
+    def get_rated_tournaments(self) -> set:
+        """
+        Get the names of the tournaments whose games were already applied to the registry ratings.
+
+        Returns:
+            set: Names of the rated tournaments.
+        """
+        rated = self._load_data(self.rated_filename)
+        if not isinstance(rated, list):
+            raise ValueError("Invalid data format.")
+        return set(rated)
+
+    def update_ratings(self, tournament_names: list, dry_run: bool = False) -> list:
+        """
+        Rate the games of one or more tournaments and update the registry ratings.
+
+        All tournaments are treated as one rating period: every game is rated
+        with the ratings from before the period and all changes are written
+        back to players.json in a single save.
+
+        Args:
+            tournament_names (list): Names of the tournaments to rate.
+            dry_run (bool): If True, compute the report without saving anything.
+
+        Returns:
+            list: One report dict per player and time control, with keys 'name',
+                'time_control', 'old_rating', 'new_rating', 'change', 'k_factor',
+                'games', 'score' and 'expected'.
+
+        Raises:
+            ValueError: If a tournament is not found, is not finished or was already
+                rated, or data format is invalid.
+        """
+        tournaments = self._load_data(self.tournaments_filename)
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        by_name = {t.get('name'): t for t in tournaments}
+        missing = [name for name in tournament_names if name not in by_name]
+        if missing:
+            raise ValueError(f"Tournament '{missing[0]}' not found.")
+        rated = self.get_rated_tournaments()
+        repeated = [name for name in tournament_names if name in rated]
+        if repeated:
+            raise ValueError(f"Tournament '{repeated[0]}' has already been rated.")
+
+        selected = [by_name[name] for name in dict.fromkeys(tournament_names)]
+        self._check_finished(selected)
+        return self._rate(selected, rated, dry_run)
+
+    def update_ratings_for_period(self, start_date: str, end_date: str, dry_run: bool = False) -> list:
+        """
+        Rate every tournament that ended within a period (e.g. a calendar month).
+
+        Args:
+            start_date (str): First day of the period, 'YYYY-MM-DD'.
+            end_date (str): Last day of the period, 'YYYY-MM-DD'.
+            dry_run (bool): If True, compute the report without saving anything.
+
+        Tournaments of the period that were already rated are skipped, so
+        running the same period again changes nothing.
+
+        Returns:
+            list: The rating report, as in update_ratings.
+
+        Raises:
+            ValueError: If a tournament of the period is not finished, or data format is invalid.
+        """
+        tournaments = self._load_data(self.tournaments_filename)
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        rated = self.get_rated_tournaments()
+        # ISO dates compare correctly as strings
+        selected = [t for t in tournaments
+                    if start_date <= t.get('end_date', '') <= end_date and t.get('name') not in rated]
+        self._check_finished(selected)
+        return self._rate(selected, rated, dry_run)
+
+    @staticmethod
+    def _check_finished(tournaments: list) -> None:
+        """Raise ValueError for the first raw tournament dict that still has rounds or games to play."""
+        for tournament_data in tournaments:
+            if not TournamentDTO.from_dict(tournament_data).is_finished():
+                raise ValueError(f"Tournament '{tournament_data.get('name')}' is not finished.")
+
+    def _rate(self, tournaments: list, rated: set, dry_run: bool) -> list:
+        """Rate the games of raw tournament dicts as one rating period, then mark them as rated."""
+        players = self._load_data()
+        if not isinstance(players, list):
+            raise ValueError("Invalid data format.")
+
+        position = {p.get('name'): i for i, p in enumerate(players)}
+        reference_year = max((birth_year(t.get('end_date', '')) for t in tournaments), default=0)
+
+        # Column arrays per time control: registry position, rating difference, score
+        games = {}
+        for tournament in tournaments:
+            time_control = tournament.get('time_control', 'classic')
+            columns = games.setdefault(time_control, ([], [], []))
+            for round_data in tournament.get('rounds_data', []):
+                for match in round_data.get('matches', []):
+                    self._collect_game(match, time_control, players, position, columns)
+
+        report = []
+        for time_control, (indices, differences, scores) in games.items():
+            expected = expected_scores(differences)
+
+            totals = {}  # registry position -> [games, score, expected]
+            for i, score, exp in zip(indices, scores, expected):
+                total = totals.get(i)
+                if total is None:
+                    total = totals[i] = [0, 0.0, 0.0]
+                total[0] += 1
+                total[1] += score
+                total[2] += exp
+
+            # Compute every change before applying any, so all games use pre-period ratings
+            changes = []
+            for i, (count, score, exp) in totals.items():
+                player = players[i]
+                old_rating = player['rating'].get(time_control, 0)
+                year = birth_year(player.get('birthdate', ''))
+                age = reference_year - year if reference_year and year else None
+                k = k_factor(old_rating, age, time_control)
+                new_rating = max(0, round(old_rating + k * (score - exp)))
+                changes.append((i, new_rating))
+                report.append({
+                    'name': player['name'],
+                    'time_control': time_control,
+                    'old_rating': old_rating,
+                    'new_rating': new_rating,
+                    'change': new_rating - old_rating,
+                    'k_factor': k,
+                    'games': count,
+                    'score': score,
+                    'expected': round(exp, 2),
+                })
+            for i, new_rating in changes:
+                players[i]['rating'][time_control] = new_rating
+
+        if not dry_run and tournaments:
+            if report:
+                self._save_data(players)
+            self._save_data(sorted(rated | {t.get('name') for t in tournaments}), self.rated_filename)
+
+        report.sort(key=lambda entry: (entry['time_control'], -entry['change'], entry['name']))
+        return report
+
+    @staticmethod
+    def _collect_game(match: dict, time_control: str, players: list, position: dict, columns: tuple) -> None:
+        """Append both sides of a rated game to the column arrays."""
+        white, black = match.get('white'), match.get('black')
+        scores = RESULT_SCORES.get(match.get('result'))
+        # Byes are stored without black or with the player facing themselves
+        if not black or scores is None or black.get('name') == white.get('name'):
+            return
+
+        indices, differences, game_scores = columns
+        sides = ((white, black, scores[0]), (black, white, scores[1]))
+        for player, opponent, score in sides:
+            i = position.get(player.get('name'))
+            if i is None:
+                continue  # Not in the registry: nothing to update
+            j = position.get(opponent.get('name'))
+            opponent_rating = (players[j]['rating'] if j is not None else opponent.get('rating', {})).get(time_control, 0)
+            indices.append(i)
+            differences.append(players[i]['rating'].get(time_control, 0) - opponent_rating)
+            game_scores.append(score)
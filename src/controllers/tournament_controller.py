@@ -2,15 +2,30 @@ from .base_controller import BaseController
 from src.entities.tournament import Tournament
 from src.entities.swiss_tournament import SwissTournament
 from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.round_robin_tournament import RoundRobinTournament
+from src.entities.arena_tournament import ArenaTournament
+from src.entities.category import default_categories
+from src.entities.round import Round
+from src.entities.game import Game
 from src.dtos.tournament_dto import TournamentDTO
+from src.utils.name_index import normalize_name
+from src.utils.player_index import birth_year
+from src.utils.rating_math import RESULT_SCORES, expected_scores, k_factor, performance_dps
+from src.utils.metrics import METRICS, timed_methods
+from src.utils.pubsub import BROKER
 
 
+@timed_methods
 class TournamentController(BaseController):
     """Controller for managing tournament-related operations."""
 
     def __init__(self):
         super().__init__()
         self.filename = 'tournaments.json'
+        self._read_cache = {}  # name -> (file signature, Tournament), for read-only displays
+        self._records = None  # raw tournaments.json records for paged listings
+        self._records_signature = None
+        self._arenas = {}  # name -> (file signature, ArenaTournament), kept between arena calls
 
     def create_tournament(self, tournament: Tournament) -> None:
         """
@@ -35,6 +50,36 @@ class TournamentController(BaseController):
         tournaments.append(tournament_data)
         self._save_data(tournaments)
 
+    def create_tournaments(self, new_tournaments: list) -> int:
+        """
+        Create several tournaments with a single save (e.g. for bulk imports).
+
+        Either every tournament is created or none is.
+
+        Args:
+            new_tournaments (list): The Tournament objects to create.
+
+        Returns:
+            int: The number of tournaments created.
+
+        Raises:
+            ValueError: If a name already exists or repeats among the new tournaments, or data format is invalid.
+        """
+        tournaments = self._load_data()
+
+        if not isinstance(tournaments, list):
+            raise ValueError("Invalid data format.")
+
+        names = {t.get('name') for t in tournaments}
+        for tournament in new_tournaments:
+            if tournament.name in names:
+                raise ValueError(f"Tournament '{tournament.name}' already exists.")
+            names.add(tournament.name)
+
+        tournaments.extend(TournamentDTO.to_dict(tournament) for tournament in new_tournaments)
+        self._save_data(tournaments)
+        return len(new_tournaments)
+
     def get_all_tournaments(self) -> list:
         """
         Retrieve all registered tournaments.
@@ -50,7 +95,95 @@ class TournamentController(BaseController):
         if not isinstance(all_tournaments, list):
             raise ValueError("Invalid data format.")
         
-        return [TournamentDTO.from_dict(tournament) for tournament in all_tournaments]
+        return [self._hydrate(tournament) for tournament in all_tournaments]
+
+    def get_tournaments_page(self, offset: int = 0, limit: int = 20, name_filter: str | None = None) -> tuple:
+        """
+        Get one page of the registered tournaments, in creation order.
+
+        Only the tournaments of the page are converted to Tournament objects.
+
+        Args:
+            offset (int): Number of tournaments (after filtering) to skip.
+            limit (int): Maximum number of tournaments to return.
+            name_filter (str | None): Keep only tournaments whose name contains this text,
+                ignoring case and accents.
+
+        Returns:
+            tuple: (list of Tournament objects, total number of tournaments matching the filter).
+
+        Raises:
+            ValueError: If offset is negative, limit is not positive or data format is invalid.
+        """
+        if offset < 0 or limit < 1:
+            raise ValueError("Offset must be non-negative and limit positive.")
+        records = self._get_records()
+        if name_filter:
+            needle = normalize_name(name_filter)
+            records = [record for record in records if needle in normalize_name(record.get('name', ''))]
+        return [self._hydrate(record) for record in records[offset:offset + limit]], len(records)
+
+    def get_tournament_players_page(self, tournament_name: str, offset: int = 0, limit: int = 20,
+                                    name_filter: str | None = None, with_statistics: bool = False) -> tuple:
+        """
+        Get one page of the players registered in a tournament.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            offset (int): Number of players (after filtering) to skip.
+            limit (int): Maximum number of players to return.
+            name_filter (str | None): Keep only players whose name contains this text,
+                ignoring case and accents.
+            with_statistics (bool): Whether to include each player's statistics
+                (see get_player_statistics); they are computed once for all players.
+
+        Returns:
+            tuple: (list of tuples (player, statistics dict or None),
+                total number of players matching the filter).
+
+        Raises:
+            ValueError: If the tournament is not found, offset is negative or limit is not positive.
+        """
+        if offset < 0 or limit < 1:
+            raise ValueError("Offset must be non-negative and limit positive.")
+        tournament = self._get_cached_tournament(tournament_name)
+        players = tournament.players
+        if name_filter:
+            needle = normalize_name(name_filter)
+            players = [player for player in players if needle in normalize_name(player.name)]
+        page = players[offset:offset + limit]
+        if not with_statistics:
+            return [(player, None) for player in page], len(players)
+        statistics = self._compute_statistics(tournament)
+        return [(player, statistics[player.name]) for player in page], len(players)
+
+    def _get_records(self) -> list:
+        """
+        Get the raw tournament records, decoding tournaments.json only when it changed.
+
+        The records are read-only for everything but _save_arena, which saves them.
+        """
+        signature = self._file_signature()
+        if self._records is None or signature != self._records_signature:
+            records = self._load_data()
+            if not isinstance(records, list):
+                raise ValueError("Invalid data format.")
+            self._records = records
+            self._records_signature = signature
+        return self._records
+
+    @staticmethod
+    def _hydrate(tournament_data: dict) -> Tournament:
+        """Create a Tournament from its stored dict, counting the entities built while metrics are enabled."""
+        if METRICS.enabled:
+            rounds = tournament_data.get('rounds_data', [])
+            games = sum(len(r.get('matches', [])) for r in rounds)
+            METRICS.count('hydrated.tournaments')
+            METRICS.count('hydrated.rounds', len(rounds))
+            METRICS.count('hydrated.games', games)
+            # Every game carries its own copies of both players
+            METRICS.count('hydrated.players', len(tournament_data.get('players', [])) + 2 * games)
+        return TournamentDTO.from_dict(tournament_data)
 
     def get_tournament_by_name(self, name: str) -> Tournament | None:
         """
@@ -69,7 +202,7 @@ class TournamentController(BaseController):
         
         for tournament_data in tournaments:
             if tournament_data.get('name') == name:
-                return TournamentDTO.from_dict(tournament_data)
+                return self._hydrate(tournament_data)
         
         return None
 
@@ -131,7 +264,7 @@ class TournamentController(BaseController):
         Retrieve tournaments by type.
 
         Args:
-            tournament_type (str): The type of tournament ('swiss', 'eliminatory', or 'basic').
+            tournament_type (str): The type of tournament ('swiss', 'eliminatory', 'round_robin', 'arena', or 'basic').
 
         Returns:
             list: A list of Tournament objects of the specified type.
@@ -142,7 +275,7 @@ class TournamentController(BaseController):
             raise ValueError("Invalid data format.")
         
         filtered_tournaments = [
-            TournamentDTO.from_dict(t) for t in all_tournaments 
+            self._hydrate(t) for t in all_tournaments 
             if t.get('type') == tournament_type
         ]
         
@@ -186,13 +319,14 @@ class TournamentController(BaseController):
         tournament.remove_player(player_name)
         self.update_tournament(tournament_name, tournament)
 
-    def get_tournament_ranking(self, tournament_name: str, rating_type: str = 'classic') -> list:
+    def get_tournament_ranking(self, tournament_name: str, rating_type: str = 'classic', limit: int | None = None) -> list:
         """
         Get the ranking of players in a tournament based on rating.
 
         Args:
             tournament_name (str): The name of the tournament.
             rating_type (str): The type of rating to use ('classic', 'rapid', or 'blitz').
+            limit (int | None): Maximum number of players to return (all if None).
 
         Returns:
             list: List of players sorted by rating (highest to lowest).
@@ -200,19 +334,131 @@ class TournamentController(BaseController):
         Raises:
             ValueError: If tournament is not found.
         """
+        tournament = self._get_cached_tournament(tournament_name)
+        return tournament.get_players_by_rating(rating_type, limit)
+
+    def get_standings(self, tournament_name: str, round_number: int | None = None, limit: int | None = None) -> list:
+        """
+        Get the standings of a tournament after a given round.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            round_number (int | None): Last round to count (all rounds if None).
+            limit (int | None): Maximum number of entries to return (all if None).
+
+        Returns:
+            list: Score entries ({'player', 'score', 'matches_played'}), leader first.
+
+        Raises:
+            ValueError: If tournament is not found.
+        """
+        tournament = self._get_cached_tournament(tournament_name)
+        return tournament.get_standings(round_number, limit)
+
+    def get_category_standings(self, tournament_name: str, categories: list | None = None,
+                               round_number: int | None = None, limit: int | None = None) -> dict:
+        """
+        Get the standings of every prize category in a single pass over the overall standings.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            categories (list | None): Category objects (standard categories if None).
+            round_number (int | None): Last round to count (all rounds if None).
+            limit (int | None): Maximum number of entries per category (all if None).
+
+        Returns:
+            dict: Category name -> list of tuples (overall_position, score_entry), best first.
+                Categories keep the order in which they were given.
+
+        Raises:
+            ValueError: If tournament is not found or limit is not positive.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("Limit must be positive.")
+        tournament = self._get_cached_tournament(tournament_name)
+        categories = categories if categories is not None else default_categories()
+        rating_type = tournament.time_control.value
+        reference_year = birth_year(tournament.start_date) or None
+
+        tables = {category.name: [] for category in categories}
+        open_categories = list(categories)
+        for position, entry in enumerate(tournament.get_standings(round_number), 1):
+            player = entry['player']
+            year = birth_year(player.birthdate)
+            age = reference_year - year if reference_year and year else None
+            gender = player.gender.strip().lower()
+            rating = getattr(player.rating, rating_type)
+
+            full = False
+            for category in open_categories:
+                table = tables[category.name]
+                if category.accepts(age, gender, rating) and (limit is None or len(table) < limit):
+                    table.append((position, entry))
+                    full = full or (limit is not None and len(table) >= limit)
+
+            # Categories that reached the limit take no more entries
+            if full:
+                open_categories = [c for c in open_categories if len(tables[c.name]) < limit]
+                if not open_categories:
+                    break
+        return tables
+
+    def simulate_outcomes(self, tournament_name: str, runs: int = 10000, prize_places: int = 3,
+                          workers: int | None = None, seed: int | None = None) -> list:
+        """
+        Estimate each player's chance to win and to finish in the prizes by simulating the rest of the tournament.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            runs (int): Number of simulated tournaments.
+            prize_places (int): Places that win a prize.
+            workers (int | None): Worker processes (one per CPU if None).
+            seed (int | None): Seed for reproducible results.
+
+        Returns:
+            list: One dict per player with 'player', 'win_probability', 'prize_probability',
+                'expected_place' and 'place_distribution', most likely winner first.
+
+        Raises:
+            ValueError: If tournament is not found or cannot be simulated.
+        """
+        from src.utils.simulation import simulate_tournament
+
+        tournament = self._get_cached_tournament(tournament_name)
+        return simulate_tournament(tournament, runs, prize_places, workers, seed)
+
+    def _get_cached_tournament(self, tournament_name: str) -> Tournament:
+        """
+        Get a tournament for read-only use, decoding tournaments.json only when it changed.
+
+        Repeated ranking displays (e.g. a projector refreshing every few seconds)
+        then reuse the same Tournament object and its cached rating order.
+
+        Raises:
+            ValueError: If tournament is not found.
+        """
+        signature = self._file_signature()
+        cached = self._read_cache.get(tournament_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         tournament = self.get_tournament_by_name(tournament_name)
-        
         if tournament is None:
             raise ValueError(f"Tournament '{tournament_name}' not found.")
-        
-        return tournament.get_players_by_rating(rating_type)
+        self._read_cache = {
+            name: entry for name, entry in self._read_cache.items() if entry[0] == signature
+        }
+        self._read_cache[tournament_name] = (signature, tournament)
+        return tournament
 
-    def generate_round_pairings(self, tournament_name: str) -> tuple:
+    def generate_round_pairings(self, tournament_name: str, time_budget: float | None = None) -> tuple:
         """
         Generate pairings for the next round of a tournament.
 
         Args:
             tournament_name (str): The name of the tournament.
+            time_budget (float | None): Seconds a Swiss pairing search may take (quick pairing if None).
+                The search statistics are then in the returned tournament's last_pairing_stats.
 
         Returns:
             tuple: (round_number, pairings_list, tournament_object)
@@ -234,12 +480,18 @@ class TournamentController(BaseController):
         if isinstance(tournament, SwissTournament):
             if round_number > tournament.num_rounds:
                 raise ValueError(f"Tournament has only {tournament.num_rounds} rounds. All rounds completed.")
-            pairings = tournament.generate_swiss_pairings(round_number)
+            pairings = tournament.generate_swiss_pairings(round_number, time_budget)
         elif isinstance(tournament, EliminatoryTournament):
             bracket_info = tournament.get_bracket_info()
             if round_number > bracket_info['total_rounds']:
                 raise ValueError(f"Tournament bracket complete. All {bracket_info['total_rounds']} rounds finished.")
             pairings = tournament.generate_bracket_pairings(round_number)
+        elif isinstance(tournament, RoundRobinTournament):
+            if round_number > tournament.num_rounds:
+                raise ValueError(f"Tournament has only {tournament.num_rounds} rounds. All rounds completed.")
+            pairings = tournament.generate_round_robin_pairings(round_number)
+        elif isinstance(tournament, ArenaTournament):
+            raise ValueError("Arena tournaments are paired continuously; start the arena instead.")
         else:
             raise ValueError("Pairing generation not supported for basic tournaments.")
         
@@ -257,15 +509,93 @@ class TournamentController(BaseController):
         Raises:
             ValueError: If tournament is not found or save fails.
         """
-        from src.entities.round import Round
-        from src.entities.game import Game
-        
         tournament = self.get_tournament_by_name(tournament_name)
         
         if tournament is None:
             raise ValueError(f"Tournament '{tournament_name}' not found.")
         
-        # Create Round object
+        # The first round of a knockout seeds the bracket that later rounds advance through
+        if isinstance(tournament, EliminatoryTournament) and round_number == 1:
+            tournament.create_bracket()
+
+        # The first round of a round-robin fixes the pairing numbers of the schedule
+        if isinstance(tournament, RoundRobinTournament) and tournament.seed_order is None:
+            tournament.generate_schedule()
+
+        # Add round to tournament
+        tournament.add_round(self._build_round(round_number, pairings))
+        
+        # Save updated tournament
+        self.update_tournament(tournament_name, tournament)
+        if BROKER.active:
+            BROKER.publish(tournament.name, {'type': 'pairings', 'round': round_number, 'tournament': tournament})
+
+    def generate_schedule(self, tournament_name: str) -> list:
+        """
+        Generate the pairings of all the remaining rounds of a round-robin tournament in one call.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            list: List of tuples (round_number, pairings_list) for the rounds not saved yet.
+
+        Raises:
+            ValueError: If tournament is not found, not a round-robin or has too few players.
+        """
+        tournament = self.get_tournament_by_name(tournament_name)
+
+        if tournament is None:
+            raise ValueError(f"Tournament '{tournament_name}' not found.")
+
+        if not isinstance(tournament, RoundRobinTournament):
+            raise ValueError("Full schedules are only available for round-robin tournaments.")
+
+        schedule = tournament.generate_schedule()
+        first_round = tournament.get_current_round_number()
+        return [(number, schedule[number - 1]) for number in range(first_round, len(schedule) + 1)]
+
+    def save_schedule(self, tournament_name: str) -> int:
+        """
+        Save all the remaining rounds of a round-robin tournament in a single write.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            int: Number of rounds saved.
+
+        Raises:
+            ValueError: If tournament is not found or not a round-robin.
+        """
+        tournament = self.get_tournament_by_name(tournament_name)
+
+        if tournament is None:
+            raise ValueError(f"Tournament '{tournament_name}' not found.")
+
+        if not isinstance(tournament, RoundRobinTournament):
+            raise ValueError("Full schedules are only available for round-robin tournaments.")
+
+        schedule = tournament.generate_schedule()
+        first_round = tournament.get_current_round_number()
+        for number in range(first_round, len(schedule) + 1):
+            tournament.add_round(self._build_round(number, schedule[number - 1]))
+
+        self.update_tournament(tournament_name, tournament)
+        return len(schedule) - first_round + 1
+
+    @staticmethod
+    def _build_round(round_number: int, pairings: list) -> Round:
+        """
+        Create a Round from pairings.
+
+        Args:
+            round_number (int): The round number.
+            pairings (list): List of tuples (white_player, black_player); black is None for a bye.
+
+        Returns:
+            Round: The round with one game per pairing.
+        """
         round_obj = Round(round_number)
         
         # Add games to round
@@ -277,12 +607,7 @@ class TournamentController(BaseController):
             else:
                 game = Game(white, black)
             round_obj.add_match(game)
-        
-        # Add round to tournament
-        tournament.add_round(round_obj)
-        
-        # Save updated tournament
-        self.update_tournament(tournament_name, tournament)
+        return round_obj
 
     def get_bracket_info(self, tournament_name: str) -> dict:
         """
@@ -307,6 +632,28 @@ class TournamentController(BaseController):
         
         return tournament.get_bracket_info()
 
+    def get_bracket(self, tournament_name: str) -> list:
+        """
+        Get the full bracket of an eliminatory tournament for display.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            list: One list per round of tuples (player_a, player_b, winner); unknown entries are None.
+                Empty if the first round has not been generated yet.
+
+        Raises:
+            ValueError: If tournament is not found or not eliminatory.
+        """
+        tournament = self._get_cached_tournament(tournament_name)
+
+        if not isinstance(tournament, EliminatoryTournament):
+            raise ValueError("Bracket information is only available for eliminatory tournaments.")
+
+        bracket = tournament.bracket
+        return bracket.get_rounds() if bracket is not None else []
+
     def get_round_matches(self, tournament_name: str, round_number: int) -> list:
         """
         Get all matches from a specific round.
@@ -356,14 +703,183 @@ class TournamentController(BaseController):
         if round_obj is None:
             raise ValueError(f"Round {round_number} not found in tournament.")
         
-        if match_index < 0 or match_index >= len(round_obj.matches):
-            raise ValueError(f"Match index {match_index} out of range.")
-        
-        # Update the result
-        round_obj.matches[match_index].result = result
+        self._apply_result(tournament, round_obj, match_index, result)
         
         # Save updated tournament
         self.update_tournament(tournament_name, tournament)
+        if BROKER.active:
+            BROKER.publish(tournament.name, {
+                'type': 'results', 'round': round_number, 'matches': [match_index], 'tournament': tournament
+            })
+
+    def update_match_results(self, tournament_name: str, round_number: int, results: dict) -> int:
+        """
+        Update the results of many matches of a round with a single load and save.
+
+        Either every result is applied or, if one is invalid, none is saved.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            round_number (int): The round number.
+            results (dict): Match index -> result ('1-0', '0-1', or '0.5-0.5').
+
+        Returns:
+            int: Number of results updated.
+
+        Raises:
+            ValueError: If tournament, round, or a match is not found, or a result is invalid.
+        """
+        tournament = self.get_tournament_by_name(tournament_name)
+
+        if tournament is None:
+            raise ValueError(f"Tournament '{tournament_name}' not found.")
+
+        round_obj = tournament.get_round(round_number)
+
+        if round_obj is None:
+            raise ValueError(f"Round {round_number} not found in tournament.")
+
+        for match_index, result in sorted(results.items()):
+            self._apply_result(tournament, round_obj, match_index, result)
+
+        if results:
+            self.update_tournament(tournament_name, tournament)
+            if BROKER.active:
+                BROKER.publish(tournament.name, {
+                    'type': 'results', 'round': round_number, 'matches': sorted(results), 'tournament': tournament
+                })
+        return len(results)
+
+    @staticmethod
+    def _apply_result(tournament: Tournament, round_obj: Round, match_index: int, result: str) -> None:
+        """
+        Set the result of a match in memory, with the follow-ups of the tournament type.
+
+        Raises:
+            ValueError: If the match is not found, is a bye or the result is invalid.
+        """
+        if match_index < 0 or match_index >= len(round_obj.matches):
+            raise ValueError(f"Match index {match_index} out of range.")
+        match = round_obj.matches[match_index]
+        if match.black is None or match.black.name == match.white.name:
+            raise ValueError(f"Board {match_index + 1} is a bye.")
+
+        # Arena players go back into the pairing queue as soon as their game ends
+        if isinstance(tournament, ArenaTournament):
+            tournament.record_result(match_index, result)
+        # Knockout winners move into the next round of the bracket right away
+        elif isinstance(tournament, EliminatoryTournament):
+            tournament.record_match_result(round_obj.round_, match_index, result)
+        else:
+            match.result = result
+
+    def start_arena(self, tournament_name: str) -> list:
+        """
+        Start an arena tournament and pair its first games.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games.
+
+        Raises:
+            ValueError: If tournament is not found, not an arena, already started or has too few players.
+        """
+        tournament = self._get_arena(tournament_name)
+        pairings = tournament.start()
+        self._save_arena(tournament)
+        return pairings
+
+    def record_arena_result(self, tournament_name: str, match_index: int, result: str) -> list:
+        """
+        Record the result of an arena game and pair the players waiting in the queue.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            match_index (int): The index of the game in the arena round.
+            result (str): The result ('1-0', '0-1', or '0.5-0.5').
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games.
+
+        Raises:
+            ValueError: If tournament or game is not found, or the arena has not started.
+        """
+        tournament = self._get_arena(tournament_name)
+        pairings = tournament.record_result(match_index, result)
+        self._save_arena(tournament)
+        return pairings
+
+    def pair_arena(self, tournament_name: str) -> list:
+        """
+        Pair the players waiting in an arena queue, e.g. once recent opponents may meet again.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games.
+
+        Raises:
+            ValueError: If tournament is not found or not an arena.
+        """
+        tournament = self._get_arena(tournament_name)
+        pairings = tournament.pair_waiting()
+        if pairings:
+            self._save_arena(tournament)
+        return pairings
+
+    def _get_arena(self, tournament_name: str) -> ArenaTournament:
+        """
+        Get an arena tournament for update.
+
+        The arena saved by the previous call is reused, with its live pairing
+        queue, as long as nobody else changed tournaments.json since; only
+        then is the file decoded and the queue rebuilt from the games.
+
+        Raises:
+            ValueError: If tournament is not found or not an arena.
+        """
+        signature = self._file_signature()
+        resident = self._arenas.get(tournament_name)
+        if resident is not None and resident[0] == signature:
+            return resident[1]
+        self._arenas.pop(tournament_name, None)
+
+        tournament_data = next((t for t in self._get_records() if t.get('name') == tournament_name), None)
+        if tournament_data is None:
+            raise ValueError(f"Tournament '{tournament_name}' not found.")
+
+        tournament = self._hydrate(tournament_data)
+        if not isinstance(tournament, ArenaTournament):
+            raise ValueError("This operation is only available for arena tournaments.")
+
+        return tournament
+
+    def _save_arena(self, tournament: ArenaTournament) -> None:
+        """
+        Save an arena changed in memory and keep it resident for the next call.
+
+        The raw records stay cached as well, so the next arena call neither
+        decodes tournaments.json nor rebuilds the pairing queue; the file
+        itself is still rewritten whole.
+        """
+        records = self._get_records()
+        index = next((i for i, t in enumerate(records) if t.get('name') == tournament.name), None)
+        if index is None:
+            raise ValueError(f"Tournament '{tournament.name}' not found.")
+
+        records[index] = TournamentDTO.to_dict(tournament)
+        try:
+            self._save_data(records)
+        except BaseException:
+            # The cached records no longer match the file
+            self._records = None
+            self._arenas.pop(tournament.name, None)
+            raise
+        self._records_signature = self._file_signature()
+        self._arenas[tournament.name] = (self._records_signature, tournament)
 
     def get_player_statistics(self, tournament_name: str, player_name: str) -> dict:
         """
@@ -383,6 +899,7 @@ class TournamentController(BaseController):
                 - opponents_ratings: List of opponent ratings
                 - average_opponent_rating: Average rating of opponents
                 - performance_rating: Calculated performance rating
+                - rating_change: Estimated rating change
                 
         Raises:
             ValueError: If tournament or player not found.
@@ -392,126 +909,10 @@ class TournamentController(BaseController):
         if tournament is None:
             raise ValueError(f"Tournament '{tournament_name}' not found.")
         
-        # Find the player
-        player = None
-        for p in tournament.players:
-            if p.name == player_name:
-                player = p
-                break
-        
-        if player is None:
+        if not any(p.name == player_name for p in tournament.players):
             raise ValueError(f"Player '{player_name}' not found in tournament.")
         
-        # Get rating type based on time control
-        rating_type = tournament.time_control.value
-        player_rating = getattr(player.rating, rating_type)
-        
-        # Initialize statistics
-        stats = {
-            'points': 0.0,
-            'games_played': 0,
-            'wins': 0,
-            'draws': 0,
-            'losses': 0,
-            'opponents_ratings': [],
-            'average_opponent_rating': 0,
-            'performance_rating': 0,
-            'rating_change': 0
-        }
-        
-        # Go through all rounds and matches
-        for round_obj in tournament.rounds:
-            for match in round_obj.matches:
-                # Check if player is in this match
-                is_white = match.white.name == player_name
-                is_black = match.black and match.black.name == player_name
-                
-                if not (is_white or is_black):
-                    continue
-                
-                # If opponent is None (BYE), count as win
-                if match.black is None and is_white:
-                    stats['points'] += 1.0
-                    stats['wins'] += 1
-                    stats['games_played'] += 1
-                    continue
-                
-                # Get opponent and their rating
-                opponent = match.black if is_white else match.white
-                opponent_rating = getattr(opponent.rating, rating_type)
-                stats['opponents_ratings'].append(opponent_rating)
-                
-                # If no result yet, skip
-                if match.result is None:
-                    continue
-                
-                stats['games_played'] += 1
-                
-                # Parse result
-                try:
-                    parts = match.result.split('-')
-                    if len(parts) == 2:
-                        white_score = float(parts[0])
-                        black_score = float(parts[1])
-                        
-                        player_score = white_score if is_white else black_score
-                        stats['points'] += player_score
-
-                        # Calculate rating change
-                        qA = 10 ** (player_rating / 400)
-                        qB = 10 ** (opponent_rating / 400)
-                        eA = qA / (qA + qB)
-                        k = 20  # K-factor, can be adjusted
-                        rating_change = k * (player_score - eA)
-                        stats['rating_change'] += rating_change
-                        
-                        # Determine win/draw/loss (for single games)
-                        if white_score == 1.0 and black_score == 0.0:
-                            if is_white:
-                                stats['wins'] += 1
-                            else:
-                                stats['losses'] += 1
-                        elif white_score == 0.0 and black_score == 1.0:
-                            if is_black:
-                                stats['wins'] += 1
-                            else:
-                                stats['losses'] += 1
-                        elif white_score == 0.5 and black_score == 0.5:
-                            stats['draws'] += 1
-                except (ValueError, AttributeError):
-                    pass
-        
-        # Calculate average opponent rating
-        if stats['opponents_ratings']:
-            stats['average_opponent_rating'] = sum(stats['opponents_ratings']) / len(stats['opponents_ratings'])
-        
-        # Calculate performance rating
-        if stats['games_played'] > 0:
-            percentage = stats['points'] / stats['games_played']
-            
-            # Using simplified performance rating calculation
-            # Performance = Average Opponent Rating + 400 * (W - L) / N
-            # Or using percentage: Performance = Avg Opp Rating + dp
-            # Where dp comes from percentage score table
-            
-            if percentage == 1.0:
-                # 100% score
-                stats['performance_rating'] = int(stats['average_opponent_rating'] + 400)
-            elif percentage == 0.0:
-                # 0% score
-                stats['performance_rating'] = int(stats['average_opponent_rating'] - 400)
-            else:
-                # Use simplified formula: dp ≈ -400 * log10((1-p)/p)
-                import math
-                try:
-                    dp = -400 * math.log10((1 - percentage) / percentage)
-                    stats['performance_rating'] = int(stats['average_opponent_rating'] + dp)
-                except (ValueError, ZeroDivisionError):
-                    stats['performance_rating'] = int(stats['average_opponent_rating'])
-
-
-        
-        return stats
+        return self._compute_statistics(tournament)[player_name]
 
     def get_all_players_statistics(self, tournament_name: str) -> list:
         """
@@ -528,12 +929,97 @@ class TournamentController(BaseController):
         if tournament is None:
             raise ValueError(f"Tournament '{tournament_name}' not found.")
         
-        results = []
+        statistics = self._compute_statistics(tournament)
+        return [(player, statistics[player.name]) for player in tournament.players]
+
+    def _compute_statistics(self, tournament: Tournament) -> dict:
+        """
+        Compute the statistics of every player of a tournament in one pass over its games.
+
+        Rated games are collected into columns first so that expected scores and
+        performance differences come from the batch table lookups of rating_math.
+
+        Returns:
+            dict: Player name -> statistics dict (see get_player_statistics).
+        """
+        rating_type = tournament.time_control.value
+        reference_year = birth_year(tournament.start_date)
+
+        stats_by_name = {}
+        k_by_name = {}
         for player in tournament.players:
-            stats = self.get_player_statistics(tournament_name, player.name)
-            results.append((player, stats))
-        
-        return results
+            stats_by_name[player.name] = {
+                'points': 0.0,
+                'games_played': 0,
+                'wins': 0,
+                'draws': 0,
+                'losses': 0,
+                'opponents_ratings': [],
+                'average_opponent_rating': 0,
+                'performance_rating': 0,
+                'rating_change': 0
+            }
+            player_year = birth_year(player.birthdate)
+            age = reference_year - player_year if reference_year and player_year else None
+            k_by_name[player.name] = k_factor(getattr(player.rating, rating_type), age, rating_type)
+
+        # Columns of rated games, one entry per player side
+        names, differences, scores = [], [], []
+        for round_obj in tournament.rounds:
+            for match in round_obj.matches:
+                white, black = match.white, match.black
+
+                # BYE (stored without black or as a player facing themselves): count as win
+                if black is None or black.name == white.name:
+                    stats = stats_by_name.get(white.name)
+                    if stats is not None:
+                        stats['points'] += 1.0
+                        stats['wins'] += 1
+                        stats['games_played'] += 1
+                    continue
+
+                game_scores = RESULT_SCORES.get(match.result)
+                for player, opponent, side in ((white, black, 0), (black, white, 1)):
+                    stats = stats_by_name.get(player.name)
+                    if stats is None:
+                        continue
+                    opponent_rating = getattr(opponent.rating, rating_type)
+                    stats['opponents_ratings'].append(opponent_rating)
+
+                    # If no result yet, skip
+                    if game_scores is None:
+                        continue
+
+                    player_score = game_scores[side]
+                    stats['games_played'] += 1
+                    stats['points'] += player_score
+                    if player_score == 1.0:
+                        stats['wins'] += 1
+                    elif player_score == 0.0:
+                        stats['losses'] += 1
+                    else:
+                        stats['draws'] += 1
+
+                    names.append(player.name)
+                    differences.append(getattr(player.rating, rating_type) - opponent_rating)
+                    scores.append(player_score)
+
+        # Estimated rating change
+        for name, score, expected in zip(names, scores, expected_scores(differences)):
+            stats_by_name[name]['rating_change'] += k_by_name[name] * (score - expected)
+
+        # Average opponent rating and performance rating (FIDE dp table)
+        played = []
+        for stats in stats_by_name.values():
+            if stats['opponents_ratings']:
+                stats['average_opponent_rating'] = sum(stats['opponents_ratings']) / len(stats['opponents_ratings'])
+            if stats['games_played'] > 0:
+                played.append(stats)
+        dps = performance_dps([stats['points'] / stats['games_played'] for stats in played])
+        for stats, dp in zip(played, dps):
+            stats['performance_rating'] = int(stats['average_opponent_rating'] + dp)
+
+        return stats_by_name
 
 
 
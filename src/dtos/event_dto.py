@@ -0,0 +1,45 @@
+from src.entities.event import Event
+
+
+class EventDTO:
+    """Data Transfer Object for Event entities."""
+
+    @staticmethod
+    def to_dict(event: Event) -> dict:
+        """
+        Convert an Event object to a dictionary.
+
+        Args:
+            event (Event): The event object to convert.
+
+        Returns:
+            dict: Dictionary representation of the event.
+        """
+        return {
+            "name": event.name,
+            "location": event.location,
+            "start_date": event.start_date,
+            "end_date": event.end_date,
+            "sections": event.sections
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> Event:
+        """
+        Create an Event object from a dictionary.
+
+        Args:
+            data (dict): Dictionary containing event data.
+
+        Returns:
+            Event: The created event object.
+        """
+        event = Event(
+            data.get("name", ""),
+            data.get("location", ""),
+            data.get("start_date", ""),
+            data.get("end_date", "")
+        )
+        for section in data.get("sections", []):
+            event.add_section(section)
+        return event
@@ -1,6 +1,9 @@
 from src.entities.tournament import Tournament
 from src.entities.swiss_tournament import SwissTournament
 from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.round_robin_tournament import RoundRobinTournament
+from src.entities.arena_tournament import ArenaTournament
+from src.entities.bracket import Bracket
 from src.entities.time_control import TimeControl
 from src.entities.round import Round
 from src.entities.game import Game
@@ -107,11 +110,103 @@ class TournamentDTO:
             data["num_rounds"] = tournament.num_rounds
         elif isinstance(tournament, EliminatoryTournament):
             data["type"] = "eliminatory"
+            bracket = tournament.bracket
+            data["bracket"] = bracket.to_list() if bracket is not None else None
+        elif isinstance(tournament, RoundRobinTournament):
+            data["type"] = "round_robin"
+            data["double_round_robin"] = tournament.double_round_robin
+            data["seed_order"] = tournament.seed_order
+        elif isinstance(tournament, ArenaTournament):
+            data["type"] = "arena"
+            data["duration"] = tournament.duration
+            data["started_at"] = tournament.started_at
+            data["waiting"] = tournament.waiting
         else:
             data["type"] = "basic"
 
         return data
 
+    @staticmethod
+    def validate(data) -> None:
+        """
+        Check that untrusted data (e.g. an imported file) has the shape from_dict expects.
+
+        Args:
+            data: The decoded tournament data.
+
+        Raises:
+            ValueError: Naming the first missing or ill-typed field.
+        """
+        def check(condition: bool, message: str) -> None:
+            if not condition:
+                raise ValueError(message)
+
+        def check_player(player, where: str) -> None:
+            check(isinstance(player, dict), f"{where} must be an object.")
+            check(isinstance(player.get("name"), str) and player["name"].strip() != "", f"{where} needs a name.")
+            for key in ("birthdate", "gender"):
+                check(isinstance(player.get(key, ""), str), f"{where} field '{key}' must be a string.")
+            rating = player.get("rating", {})
+            check(isinstance(rating, dict) and all(
+                isinstance(value, int) and not isinstance(value, bool) for value in rating.values()
+            ), f"{where} rating must map time controls to integers.")
+
+        check(isinstance(data, dict), "Tournament must be an object.")
+        check(isinstance(data.get("name"), str) and data["name"].strip() != "", "Tournament needs a non-empty 'name'.")
+        name = data["name"]
+        for key in ("location", "start_date", "end_date"):
+            check(isinstance(data.get(key, ""), str), f"Tournament '{name}': '{key}' must be a string.")
+        check(data.get("time_control", "classic") in [tc.value for tc in TimeControl],
+              f"Tournament '{name}': invalid 'time_control'.")
+        tournament_type = data.get("type", "basic")
+        check(tournament_type in ("basic", "swiss", "eliminatory", "round_robin", "arena"),
+              f"Tournament '{name}': invalid 'type'.")
+        if tournament_type == "swiss":
+            num_rounds = data.get("num_rounds", 0)
+            check(isinstance(num_rounds, int) and not isinstance(num_rounds, bool) and num_rounds >= 0,
+                  f"Tournament '{name}': 'num_rounds' must be a non-negative integer.")
+        elif tournament_type == "round_robin":
+            check(isinstance(data.get("double_round_robin", False), bool),
+                  f"Tournament '{name}': 'double_round_robin' must be true or false.")
+            seed_order = data.get("seed_order")
+            check(seed_order is None or (isinstance(seed_order, list) and all(isinstance(n, str) for n in seed_order)),
+                  f"Tournament '{name}': 'seed_order' must be a list of names.")
+        elif tournament_type == "arena":
+            duration = data.get("duration", 60)
+            check(isinstance(duration, int) and not isinstance(duration, bool) and duration > 0,
+                  f"Tournament '{name}': 'duration' must be a positive integer number of minutes.")
+            started_at = data.get("started_at")
+            check(started_at is None or (isinstance(started_at, (int, float)) and not isinstance(started_at, bool)),
+                  f"Tournament '{name}': 'started_at' must be a number.")
+            check(isinstance(data.get("waiting") or {}, dict), f"Tournament '{name}': 'waiting' must be an object.")
+        elif tournament_type == "eliminatory":
+            check(isinstance(data.get("bracket") or [], list), f"Tournament '{name}': 'bracket' must be a list.")
+
+        players = data.get("players", [])
+        check(isinstance(players, list), f"Tournament '{name}': 'players' must be a list.")
+        for i, player in enumerate(players, 1):
+            check_player(player, f"Tournament '{name}', player {i}")
+
+        rounds = data.get("rounds_data", [])
+        check(isinstance(rounds, list), f"Tournament '{name}': 'rounds_data' must be a list.")
+        for round_data in rounds:
+            check(isinstance(round_data, dict), f"Tournament '{name}': every round must be an object.")
+            round_number = round_data.get("round_number")
+            check(isinstance(round_number, int) and not isinstance(round_number, bool),
+                  f"Tournament '{name}': every round needs an integer 'round_number'.")
+            subround = round_data.get("subround", 0)
+            check(isinstance(subround, int) and not isinstance(subround, bool),
+                  f"Tournament '{name}', round {round_number}: 'subround' must be an integer.")
+            matches = round_data.get("matches", [])
+            check(isinstance(matches, list), f"Tournament '{name}', round {round_number}: 'matches' must be a list.")
+            for board, match in enumerate(matches, 1):
+                where = f"Tournament '{name}', round {round_number}, board {board}"
+                check(isinstance(match, dict), f"{where} must be an object.")
+                check_player(match.get("white"), f"{where} white")
+                if match.get("black") is not None:
+                    check_player(match["black"], f"{where} black")
+                check(match.get("result") in ("1-0", "0-1", "0.5-0.5", None), f"{where}: invalid result.")
+
     @staticmethod
     def from_dict(data: dict) -> Tournament:
         """
@@ -137,6 +232,13 @@ class TournamentDTO:
             tournament = SwissTournament(name, location, start_date, end_date, time_control, num_rounds)
         elif tournament_type == "eliminatory":
             tournament = EliminatoryTournament(name, location, start_date, end_date, time_control)
+        elif tournament_type == "round_robin":
+            double_round_robin = data.get("double_round_robin", False)
+            tournament = RoundRobinTournament(name, location, start_date, end_date, time_control, double_round_robin)
+            tournament.seed_order = data.get("seed_order")
+        elif tournament_type == "arena":
+            duration = data.get("duration", 60)
+            tournament = ArenaTournament(name, location, start_date, end_date, time_control, duration)
         else:
             tournament = Tournament(name, location, start_date, end_date, time_control)
 
@@ -152,5 +254,14 @@ class TournamentDTO:
             round_obj = TournamentDTO._round_from_dict(round_data)
             tournament.add_round(round_obj)
 
+        if isinstance(tournament, EliminatoryTournament) and data.get("bracket"):
+            players_by_name = {p.name: p for p in tournament.players}
+            tournament.bracket = Bracket.from_list(data["bracket"], players_by_name)
+
+        # Restored after the players, so loading them does not count as late entries
+        if isinstance(tournament, ArenaTournament):
+            tournament.started_at = data.get("started_at")
+            tournament.waiting = data.get("waiting") or {}
+
         return tournament
 
@@ -0,0 +1,263 @@
+from src.entities.tournament import Tournament
+from src.entities.swiss_tournament import SwissTournament
+from src.entities.round_robin_tournament import RoundRobinTournament
+from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.arena_tournament import ArenaTournament
+from src.dtos.tournament_dto import TournamentDTO
+
+# Result codes of a player line, from the point of view of white and of black
+RESULT_CODES = {
+    "1-0": ("1", "0"),
+    "0-1": ("0", "1"),
+    "0.5-0.5": ("=", "="),
+    None: (" ", " "),
+}
+# Result of the game for a code written on white's line
+WHITE_RESULTS = {"1": "1-0", "+": "1-0", "W": "1-0", "0": "0-1", "-": "0-1", "L": "0-1", "=": "0.5-0.5", "D": "0.5-0.5"}
+# Codes of a round without opponent that give the player the point
+FULL_POINT_BYES = {"U", "F", "+"}
+
+TOURNAMENT_TYPES = {
+    SwissTournament: "Swiss System",
+    RoundRobinTournament: "Round Robin",
+    EliminatoryTournament: "Knockout",
+}
+TIME_CONTROL_NAMES = {"classic": "Standard", "rapid": "Rapid", "blitz": "Blitz"}
+
+
+def _trf_date(date: str) -> str:
+    """'YYYY-MM-DD' -> 'YYYY/MM/DD'."""
+    return (date or "").replace("-", "/")
+
+
+def _iso_date(date: str) -> str:
+    """'YYYY/MM/DD' (or 'YYYY.MM.DD') -> 'YYYY-MM-DD'; anything else -> ''."""
+    date = date.strip().replace("/", "-").replace(".", "-")
+    return date if len(date) == 10 and date[4] == "-" and date[7] == "-" else ""
+
+
+def _decode(line: bytes) -> str:
+    """Decode a line of a TRF file, which may be UTF-8 or Latin-1."""
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return line.decode("latin-1")
+
+
+class TrfDTO:
+    """
+    FIDE Tournament Report File (TRF16) conversion of Tournament entities.
+
+    Player lines use the fixed columns of the format: starting rank, sex,
+    name, rating, birth date, points and final rank, then one 10-column block
+    per round with the opponent's starting rank, the colour and the result.
+    """
+
+    @staticmethod
+    def write(tournament: Tournament, file) -> None:
+        """
+        Write a tournament as TRF, line by line.
+
+        Only the per-player index of games is kept in memory; each line is
+        written as soon as it is formatted.
+
+        Args:
+            tournament (Tournament): The tournament to write.
+            file: A text file open for writing.
+
+        Raises:
+            ValueError: For arena tournaments, which have no rounds in the TRF sense.
+        """
+        if isinstance(tournament, ArenaTournament):
+            raise ValueError("TRF export is not available for arena tournaments.")
+
+        rating_type = tournament.time_control.value
+        players = sorted(tournament.players, key=lambda p: -getattr(p.rating, rating_type))
+        start_rank = {player.name: rank for rank, player in enumerate(players, 1)}
+        final = {entry['player'].name: (position, entry['score'])
+                 for position, entry in enumerate(tournament.get_standings(), 1)}
+        rounds = sorted(tournament.rounds, key=lambda r: (r.round_, r.subround))
+
+        # Player name -> one (opponent rank, colour, result code) per round
+        blocks = {player.name: [None] * len(rounds) for player in players}
+        for column, round_obj in enumerate(rounds):
+            for game in round_obj.matches:
+                white, black = game.white.name, game.black.name if game.black is not None else None
+                if white not in blocks:
+                    continue
+                if black is None or black == white:
+                    blocks[white][column] = (0, "-", "U")
+                elif black in blocks:
+                    white_code, black_code = RESULT_CODES.get(game.result, (" ", " "))
+                    blocks[white][column] = (start_rank[black], "w", white_code)
+                    blocks[black][column] = (start_rank[white], "b", black_code)
+
+        tournament_type = next((name for cls, name in TOURNAMENT_TYPES.items() if isinstance(tournament, cls)), "")
+        file.write(f"012 {tournament.name}\n")
+        file.write(f"022 {tournament.location}\n")
+        file.write(f"042 {_trf_date(tournament.start_date)}\n")
+        file.write(f"052 {_trf_date(tournament.end_date)}\n")
+        file.write(f"062 {len(players)}\n")
+        file.write(f"072 {sum(1 for p in players if getattr(p.rating, rating_type) > 0)}\n")
+        file.write(f"092 {tournament_type}\n")
+        file.write(f"122 {TIME_CONTROL_NAMES.get(rating_type, rating_type)}\n")
+        if isinstance(tournament, (SwissTournament, RoundRobinTournament)):
+            file.write(f"XXR {tournament.num_rounds}\n")
+
+        for player in players:
+            rating = getattr(player.rating, rating_type)
+            sex = {"m": "m", "f": "w"}.get((player.gender or " ")[0].lower(), " ")
+            position, points = final.get(player.name, (0, 0.0))
+            line = [
+                f"001 {start_rank[player.name]:>4} {sex}    {player.name[:33]:<33} "
+                f"{rating if rating > 0 else '':>4}     {'':>11} {_trf_date(player.birthdate):<10} "
+                f"{points:>4.1f} {position:>4}"
+            ]
+            for block in blocks[player.name]:
+                opponent, colour, code = block if block is not None else (0, "-", "Z")
+                line.append(f"  {opponent:>4} {colour} {code}" if opponent else f"  0000 - {code}")
+            file.write("".join(line).rstrip() + "\n")
+
+    @staticmethod
+    def read_dict(lines, time_control: str = 'classic') -> dict:
+        """
+        Read a TRF report into the dictionary format of TournamentDTO.
+
+        Lines are consumed one at a time, so a file object can be passed
+        directly. Rounds without an opponent count as a bye won when the code
+        gives the point ('U', 'F', '+') and as absence otherwise; half-point
+        byes have no equivalent and are dropped.
+
+        Args:
+            lines: Iterable of text (or bytes) lines.
+            time_control (str): Time control when the report does not name one in its 122 line.
+
+        Returns:
+            dict: The tournament, imported as a Swiss tournament.
+
+        Raises:
+            ValueError: If the report has no tournament name or no players.
+        """
+        header = {}
+        num_rounds = 0
+        entries = []  # (starting rank, player dict, round blocks)
+        for line in lines:
+            if isinstance(line, bytes):
+                line = _decode(line)
+            line = line.rstrip("\r\n")
+            code = line[:3]
+            if code == "001":
+                rating = line[48:52].strip()
+                rating = int(rating) if rating.isdigit() else 0
+                player = {
+                    "name": line[14:47].strip(),
+                    "birthdate": _iso_date(line[69:79]),
+                    "gender": {"m": "male", "w": "female", "f": "female"}.get(line[9:10].lower(), "other"),
+                    "rating": {"classic": rating, "rapid": rating, "blitz": rating},
+                }
+                blocks = []
+                for start in range(91, len(line), 10):
+                    block = line[start:start + 8].ljust(8)
+                    opponent = block[0:4].strip()
+                    blocks.append((int(opponent) if opponent.isdigit() else 0, block[5], block[7]))
+                entries.append((int(line[4:8]), player, blocks))
+            elif code == "XXR":
+                value = line[3:].strip().split(" ")[0]
+                num_rounds = int(value) if value.isdigit() else 0
+            elif code[:1].isdigit() and len(line) > 4:
+                header[code] = line[4:].strip()
+
+        if not header.get("012"):
+            raise ValueError("TRF report without tournament name (line 012).")
+        if not entries:
+            raise ValueError("TRF report without players (lines 001).")
+
+        allotted = header.get("122", "").lower()
+        for name in ("blitz", "rapid"):
+            if name in allotted:
+                time_control = name
+
+        by_rank = {rank: player for rank, player, _ in entries}
+        columns = max(len(blocks) for _, _, blocks in entries)
+        rounds_data = []
+        for column in range(columns):
+            matches = []
+            for rank, player, blocks in entries:
+                if column >= len(blocks):
+                    continue
+                opponent, colour, code = blocks[column]
+                if opponent == 0:
+                    if code in FULL_POINT_BYES:
+                        matches.append({"white": player, "black": player, "result": "1-0"})
+                    continue
+                if opponent not in by_rank:
+                    continue
+                # Each game is listed on both players' lines; it is taken from white's,
+                # or from the higher ranked player's when the report has no colours
+                if colour == "w" or (colour != "b" and rank < opponent):
+                    matches.append({"white": player, "black": by_rank[opponent], "result": WHITE_RESULTS.get(code)})
+            if matches:
+                rounds_data.append({"round_number": len(rounds_data) + 1, "subround": 0, "matches": matches})
+
+        return {
+            "name": header["012"],
+            "location": header.get("022", ""),
+            "start_date": _iso_date(header.get("042", "")),
+            "end_date": _iso_date(header.get("052", "")),
+            "time_control": time_control,
+            "players": [player for _, player, _ in sorted(entries, key=lambda entry: entry[0])],
+            "rounds_data": rounds_data,
+            "type": "swiss",
+            "num_rounds": max(num_rounds, len(rounds_data)),
+        }
+
+    @staticmethod
+    def read(lines, time_control: str = 'classic') -> Tournament:
+        """
+        Read a TRF report into a Tournament (see read_dict).
+
+        Args:
+            lines: Iterable of text (or bytes) lines.
+            time_control (str): Time control when the report does not name one.
+
+        Returns:
+            Tournament: The imported tournament.
+        """
+        return TournamentDTO.from_dict(TrfDTO.read_dict(lines, time_control))
+
+    @staticmethod
+    def read_files(paths: list, time_control: str = 'classic', workers: int | None = None) -> list:
+        """
+        Read many TRF files, parsing them in parallel processes.
+
+        Args:
+            paths (list): Paths of the TRF files.
+            time_control (str): Time control of reports that do not name one.
+            workers (int | None): Number of processes (one per CPU if None; 1 reads in this process).
+
+        Returns:
+            list: The Tournament objects, in the order of paths.
+
+        Raises:
+            ValueError: If a file is not a valid TRF report (the message names the file).
+        """
+        arguments = [(path, time_control) for path in paths]
+        if workers == 1 or len(paths) < 2:
+            tournaments_data = [_read_file(argument) for argument in arguments]
+        else:
+            # Deferred: the pool machinery is only needed for bulk imports
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                tournaments_data = list(pool.map(_read_file, arguments, chunksize=8))
+        return [TournamentDTO.from_dict(data) for data in tournaments_data]
+
+
+def _read_file(argument: tuple) -> dict:
+    """Parse one TRF file into a tournament dict (module level, so worker processes can run it)."""
+    path, time_control = argument
+    try:
+        with open(path, 'rb') as file:
+            return TrfDTO.read_dict(file, time_control)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
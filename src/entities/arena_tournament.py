@@ -0,0 +1,276 @@
+import time
+
+from src.entities.tournament import Tournament
+from src.entities.time_control import TimeControl
+from src.entities.pairing_queue import PairingQueue
+
+from src.utils.rating_math import RESULT_SCORES
+
+from src.utils.decorators import type_check
+
+
+class ArenaTournament(Tournament):
+    """
+    Class representing an arena chess tournament, usually rapid or blitz.
+
+    There are no rounds to wait for: as soon as a game ends both players go
+    back into a pairing queue and are paired again with whoever is waiting,
+    until the arena time is over. All games are kept, in pairing order, in a
+    single round (round 1), so a game is addressed by its index in that round.
+    """
+
+    # Players are not paired again with their latest REMATCH_WINDOW opponents
+    REMATCH_WINDOW = 2
+
+    @type_check
+    def __init__(self, name: str, location: str, start_date: str, end_date: str, time_control: TimeControl,
+                 duration: int):
+        """
+        Initialize an ArenaTournament instance.
+
+        Args:
+            name (str): The name of the tournament.
+            location (str): The location of the tournament.
+            start_date (str): The start date of the tournament in 'YYYY-MM-DD' format.
+            end_date (str): The end date of the tournament in 'YYYY-MM-DD' format.
+            time_control (TimeControl): The time control of the tournament.
+            duration (int): Length of the arena in minutes; no games are paired after it ends.
+        """
+        super().__init__(name, location, start_date, end_date, time_control)
+        self.__duration = duration
+        self.__started_at = None  # Epoch seconds when the arena started
+        self.__waiting = {}       # Player name -> epoch seconds when they entered the queue
+
+        # Live queue and per-player [score, color balance, latest opponents], built on first use
+        # and then kept up to date game by game, so a result costs O(log n) instead of a replay
+        self.__queue = None
+        self.__arena_stats = None
+
+    @property
+    def duration(self) -> int:
+        """Get the length of the arena in minutes."""
+        return self.__duration
+
+    @duration.setter
+    def duration(self, value: int):
+        """Set the length of the arena in minutes."""
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError("Duration must be a positive number of minutes.")
+        self.__duration = value
+
+    @property
+    def started_at(self) -> float | None:
+        """Get when the arena started (epoch seconds), or None if it has not started."""
+        return self.__started_at
+
+    @started_at.setter
+    def started_at(self, value: float | None):
+        """Set when the arena started."""
+        if value is not None and not isinstance(value, (int, float)):
+            raise ValueError("Start time must be a number of seconds.")
+        self.__started_at = value
+
+    @property
+    def ends_at(self) -> float | None:
+        """Get when the arena ends (epoch seconds), or None if it has not started."""
+        if self.__started_at is None:
+            return None
+        return self.__started_at + self.__duration * 60
+
+    @property
+    def waiting(self) -> dict:
+        """Get the waiting players: name -> epoch seconds when they entered the queue."""
+        return self.__waiting.copy()
+
+    @waiting.setter
+    def waiting(self, value: dict):
+        """Set the waiting players."""
+        if not isinstance(value, dict):
+            raise ValueError("Waiting players must be a dict of name to time.")
+        self.__waiting = dict(value)
+        self.__queue = None
+
+    def is_over(self, now: float | None = None) -> bool:
+        """
+        Check whether the arena time is over.
+
+        Args:
+            now (float | None): Current moment in epoch seconds (the clock if None).
+
+        Returns:
+            bool: True once the arena has started and its duration has elapsed.
+        """
+        ends_at = self.ends_at
+        if ends_at is None:
+            return False
+        return (time.time() if now is None else now) >= ends_at
+
+    def is_finished(self) -> bool:
+        """Check whether the arena time is over and no game is waiting for a result."""
+        return self.is_over() and super().is_finished()
+
+    def add_player(self, player):
+        """Add a player; late entries to a running arena go straight into the queue."""
+        super().add_player(player)
+        now = time.time()
+        if self.__started_at is not None and not self.is_over(now):
+            self.__waiting[player.name] = now
+        self.__queue = None
+
+    def remove_player(self, player_name: str):
+        """Remove a player and take them out of the queue."""
+        super().remove_player(player_name)
+        self.__waiting.pop(player_name, None)
+        self.__queue = None
+
+    def start(self, now: float | None = None) -> list:
+        """
+        Start the arena: every player enters the queue and the first games are paired.
+
+        Args:
+            now (float | None): Current moment in epoch seconds (the clock if None).
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games.
+
+        Raises:
+            ValueError: If the arena already started or has fewer than 2 players.
+        """
+        if self.__started_at is not None:
+            raise ValueError("Arena has already started.")
+        if len(self.players) < 2:
+            raise ValueError("At least 2 players are required to start an arena.")
+
+        now = time.time() if now is None else now
+        from src.entities.round import Round
+        self.add_round(Round(1))
+        self.__started_at = now
+        # Rating order breaks the tie of everyone entering at the same moment
+        for offset, player in enumerate(self.get_players_by_rating(self.time_control.value)):
+            self.__waiting[player.name] = now + offset * 1e-6
+        return self.pair_waiting(now)
+
+    def record_result(self, match_index: int, result: str, now: float | None = None) -> list:
+        """
+        Record the result of a game, put both players back in the queue and pair whoever is waiting.
+
+        Correcting a result that was already entered does not queue the players again.
+
+        Args:
+            match_index (int): Index of the game in the arena round.
+            result (str): The result ('1-0', '0-1', or '0.5-0.5').
+            now (float | None): Current moment in epoch seconds (the clock if None).
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games.
+
+        Raises:
+            ValueError: If the arena has not started or the game does not exist.
+        """
+        arena_round = self.get_round(1)
+        if self.__started_at is None or arena_round is None:
+            raise ValueError("Arena has not started.")
+        if match_index < 0 or match_index >= len(arena_round.matches):
+            raise ValueError(f"Match index {match_index} out of range.")
+        if result not in RESULT_SCORES:
+            raise ValueError("Result must be '1-0', '0-1' or '0.5-0.5'.")
+
+        now = time.time() if now is None else now
+        game = arena_round.matches[match_index]
+        if game.result is not None:
+            # A corrected result changes scores already in the queue: rebuild it on next use
+            game.result = result
+            self.__queue = None
+            return self.pair_waiting(now)
+
+        queue = self.__get_queue()
+        game.result = result
+        stats = self.__arena_stats
+        scores = RESULT_SCORES[result]
+        open_arena = not self.is_over(now)
+        rating_type = self.time_control.value
+        for player, score in ((game.white, scores[0]), (game.black, scores[1])):
+            player_stats = stats.get(player.name)
+            if player_stats is None:
+                continue  # No longer registered
+            player_stats[0] += score
+            if open_arena:
+                self.__waiting[player.name] = now
+                queue.push(player, now, player_stats[0], getattr(player.rating, rating_type),
+                           tuple(player_stats[2]), player_stats[1])
+        return self.pair_waiting(now)
+
+    def pair_waiting(self, now: float | None = None) -> list:
+        """
+        Pair the players waiting in the queue and add their games to the arena round.
+
+        Args:
+            now (float | None): Current moment in epoch seconds (the clock if None).
+
+        Returns:
+            list: List of tuples (white_player, black_player) of the new games; empty once the arena is over.
+        """
+        now = time.time() if now is None else now
+        arena_round = self.get_round(1)
+        if self.__started_at is None or arena_round is None or self.is_over(now) or len(self.__waiting) < 2:
+            return []
+
+        pairings = self.__get_queue().pop_pairings(now)
+
+        from src.entities.game import Game
+        stats = self.__arena_stats
+        for white, black in pairings:
+            arena_round.add_match(Game(white, black))
+            del self.__waiting[white.name]
+            del self.__waiting[black.name]
+            self.__count_pairing(stats, white.name, black.name)
+        return pairings
+
+    def __get_queue(self) -> PairingQueue:
+        """Get the live queue, building it from the games played so far if needed."""
+        if self.__queue is None:
+            self.__queue = self.build_queue()
+        return self.__queue
+
+    def __count_pairing(self, stats: dict, white: str, black: str) -> None:
+        """Update colors and latest opponents with a new game."""
+        window = self.REMATCH_WINDOW
+        for name, opponent, color in ((white, black, 1), (black, white, -1)):
+            player_stats = stats.get(name)
+            if player_stats is not None:
+                player_stats[1] += color
+                player_stats[2].append(opponent)
+                del player_stats[2][:-window]
+
+    def build_queue(self) -> PairingQueue:
+        """
+        Build the pairing queue of the waiting players from the games played so far.
+
+        Returns:
+            PairingQueue: Queue holding every waiting player with their score,
+                rating, latest opponents and color balance.
+        """
+        queue = PairingQueue(self.REMATCH_WINDOW)
+        rating_type = self.time_control.value
+        players = {p.name: p for p in self.players}
+
+        # Score, color balance and latest opponents, in one pass over the arena games
+        stats = {name: [0.0, 0, []] for name in players}
+        arena_round = self.get_round(1)
+        for game in (arena_round.matches if arena_round is not None else []):
+            white, black = game.white.name, game.black.name
+            self.__count_pairing(stats, white, black)
+            scores = RESULT_SCORES.get(game.result)
+            if scores is not None:
+                for name, score in ((white, scores[0]), (black, scores[1])):
+                    if name in stats:
+                        stats[name][0] += score
+        self.__arena_stats = stats
+
+        for name, since in self.__waiting.items():
+            player = players.get(name)
+            if player is None:
+                continue  # No longer registered
+            score, balance, opponents = stats[name]
+            queue.push(player, since, score, getattr(player.rating, rating_type), tuple(opponents), balance)
+        return queue
@@ -0,0 +1,218 @@
+class Bracket:
+    """
+    Class representing a single-elimination bracket as an array-backed binary tree.
+
+    Slots are heap-indexed: the root (the champion) is slot 1, the children of
+    slot i are 2i and 2i + 1, and the first-round positions are the leaves
+    size .. 2 * size - 1. Round r is played between the children of slots
+    size >> r .. (size >> (r - 1)) - 1, in order, so match i of round r
+    decides slot (size >> r) + i.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize an empty Bracket.
+
+        Args:
+            size (int): Number of first-round positions (a power of 2, at least 2).
+        """
+        if size < 2 or size & (size - 1):
+            raise ValueError("Bracket size must be a power of 2 greater than 1.")
+        self.__size = size
+        self.__slots = [None] * (2 * size)
+        self.__positions = {}  # player name -> most advanced slot reached
+
+    @property
+    def size(self) -> int:
+        """Get the number of first-round positions."""
+        return self.__size
+
+    @property
+    def total_rounds(self) -> int:
+        """Get the number of rounds of the bracket."""
+        return self.__size.bit_length() - 1
+
+    @property
+    def champion(self):
+        """Get the winner of the bracket, or None while it is undecided."""
+        return self.__slots[1]
+
+    @staticmethod
+    def seed_positions(size: int) -> list:
+        """
+        Get the standard seed placement: seeds 1 and 2 can only meet in the final,
+        seeds 1-4 only in the semifinals, and so on.
+
+        Args:
+            size (int): Number of first-round positions (a power of 2).
+
+        Returns:
+            list: Seed number (1-based) at each first-round position, e.g. [1, 4, 2, 3] for 4.
+        """
+        order = [1]
+        while len(order) < size:
+            total = 2 * len(order) + 1
+            order = [seed for top in order for seed in (top, total - top)]
+        return order
+
+    @classmethod
+    def seeded(cls, players: list) -> 'Bracket':
+        """
+        Create a bracket from players in seed order.
+
+        When the number of players is not a power of 2, the missing positions
+        are byes, which fall against the top seeds; those seeds advance at once.
+
+        Args:
+            players (list): Players sorted from first to last seed.
+
+        Returns:
+            Bracket: The seeded bracket.
+        """
+        if len(players) < 2:
+            raise ValueError("At least 2 players are required for a bracket.")
+        size = 1 << (len(players) - 1).bit_length()
+        bracket = cls(size)
+        for position, seed in enumerate(cls.seed_positions(size)):
+            if seed <= len(players):
+                bracket.__place(size + position, players[seed - 1])
+
+        for node in range(size // 2, size):
+            left, right = bracket.__slots[2 * node], bracket.__slots[2 * node + 1]
+            if right is None and left is not None:
+                bracket.__place(node, left)
+            elif left is None and right is not None:
+                bracket.__place(node, right)
+        return bracket
+
+    def __place(self, slot: int, player) -> None:
+        """Put a player in a slot."""
+        self.__slots[slot] = player
+        if player is not None:
+            self.__positions[player.name] = slot
+
+    def round_nodes(self, round_number: int) -> range:
+        """
+        Get the slots decided by the matches of a round.
+
+        Args:
+            round_number (int): The round number (1 = first round).
+
+        Returns:
+            range: Slot indices, in match order.
+        """
+        if round_number <= 0 or round_number > self.total_rounds:
+            raise ValueError(f"Invalid round number. Must be between 1 and {self.total_rounds}.")
+        return range(self.__size >> round_number, self.__size >> (round_number - 1))
+
+    def round_pairings(self, round_number: int) -> list:
+        """
+        Get the pairings of a round, in match order.
+
+        Args:
+            round_number (int): The round number (1 = first round).
+
+        Returns:
+            list: List of tuples (white_player, black_player); black is None for a bye.
+
+        Raises:
+            ValueError: If a match of the previous round has no winner yet.
+        """
+        pairings = []
+        for node in self.round_nodes(round_number):
+            left, right = self.__slots[2 * node], self.__slots[2 * node + 1]
+            if left is None and right is None:
+                raise ValueError(f"All matches in round {round_number - 1} must have results before generating next round.")
+            if left is None or right is None:
+                if round_number > 1:
+                    raise ValueError(f"All matches in round {round_number - 1} must have results before generating next round.")
+                pairings.append((left or right, None))
+            else:
+                pairings.append((left, right))
+        return pairings
+
+    def set_winner(self, round_number: int, match_index: int, winner) -> None:
+        """
+        Advance the winner of a match into its parent slot.
+
+        Args:
+            round_number (int): The round of the match.
+            match_index (int): The index of the match in its round.
+            winner: The winning player.
+
+        Raises:
+            ValueError: If the winner is not playing that match.
+        """
+        nodes = self.round_nodes(round_number)
+        if not 0 <= match_index < len(nodes):
+            raise ValueError(f"Match index {match_index} out of range.")
+        node = nodes[match_index]
+
+        contenders = (self.__slots[2 * node], self.__slots[2 * node + 1])
+        if not any(p is not None and p.name == winner.name for p in contenders):
+            raise ValueError(f"Player '{winner.name}' is not playing this match.")
+
+        # A corrected result sends the previous winner back to their slot in this match
+        previous = self.__slots[node]
+        if previous is not None and previous.name != winner.name:
+            self.__positions[previous.name] = 2 * node if contenders[0].name == previous.name else 2 * node + 1
+        self.__place(node, winner)
+
+    def advance(self, winner) -> None:
+        """
+        Advance a player one level from the most advanced slot they reached.
+
+        Used to replay results whose match order is unknown.
+
+        Args:
+            winner: The winning player.
+
+        Raises:
+            ValueError: If the player is not in the bracket or already champion.
+        """
+        slot = self.__positions.get(winner.name)
+        if slot is None or slot == 1:
+            raise ValueError(f"Player '{winner.name}' cannot advance in this bracket.")
+        self.__place(slot // 2, winner)
+
+    def get_rounds(self) -> list:
+        """
+        Get the full bracket for display.
+
+        Returns:
+            list: One list per round of tuples (player_a, player_b, winner); unknown entries are None.
+        """
+        return [
+            [(self.__slots[2 * node], self.__slots[2 * node + 1], self.__slots[node])
+             for node in self.round_nodes(round_number)]
+            for round_number in range(1, self.total_rounds + 1)
+        ]
+
+    def to_list(self) -> list:
+        """
+        Get the player names in every slot, for persistence.
+
+        Returns:
+            list: Names (or None) by slot index.
+        """
+        return [player.name if player is not None else None for player in self.__slots]
+
+    @classmethod
+    def from_list(cls, names: list, players_by_name: dict) -> 'Bracket':
+        """
+        Rebuild a bracket saved with to_list().
+
+        Args:
+            names (list): Names (or None) by slot index.
+            players_by_name (dict): Player objects by name.
+
+        Returns:
+            Bracket: The restored bracket.
+        """
+        bracket = cls(len(names) // 2)
+        # Visit leaves first so each player's position ends at the most advanced slot
+        for slot in range(len(names) - 1, 0, -1):
+            name = names[slot]
+            if name is not None:
+                bracket.__place(slot, players_by_name.get(name))
+        return bracket
@@ -0,0 +1,99 @@
+from src.utils.decorators import type_check
+
+
+class Category:
+    """
+    Class representing a prize category (age group, gender or rating band).
+
+    Ages follow the usual chess convention of the age reached during the
+    tournament year: a player is in U10 if born in or after (year - 10), and
+    in S50 if born in or before (year - 50).
+    """
+    @type_check
+    def __init__(self, name: str, max_age: int | None = None, min_age: int | None = None,
+                 gender: str | None = None, max_rating: int | None = None, min_rating: int | None = None):
+        """
+        Initialize a Category instance. Criteria left as None are not checked.
+
+        Args:
+            name (str): The category name (e.g. 'U10', 'Feminino', 'U1800').
+            max_age (int | None): Maximum age reached in the tournament year.
+            min_age (int | None): Minimum age reached in the tournament year.
+            gender (str | None): Required gender ('male', 'female' or 'other').
+            max_rating (int | None): Maximum rating in the tournament's time control, inclusive.
+            min_rating (int | None): Minimum rating in the tournament's time control, inclusive.
+        """
+        self.__name = name
+        self.__max_age = max_age
+        self.__min_age = min_age
+        self.__gender = gender.strip().lower() if gender else None
+        self.__max_rating = max_rating
+        self.__min_rating = min_rating
+
+    @property
+    def name(self) -> str:
+        """Get the category name."""
+        return self.__name
+
+    @property
+    def max_age(self) -> int | None:
+        """Get the maximum age."""
+        return self.__max_age
+
+    @property
+    def min_age(self) -> int | None:
+        """Get the minimum age."""
+        return self.__min_age
+
+    @property
+    def gender(self) -> str | None:
+        """Get the required gender."""
+        return self.__gender
+
+    @property
+    def max_rating(self) -> int | None:
+        """Get the maximum rating."""
+        return self.__max_rating
+
+    @property
+    def min_rating(self) -> int | None:
+        """Get the minimum rating."""
+        return self.__min_rating
+
+    def accepts(self, age: int | None, gender: str, rating: int) -> bool:
+        """
+        Check whether a player with the given attributes belongs to the category.
+
+        Args:
+            age (int | None): Age reached in the tournament year (None if unknown).
+            gender (str): Normalized (lowercase) gender.
+            rating (int): Rating in the tournament's time control.
+
+        Returns:
+            bool: True if the player is eligible.
+        """
+        if self.__max_age is not None and (age is None or age > self.__max_age):
+            return False
+        if self.__min_age is not None and (age is None or age < self.__min_age):
+            return False
+        if self.__gender is not None and gender != self.__gender:
+            return False
+        if self.__max_rating is not None and rating > self.__max_rating:
+            return False
+        if self.__min_rating is not None and rating < self.__min_rating:
+            return False
+        return True
+
+
+def default_categories() -> list:
+    """
+    Get the standard prize categories: youth age groups, seniors, women and rating bands.
+
+    Returns:
+        list: List of Category objects.
+    """
+    categories = [Category(f"U{age}", max_age=age) for age in (8, 10, 12, 14, 16, 18)]
+    categories += [Category("S50", min_age=50), Category("S65", min_age=65)]
+    categories.append(Category("Feminino", gender="female"))
+    categories += [Category(f"U{band}", max_rating=band - 1) for band in (1200, 1400, 1600, 1800, 2000, 2200)]
+    return categories
@@ -1,5 +1,6 @@
 from src.entities.tournament import Tournament
 from src.entities.time_control import TimeControl
+from src.entities.bracket import Bracket
 
 from src.utils.decorators import type_check
 
@@ -18,6 +19,103 @@ class EliminatoryTournament(Tournament):
             time_control (TimeControl): The time control of the tournament.
         """
         super().__init__(name, location, start_date, end_date, time_control)
+        self.__bracket = None
+
+    @property
+    def bracket(self) -> Bracket | None:
+        """
+        Get the bracket tree, or None before the first round is generated.
+
+        Tournaments saved before brackets were stored get theirs rebuilt from
+        the seeding and the recorded results.
+        """
+        if self.__bracket is None and self.rounds:
+            self.__bracket = self._replay_bracket()
+        return self.__bracket
+
+    @bracket.setter
+    def bracket(self, value: Bracket | None):
+        """Set the bracket tree."""
+        if value is not None and not isinstance(value, Bracket):
+            raise ValueError("Bracket must be a Bracket instance.")
+        self.__bracket = value
+
+    def is_finished(self) -> bool:
+        """Check whether the bracket has a champion and no game is waiting for a result."""
+        bracket = self.bracket
+        return bracket is not None and bracket.champion is not None and super().is_finished()
+
+    def create_bracket(self) -> Bracket:
+        """
+        Seed the players by rating into a new bracket.
+
+        Returns:
+            Bracket: The new bracket.
+        """
+        self.__bracket = Bracket.seeded(self.get_players_by_rating(self.time_control.value))
+        return self.__bracket
+
+    def _replay_bracket(self) -> Bracket:
+        """Rebuild the bracket from the seeding and the winners of the recorded rounds."""
+        bracket = Bracket.seeded(self.get_players_by_rating(self.time_control.value))
+        players_by_name = {p.name: p for p in self.players}
+        for round_obj in sorted(self.rounds, key=lambda r: r.round_):
+            for match in round_obj.matches:
+                # Byes were already advanced when seeding
+                if match.black is None or match.black.name == match.white.name:
+                    continue
+                winner = self._get_match_winner(match)
+                if winner is not None and winner.name in players_by_name:
+                    bracket.advance(players_by_name[winner.name])
+        return bracket
+
+    def record_match_result(self, round_number: int, match_index: int, result: str | None = None) -> None:
+        """
+        Set the result of a match and advance its winner into the next round of the bracket.
+
+        Entering the same result again changes nothing. A result that changes
+        the winner is refused once the next round has been paired.
+
+        Args:
+            round_number (int): The round of the match.
+            match_index (int): The index of the match in its round.
+            result (str | None): The new result (the one already on the match if None).
+
+        Raises:
+            ValueError: If the round or match does not exist, or the winner
+                changes after the next round was paired (the match is then unchanged).
+        """
+        round_obj = self.get_round(round_number)
+        if round_obj is None:
+            raise ValueError(f"Round {round_number} not found in tournament.")
+        if not 0 <= match_index < len(round_obj.matches):
+            raise ValueError(f"Match index {match_index} out of range.")
+
+        match = round_obj.matches[match_index]
+        previous_result = match.result
+        if result is not None:
+            match.result = result
+        winner = self._get_match_winner(match)
+
+        next_round = self.get_round(round_number + 1)
+        if next_round is not None and (winner is None or not any(
+                winner.name in (game.white.name, game.black.name if game.black is not None else None)
+                for game in next_round.matches)):
+            match.result = previous_result
+            raise ValueError(f"Round {round_number + 1} is already paired; "
+                             f"the winner of this match can no longer change.")
+
+        bracket = self.bracket
+        if winner is None or bracket is None:
+            return
+
+        winner = {p.name: p for p in self.players}.get(winner.name, winner)
+        try:
+            bracket.set_winner(round_number, match_index, winner)
+        except ValueError:
+            # Rounds saved before brackets were stored may not follow bracket order;
+            # rebuilding from all recorded results keeps repeated entries harmless
+            self.__bracket = self._replay_bracket()
 
     def generate_bracket_pairings(self, round_number: int) -> list:
         """
@@ -46,63 +144,15 @@ class EliminatoryTournament(Tournament):
         if round_number <= 0 or round_number > max_rounds:
             raise ValueError(f"Invalid round number. Must be between 1 and {max_rounds}.")
 
-        # For first round, seed players by rating
+        # First round: seed players by rating into the bracket (top seeds get the byes)
         if round_number == 1:
-            rating_type = self.time_control.value
-            sorted_players = sorted(
-                players,
-                key=lambda p: getattr(p.rating, rating_type),
-                reverse=True
-            )
-
-            # Calculate number of players for first round
-            # If not power of 2, some players get byes
-            next_power_of_2 = 2 ** math.ceil(math.log2(num_players))
-            num_byes = next_power_of_2 - num_players
-
-            pairings = []
-            
-            # Top seeds get byes if needed
-            bye_players = sorted_players[:num_byes] if num_byes > 0 else []
-            active_players = sorted_players[num_byes:] if num_byes > 0 else sorted_players
-
-            # Pair remaining players (1 vs last, 2 vs second-last, etc.)
-            for i in range(len(active_players) // 2):
-                white = active_players[i]
-                black = active_players[-(i + 1)]
-                pairings.append((white, black))
-
-            # Add byes as special pairings
-            for bye_player in bye_players:
-                pairings.append((bye_player, None))  # Bye - automatic advance
-
-            return pairings
-
-        # For subsequent rounds, pair winners from previous round
-        else:
-            # Get the previous round
-            previous_round = self.get_round(round_number - 1)
-            
-            if previous_round is None:
-                raise ValueError(f"Previous round (round {round_number - 1}) must be completed before generating round {round_number}.")
-            
-            # Get winners from previous round
-            winners = []
-            for match in previous_round.matches:
-                winner = self._get_match_winner(match)
-                if winner is None:
-                    raise ValueError(f"All matches in round {round_number - 1} must have results before generating next round.")
-                winners.append(winner)
-            
-            if len(winners) < 2:
-                raise ValueError("At least 2 winners are required to generate next round.")
-            
-            # Pair winners sequentially (winner of match 1 vs winner of match 2, etc.)
-            pairings = []
-            for i in range(0, len(winners) - 1, 2):
-                pairings.append((winners[i], winners[i + 1]))
-            
-            return pairings
+            return self.create_bracket().round_pairings(1)
+
+        # Subsequent rounds: winners already sit in their bracket slots
+        if self.get_round(round_number - 1) is None:
+            raise ValueError(f"Previous round (round {round_number - 1}) must be completed before generating round {round_number}.")
+
+        return self.bracket.round_pairings(round_number)
 
     def _get_match_winner(self, match):
         """
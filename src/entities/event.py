@@ -0,0 +1,107 @@
+from src.utils.decorators import type_check
+
+
+class Event:
+    """
+    Class representing a multi-section event (e.g. an open split into A, B, C and U1400).
+
+    Each section is a regular tournament, stored and paired on its own; the
+    event only groups them by name so they can be paired together.
+    """
+    @type_check
+    def __init__(self, name: str, location: str, start_date: str, end_date: str):
+        """
+        Initialize an Event instance.
+
+        Args:
+            name (str): The name of the event.
+            location (str): The location of the event.
+            start_date (str): The start date of the event in 'YYYY-MM-DD' format.
+            end_date (str): The end date of the event in 'YYYY-MM-DD' format.
+        """
+        self.__name = name
+        self.__location = location
+        self.__start_date = start_date
+        self.__end_date = end_date
+        self.__sections = []  # Names of the section tournaments
+
+    @property
+    def name(self) -> str:
+        """Get the event's name."""
+        return self.__name
+
+    @name.setter
+    def name(self, value: str):
+        """Set the event's name."""
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Event name must be a non-empty string.")
+        self.__name = value.strip()
+
+    @property
+    def location(self) -> str:
+        """Get the event's location."""
+        return self.__location
+
+    @location.setter
+    def location(self, value: str):
+        """Set the event's location."""
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Location must be a non-empty string.")
+        self.__location = value.strip()
+
+    @property
+    def start_date(self) -> str:
+        """Get the event's start date."""
+        return self.__start_date
+
+    @start_date.setter
+    def start_date(self, value: str):
+        """Set the event's start date."""
+        if not isinstance(value, str) or len(value) != 10 or value[4] != '-' or value[7] != '-':
+            raise ValueError("Start date must be a string in 'YYYY-MM-DD' format.")
+        self.__start_date = value
+
+    @property
+    def end_date(self) -> str:
+        """Get the event's end date."""
+        return self.__end_date
+
+    @end_date.setter
+    def end_date(self, value: str):
+        """Set the event's end date."""
+        if not isinstance(value, str) or len(value) != 10 or value[4] != '-' or value[7] != '-':
+            raise ValueError("End date must be a string in 'YYYY-MM-DD' format.")
+        self.__end_date = value
+
+    @property
+    def sections(self) -> list:
+        """Get the names of the section tournaments."""
+        return self.__sections.copy()
+
+    def add_section(self, tournament_name: str):
+        """
+        Add a section to the event.
+
+        Args:
+            tournament_name (str): The name of the section tournament.
+
+        Raises:
+            ValueError: If the section is already part of the event.
+        """
+        if tournament_name in self.__sections:
+            raise ValueError(f"Section '{tournament_name}' is already part of this event.")
+        self.__sections.append(tournament_name)
+
+    def remove_section(self, tournament_name: str):
+        """
+        Remove a section from the event.
+
+        Args:
+            tournament_name (str): The name of the section tournament.
+
+        Raises:
+            ValueError: If the section is not part of the event.
+        """
+        if tournament_name not in self.__sections:
+            raise ValueError(f"Section '{tournament_name}' not found in this event.")
+        self.__sections.remove(tournament_name)
@@ -0,0 +1,162 @@
+import heapq
+from bisect import bisect_left, insort
+
+
+class PairingQueue:
+    """
+    Class representing the waiting queue of an arena tournament.
+
+    Players are served in order of waiting time (a heap keyed on the moment
+    they entered the queue) and each one is paired with the closest waiting
+    player by score, then rating (a sorted list searched with bisect), skipping
+    their most recent opponents. Both operations are logarithmic in the number
+    of waiting players, apart from the list insertions and removals.
+    """
+
+    def __init__(self, rematch_window: int = 2, max_wait: float = 30.0):
+        """
+        Initialize an empty PairingQueue.
+
+        Args:
+            rematch_window (int): How many of a player's latest opponents they should not face again.
+            max_wait (float): Seconds after which a player accepts a recent opponent rather than keep waiting.
+        """
+        self.__rematch_window = rematch_window
+        self.__max_wait = max_wait
+        self.__heap = []     # (since, sequence, name); entries of paired players are skipped lazily
+        self.__ranking = []  # (score, rating, name), sorted
+        self.__entries = {}  # name -> (player, since, ranking key, recent opponents, color balance)
+        self.__sequence = 0
+
+    @property
+    def rematch_window(self) -> int:
+        """Get how many of a player's latest opponents are avoided."""
+        return self.__rematch_window
+
+    @property
+    def max_wait(self) -> float:
+        """Get the seconds after which recent opponents are accepted."""
+        return self.__max_wait
+
+    def __len__(self) -> int:
+        """Get the number of waiting players."""
+        return len(self.__entries)
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a player is waiting."""
+        return name in self.__entries
+
+    def push(self, player, since: float, score: float, rating: int,
+             recent_opponents: tuple = (), color_balance: int = 0) -> None:
+        """
+        Put a player in the queue.
+
+        Args:
+            player: The waiting player.
+            since (float): Moment (epoch seconds) the player entered the queue.
+            score (float): The player's current score.
+            rating (int): The player's rating in the tournament's time control.
+            recent_opponents (tuple): Names of the latest opponents, most recent last.
+            color_balance (int): Games with white minus games with black.
+
+        Raises:
+            ValueError: If the player is already waiting.
+        """
+        if player.name in self.__entries:
+            raise ValueError(f"Player '{player.name}' is already waiting.")
+        key = (score, rating, player.name)
+        recent = frozenset(recent_opponents[-self.__rematch_window:]) if self.__rematch_window else frozenset()
+        self.__entries[player.name] = (player, since, key, recent, color_balance)
+        insort(self.__ranking, key)
+        heapq.heappush(self.__heap, (since, self.__sequence, player.name))
+        self.__sequence += 1
+
+    def remove(self, name: str) -> None:
+        """
+        Take a player out of the queue (e.g. on withdrawal).
+
+        Args:
+            name (str): The player's name.
+        """
+        entry = self.__entries.pop(name, None)
+        if entry is not None:
+            self.__discard_key(entry[2])
+
+    def pop_pairings(self, now: float) -> list:
+        """
+        Pair as many waiting players as possible, longest waiting first.
+
+        A player whose only waiting candidates are recent opponents keeps
+        waiting until max_wait has passed.
+
+        Args:
+            now (float): Current moment (epoch seconds).
+
+        Returns:
+            list: List of tuples (white_player, black_player), in pairing order.
+        """
+        pairings = []
+        deferred = []
+        while len(self.__entries) >= 2 and self.__heap:
+            item = heapq.heappop(self.__heap)
+            entry = self.__entries.get(item[2])
+            if entry is None or entry[1] != item[0]:
+                continue  # Already paired or removed
+
+            opponent = self.__closest(entry, allow_rematch=now - entry[1] >= self.__max_wait)
+            if opponent is None:
+                deferred.append(item)
+                continue
+
+            del self.__entries[entry[0].name]
+            del self.__entries[opponent[0].name]
+            self.__discard_key(entry[2])
+            self.__discard_key(opponent[2])
+
+            # White goes to whoever had fewer whites; ties favor the longest waiting player
+            if opponent[4] < entry[4]:
+                pairings.append((opponent[0], entry[0]))
+            else:
+                pairings.append((entry[0], opponent[0]))
+
+        for item in deferred:
+            heapq.heappush(self.__heap, item)
+        return pairings
+
+    def __closest(self, entry: tuple, allow_rematch: bool) -> tuple | None:
+        """Find the waiting player closest in score and rating that the entry may face."""
+        ranking = self.__ranking
+        score, rating, name = entry[2]
+        recent = entry[3]
+        position = bisect_left(ranking, entry[2])
+        below, above = position - 1, position + 1
+        fallback = None
+
+        # Walk outwards from the player's own position, nearest candidate first
+        while below >= 0 or above < len(ranking):
+            if above >= len(ranking) or (below >= 0 and self.__distance(ranking[below], score, rating)
+                                         <= self.__distance(ranking[above], score, rating)):
+                key = ranking[below]
+                below -= 1
+            else:
+                key = ranking[above]
+                above += 1
+
+            if key[2] not in recent:
+                return self.__entries[key[2]]
+            if fallback is None:
+                fallback = key
+        if allow_rematch and fallback is not None:
+            return self.__entries[fallback[2]]
+        return None
+
+    @staticmethod
+    def __distance(key: tuple, score: float, rating: int) -> tuple:
+        """Distance of a ranking key from a score and rating."""
+        return (abs(key[0] - score), abs(key[1] - rating))
+
+    def __discard_key(self, key: tuple) -> None:
+        """Remove a key from the sorted ranking."""
+        position = bisect_left(self.__ranking, key)
+        if position < len(self.__ranking) and self.__ranking[position] == key:
+            del self.__ranking[position]
@@ -2,6 +2,7 @@ from src.utils.decorators import type_check
 
 class Rating:
     """Class representing a player's rating in different time controls."""
+
     @type_check
     def __init__(self, classic: int, rapid: int, blitz: int):
         """
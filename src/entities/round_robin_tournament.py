@@ -0,0 +1,165 @@
+from functools import lru_cache
+
+from src.entities.tournament import Tournament
+from src.entities.time_control import TimeControl
+
+from src.utils.decorators import type_check
+
+
+@lru_cache(maxsize=None)
+def berger_table(num_players: int) -> tuple:
+    """
+    Get the Berger table for a single round-robin.
+
+    Pairing numbers are 0-based. With an odd number of players, pairing
+    number num_players is a dummy and its opponent has a bye that round.
+    Tables are cached per player count.
+
+    Args:
+        num_players (int): Number of players (at least 2).
+
+    Returns:
+        tuple: One tuple per round of (white, black) pairing-number pairs, board order.
+    """
+    if num_players < 2:
+        raise ValueError("At least 2 players are required for a round-robin.")
+    n = num_players + num_players % 2
+    last = n - 1      # Fixed pairing number, alternates colors on board 1
+    ring = n - 1      # The other pairing numbers rotate around a ring of this size
+
+    rounds = []
+    for r in range(n - 1):
+        # Pivot on board 1 advances by n/2 around the ring each round
+        pivot = (r * (n // 2)) % ring
+        boards = [(pivot, last) if r % 2 == 0 else (last, pivot)]
+        for k in range(1, n // 2):
+            boards.append(((pivot + k) % ring, (pivot - k) % ring))
+        rounds.append(tuple(boards))
+    return tuple(rounds)
+
+
+class RoundRobinTournament(Tournament):
+    """Class representing a round-robin (all-play-all) chess tournament."""
+    @type_check
+    def __init__(self, name: str, location: str, start_date: str, end_date: str, time_control: TimeControl,
+                 double_round_robin: bool = False):
+        """
+        Initialize a RoundRobinTournament instance.
+
+        Args:
+            name (str): The name of the tournament.
+            location (str): The location of the tournament.
+            start_date (str): The start date of the tournament in 'YYYY-MM-DD' format.
+            end_date (str): The end date of the tournament in 'YYYY-MM-DD' format.
+            time_control (TimeControl): The time control of the tournament.
+            double_round_robin (bool): Whether every pair of players meets twice, once with each color.
+        """
+        super().__init__(name, location, start_date, end_date, time_control)
+        self.__double_round_robin = double_round_robin
+        self.__seed_order = None  # Player names by pairing number, fixed by the first schedule
+
+    @property
+    def double_round_robin(self) -> bool:
+        """Get whether the tournament is a double round-robin."""
+        return self.__double_round_robin
+
+    @double_round_robin.setter
+    def double_round_robin(self, value: bool):
+        """Set whether the tournament is a double round-robin."""
+        if not isinstance(value, bool):
+            raise ValueError("Double round-robin must be a boolean.")
+        self.__double_round_robin = value
+
+    @property
+    def seed_order(self) -> list | None:
+        """Get the player names by pairing number, or None before the schedule is generated."""
+        return self.__seed_order.copy() if self.__seed_order is not None else None
+
+    @seed_order.setter
+    def seed_order(self, value: list | None):
+        """Set the player names by pairing number."""
+        if value is not None and not isinstance(value, list):
+            raise ValueError("Seed order must be a list of player names.")
+        self.__seed_order = list(value) if value is not None else None
+
+    @property
+    def num_rounds(self) -> int:
+        """Get the number of rounds, given the current players."""
+        num_players = len(self.players)
+        if num_players < 2:
+            return 0
+        cycle = num_players - 1 + num_players % 2
+        return cycle * 2 if self.__double_round_robin else cycle
+
+    def is_finished(self) -> bool:
+        """Check whether every round of the schedule has been paired and played."""
+        return len({r.round_ for r in self.rounds}) >= self.num_rounds and super().is_finished()
+
+    def generate_schedule(self) -> list:
+        """
+        Generate the pairings of every round from the Berger tables.
+
+        Pairing numbers follow rating order (tournament's time control) and
+        are fixed the first time the schedule is generated, so later rating
+        changes do not reshuffle a running event.
+
+        Returns:
+            list: One list per round of tuples (white_player, black_player); black is None for a bye.
+
+        Raises:
+            ValueError: If there are fewer than 2 players or the roster no longer matches the pairing numbers.
+        """
+        players = self.players
+        if len(players) < 2:
+            raise ValueError("At least 2 players are required to generate pairings.")
+
+        if self.__seed_order is None:
+            self.__seed_order = [p.name for p in self.get_players_by_rating(self.time_control.value)]
+        players_by_name = {p.name: p for p in players}
+        if set(self.__seed_order) != set(players_by_name):
+            raise ValueError("Players changed after the schedule was fixed.")
+        seeds = [players_by_name[name] for name in self.__seed_order]
+        seeds.append(None)  # Dummy pairing number for odd player counts
+
+        table = berger_table(len(players))
+        schedule = []
+        for boards in table:
+            schedule.append(self._pairings_from_boards(seeds, boards, reverse_colors=False))
+        if self.__double_round_robin:
+            for boards in table:
+                schedule.append(self._pairings_from_boards(seeds, boards, reverse_colors=True))
+        return schedule
+
+    @staticmethod
+    def _pairings_from_boards(seeds: list, boards: tuple, reverse_colors: bool) -> list:
+        """Turn Berger boards into player pairings, putting byes last."""
+        pairings = []
+        bye = None
+        for white, black in boards:
+            if reverse_colors:
+                white, black = black, white
+            white_player, black_player = seeds[white], seeds[black]
+            if white_player is None or black_player is None:
+                bye = white_player or black_player
+            else:
+                pairings.append((white_player, black_player))
+        if bye is not None:
+            pairings.append((bye, None))
+        return pairings
+
+    def generate_round_robin_pairings(self, round_number: int) -> list:
+        """
+        Get the pairings of a round from the full schedule.
+
+        Args:
+            round_number (int): The round number.
+
+        Returns:
+            list: List of tuples (white_player, black_player); black is None for a bye.
+
+        Raises:
+            ValueError: If there are insufficient players or round number is invalid.
+        """
+        if round_number <= 0 or round_number > self.num_rounds:
+            raise ValueError(f"Round number must be between 1 and {self.num_rounds}.")
+        return self.generate_schedule()[round_number - 1]
@@ -2,6 +2,7 @@ from src.entities.tournament import Tournament
 from src.entities.time_control import TimeControl
 
 from src.utils.decorators import type_check
+from src.utils.pairing_search import PairingProblem, find_best_pairings
 
 class SwissTournament(Tournament):
     """Class representing a Swiss-system chess tournament."""
@@ -20,6 +21,7 @@ class SwissTournament(Tournament):
         """
         super().__init__(name, location, start_date, end_date, time_control)
         self.__num_rounds = rounds  # Number of rounds in the Swiss tournament
+        self.__last_pairing_stats = None  # Statistics of the last pairing search (not persisted)
 
     @property
     def num_rounds(self) -> int:
@@ -33,12 +35,31 @@ class SwissTournament(Tournament):
             raise ValueError("Number of rounds must be a positive integer.")
         self.__num_rounds = value
 
-    def generate_swiss_pairings(self, round_number: int) -> list:
+    def is_finished(self) -> bool:
+        """Check whether every planned round has been paired and played."""
+        return len({r.round_ for r in self.rounds}) >= self.__num_rounds and super().is_finished()
+
+    @property
+    def last_pairing_stats(self) -> dict | None:
+        """Get the search statistics of the last pairing generated after round 1, or None."""
+        return self.__last_pairing_stats
+
+    def generate_swiss_pairings(self, round_number: int, time_budget: float | None = None,
+                                workers: int | None = None) -> list:
         """
         Generate pairings for a Swiss tournament round.
 
+        Round 1 pairs the top half against the bottom half by rating. Later
+        rounds pair by score without rematches, choosing the pairing with the
+        lowest cost (score floats, color clashes, rating spread; see
+        src.utils.pairing_search). With a time budget, alternative pairings
+        are searched in parallel worker processes until the deadline; the
+        search statistics are then available in last_pairing_stats.
+
         Args:
             round_number (int): The round number to generate pairings for.
+            time_budget (float | None): Seconds the pairing search may take (quick deterministic pairing if None).
+            workers (int | None): Worker processes for the timed search (one per CPU if None).
 
         Returns:
             list: List of tuples (white_player, black_player) representing the pairings.
@@ -46,9 +67,6 @@ class SwissTournament(Tournament):
         Raises:
             ValueError: If there are insufficient players or round number is invalid.
         """
-        from src.entities.game import Game
-        import random
-
         players = self.players
         
         if len(players) < 2:
@@ -85,36 +103,79 @@ class SwissTournament(Tournament):
                 pairings.append((sorted_players[-1], None))  # Bye
             
             return pairings
-        
-        # For subsequent rounds, use a simple Swiss pairing algorithm
-        # In a real implementation, this would consider previous opponents and color balance
-        else:
-            # Get scores from previous rounds (simplified - would need to track actual scores)
-            rating_type = self.time_control.value
-            sorted_players = sorted(
-                players,
-                key=lambda p: getattr(p.rating, rating_type),
-                reverse=True
-            )
-            
-            # Simple pairing: pair consecutive players
-            pairings = []
-            paired = set()
-            
-            for i in range(0, len(sorted_players) - 1, 2):
-                if sorted_players[i].name not in paired and sorted_players[i+1].name not in paired:
-                    # Alternate colors based on round number
-                    if round_number % 2 == 1:
-                        pairings.append((sorted_players[i], sorted_players[i+1]))
-                    else:
-                        pairings.append((sorted_players[i+1], sorted_players[i]))
-                    paired.add(sorted_players[i].name)
-                    paired.add(sorted_players[i+1].name)
-            
-            # Handle bye if odd number of players
-            if len(sorted_players) % 2 == 1:
-                unpaired = [p for p in sorted_players if p.name not in paired]
-                if unpaired:
-                    pairings.append((unpaired[0], None))
-            
-            return pairings
+
+        # For subsequent rounds, rank by score and search for the best pairing
+        scores = self.get_scores()
+        ranked, bye = self._rank_for_pairing(scores)
+        problem = self._build_pairing_problem(ranked, scores)
+        pairs, self.__last_pairing_stats = find_best_pairings(problem, time_budget, workers)
+
+        pairings = [(ranked[white], ranked[black]) for white, black in pairs]
+        if bye is not None:
+            pairings.append((bye, None))
+        return pairings
+
+    def _rank_for_pairing(self, scores: dict) -> tuple:
+        """
+        Rank players by score, then rating, and pick the bye when the number of players is odd.
+
+        The bye goes to the lowest ranked player who has not had one yet.
+
+        Args:
+            scores (dict): Scores of the played rounds, as returned by get_scores().
+
+        Returns:
+            tuple: (ranked players to pair, bye player or None).
+        """
+        rating_type = self.time_control.value
+        ranked = sorted(
+            self.players,
+            key=lambda p: (-scores[p.name]['score'], -getattr(p.rating, rating_type))
+        )
+        if len(ranked) % 2 == 0:
+            return ranked, None
+
+        had_bye = set()
+        for round_obj in self.rounds:
+            for match in round_obj.matches:
+                if match.black is None or match.black.name == match.white.name:
+                    had_bye.add(match.white.name)
+        position = next((i for i in range(len(ranked) - 1, -1, -1) if ranked[i].name not in had_bye), len(ranked) - 1)
+        return ranked[:position] + ranked[position + 1:], ranked[position]
+
+    def _build_pairing_problem(self, ranked: list, scores: dict) -> PairingProblem:
+        """
+        Collect the scores, ratings, colors and previous opponents of ranked players.
+
+        Args:
+            ranked (list): Players to pair, in ranking order.
+            scores (dict): Scores of the played rounds, as returned by get_scores().
+
+        Returns:
+            PairingProblem: The problem for the pairing search.
+        """
+        rating_type = self.time_control.value
+        position = {player.name: i for i, player in enumerate(ranked)}
+        colors = [[] for _ in ranked]
+        opponents = [set() for _ in ranked]
+
+        for round_obj in self.rounds:
+            for match in round_obj.matches:
+                white, black = match.white.name, match.black.name if match.black is not None else None
+                if black is None or black == white:
+                    continue  # Byes have no color or opponent
+                w, b = position.get(white), position.get(black)
+                if w is not None:
+                    colors[w].append('W')
+                if b is not None:
+                    colors[b].append('B')
+                if w is not None and b is not None:
+                    opponents[w].add(b)
+                    opponents[b].add(w)
+
+        return PairingProblem(
+            [scores[p.name]['score'] for p in ranked],
+            [getattr(p.rating, rating_type) for p in ranked],
+            [''.join(history) for history in colors],
+            opponents
+        )
@@ -1,3 +1,5 @@
+import heapq
+
 from src.utils.decorators import type_check
 from src.entities.time_control import TimeControl
 
@@ -24,6 +26,9 @@ class Tournament:
         self.__players = []  # List to hold players participating in the tournament
         self.__rounds = []   # List to hold rounds in the tournament
 
+        # Per rating type: [rating keys by player position, sorted players or None]
+        self.__rating_cache = {}
+
     @property
     def name(self) -> str:
         """Get the tournament's name."""
@@ -110,6 +115,7 @@ class Tournament:
             raise ValueError(f"Player '{player.name}' is already registered in this tournament.")
         
         self.__players.append(player)
+        self.__rating_cache.clear()
 
     def remove_player(self, player_name: str):
         """
@@ -126,25 +132,98 @@ class Tournament:
         
         if len(self.__players) == initial_length:
             raise ValueError(f"Player '{player_name}' not found in this tournament.")
+        self.__rating_cache.clear()
 
-    def get_players_by_rating(self, rating_type: str = 'classic') -> list:
+    def get_players_by_rating(self, rating_type: str = 'classic', limit: int | None = None) -> list:
         """
         Get players sorted by rating in descending order.
 
+        The full order is cached per rating type and reused while the roster and
+        the ratings of its players are unchanged. With a limit and no cached
+        order, only the top players are selected with a heap instead of sorting
+        everyone.
+
         Args:
             rating_type (str): The type of rating to sort by ('classic', 'rapid', or 'blitz').
+            limit (int | None): Maximum number of players to return (all if None).
 
         Returns:
             list: List of players sorted by rating (highest to lowest).
         """
         if rating_type not in ['classic', 'rapid', 'blitz']:
             raise ValueError("Rating type must be 'classic', 'rapid', or 'blitz'.")
-        
-        return sorted(
-            self.__players,
-            key=lambda p: getattr(p.rating, rating_type),
-            reverse=True
-        )
+
+        # Reading the keys is linear, like copying the order; only the sort is cached
+        keys = [getattr(p.rating, rating_type) for p in self.__players]
+        cached = self.__rating_cache.get(rating_type)
+        if cached is None or cached[0] != keys:
+            cached = [keys, None]
+            self.__rating_cache[rating_type] = cached
+        order = cached[1]
+
+        if order is None:
+            if limit is not None and limit < len(keys):
+                # Same result (ties included) as sorted(..., reverse=True)[:limit]
+                top = heapq.nlargest(limit, range(len(keys)), key=keys.__getitem__)
+                return [self.__players[i] for i in top]
+            positions = sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
+            order = cached[1] = [self.__players[i] for i in positions]
+
+        return order[:limit] if limit is not None else order.copy()
+
+    def get_scores(self, round_number: int | None = None) -> dict:
+        """
+        Get the score of every player after a given round.
+
+        Args:
+            round_number (int | None): Last round to count (all rounds if None).
+
+        Returns:
+            dict: Player name -> {'player', 'score', 'matches_played'}.
+        """
+        scores = {
+            p.name: {'player': p, 'score': 0.0, 'matches_played': 0}
+            for p in self.__players
+        }
+        rounds = self.__rounds if round_number is None else self.__rounds[:round_number]
+        for round_obj in rounds:
+            for match in round_obj.matches:
+                white_name = match.white.name
+                if match.black is None:
+                    scores[white_name]['score'] += 1.0
+                    scores[white_name]['matches_played'] += 1
+                elif match.result:
+                    scores[white_name]['matches_played'] += 1
+                    black_name = match.black.name
+                    scores[black_name]['matches_played'] += 1
+                    if match.result == "1-0":
+                        scores[white_name]['score'] += 1.0
+                    elif match.result == "0-1":
+                        scores[black_name]['score'] += 1.0
+                    elif match.result == "0.5-0.5":
+                        scores[white_name]['score'] += 0.5
+                        scores[black_name]['score'] += 0.5
+        return scores
+
+    def get_standings(self, round_number: int | None = None, limit: int | None = None) -> list:
+        """
+        Get the standings after a given round: by score, then by rating of the tournament's time control.
+
+        Args:
+            round_number (int | None): Last round to count (all rounds if None).
+            limit (int | None): Maximum number of entries to return (all if None).
+
+        Returns:
+            list: Score entries ({'player', 'score', 'matches_played'}), leader first.
+        """
+        rating_type = self.time_control.value
+        entries = list(self.get_scores(round_number).values())
+        keys = [(-e['score'], -getattr(e['player'].rating, rating_type)) for e in entries]
+        if limit is not None and limit < len(entries):
+            positions = heapq.nsmallest(limit, range(len(entries)), key=keys.__getitem__)
+        else:
+            positions = sorted(range(len(entries)), key=keys.__getitem__)
+        return [entries[i] for i in positions]
 
     @property
     def rounds(self) -> list:
@@ -178,6 +257,17 @@ class Tournament:
                 return round_obj
         return None
 
+    def is_finished(self) -> bool:
+        """
+        Check whether the tournament is over: it has rounds and no game is waiting for a result.
+
+        Returns:
+            bool: True if the tournament is finished.
+        """
+        return bool(self.__rounds) and all(
+            game.result is not None for round_obj in self.__rounds for game in round_obj.matches
+        )
+
     def get_current_round_number(self) -> int:
         """
         Get the current round number (last completed round + 1).
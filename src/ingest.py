@@ -0,0 +1,335 @@
+"""
+Result ingestion service for electronic boards and table terminals.
+
+Clients connect over TCP or a Unix socket and send one JSON object per line:
+    {"id": "mesa12-r5", "tournament": "Aberto de Verão", "round": 5, "board": 12,
+     "result": "1-0", "white": "Ana Souza", "black": "Bruno Lima"}
+'white' and 'black' are optional and, when given, must match the pairing of the
+board; 'id' is optional and makes retransmits of the same message harmless;
+'correction': true replaces a result already recorded. Every line gets one
+JSON line back:
+    {"id": "mesa12-r5", "status": "ok"}            saved
+    {"id": "mesa12-r5", "status": "duplicate"}     already saved with this result
+    {"id": "mesa12-r5", "status": "error", "error": "..."}
+Errors that may pass (a full queue, a data file being unreadable or unwritable)
+are not remembered for the id, so retransmitting the message tries again.
+
+Accepted results go into a queue drained by a single writer: every result
+waiting when a write starts is saved in one update_match_results call per
+round, so a rush of boards finishing together costs a few file writes rather
+than one per board. A message is answered once its result is on disk.
+
+Examples:
+    python main.py ingest --port 7000
+    python main.py ingest --unix /tmp/resultados.sock
+"""
+import asyncio
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.controllers.base_controller import DataFileError
+from src.controllers.tournament_controller import TournamentController
+from src.utils.metrics import METRICS
+
+MAX_LINE_BYTES = 64 * 1024
+MAX_REMEMBERED_IDS = 100000
+
+
+class _Duplicate(ValueError):
+    """Raised by validation for a result identical to the one recorded."""
+
+
+class _RoundState:
+    """Pairings and results of a round as last read or written, for validation without loading the file."""
+
+    __slots__ = ('signature', 'boards', 'results')
+
+    def __init__(self, signature, boards: list, results: list):
+        self.signature = signature  # tournaments.json signature the state matches
+        self.boards = boards        # (white name, black name or None for a bye), by match index
+        self.results = results      # result or None, by match index
+
+
+class ResultIngestor:
+    """
+    Validates, deduplicates and batches result messages into the tournament store.
+    """
+
+    def __init__(self, data_path: str | None = None, batch_window: float = 0.05,
+                 max_batch: int = 2000, max_queue: int = 10000):
+        """
+        Initialize a ResultIngestor.
+
+        Args:
+            data_path (str | None): Directory of the data files (the controller's default if None).
+            batch_window (float): Seconds the writer waits for more results after the first
+                of a batch; under load batches fill up on their own while the previous one is written.
+            max_batch (int): Maximum number of results in one batch.
+            max_queue (int): Maximum number of results waiting; further ones are refused.
+        """
+        self.controller = TournamentController()
+        if data_path:
+            self.controller.data_path = data_path.rstrip('/') + '/'
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.stats = {'ok': 0, 'duplicate': 0, 'error': 0, 'batches': 0, 'writes': 0}
+        # One thread for every access to the file, so reads never see a half-written batch
+        self.__pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ingest')
+        self.__rounds = {}                # (tournament, round) -> _RoundState
+        self.__pending = {}               # (tournament, round, match index) -> (result, Future)
+        self.__answers = OrderedDict()    # message id -> Future of its answer
+        self.__queue = None
+        self.__writer = None
+
+    def start(self) -> None:
+        """Start the writer; must be called from the running loop."""
+        self.__queue = asyncio.Queue(self.max_queue)
+        self.__writer = asyncio.get_running_loop().create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        """Write what is still queued, then stop the writer."""
+        if self.__writer is not None:
+            await self.__queue.join()
+            self.__writer.cancel()
+            self.__writer = None
+        self.__pool.shutdown(wait=True)
+
+    async def submit(self, message: dict) -> dict:
+        """
+        Validate a result message and wait until it is saved.
+
+        Args:
+            message (dict): The decoded message (see the module docstring).
+
+        Returns:
+            dict: The answer ('id', 'status' and, for errors, 'error').
+        """
+        message_id = message.get('id')
+        if message_id is not None and not isinstance(message_id, (str, int)):
+            answer = {'status': 'error', 'error': "Message id must be a string or an integer."}
+        elif message_id is None:
+            answer = dict(await self._submit(message))
+            answer.pop('retry', None)
+        else:
+            # A retransmit gets the answer of the original, waiting for it if needed
+            future = self.__answers.get(message_id)
+            if future is None:
+                future = asyncio.ensure_future(self._submit(message))
+                self.__answers[message_id] = future
+                if len(self.__answers) > MAX_REMEMBERED_IDS:
+                    self.__answers.popitem(last=False)
+            answer = dict(await asyncio.shield(future))
+            if answer.pop('retry', False) and self.__answers.get(message_id) is future:
+                # Transient failure: a retransmit must be tried again, not get this answer
+                del self.__answers[message_id]
+            answer['id'] = message_id
+
+        self.stats[answer['status']] += 1
+        return answer
+
+    async def _submit(self, message: dict) -> dict:
+        """
+        Validate and queue one message, then wait for its result to be saved.
+
+        Answers to transient failures (full queue, unreadable or unwritable
+        data file) carry 'retry': True so that submit() does not remember them.
+        """
+        try:
+            key, result = await self._validate(message)
+        except _Duplicate:
+            return {'status': 'duplicate'}
+        except DataFileError as e:
+            return {'status': 'error', 'error': str(e), 'retry': True}
+        except ValueError as e:
+            return {'status': 'error', 'error': str(e)}
+        except OSError as e:
+            return {'status': 'error', 'error': f"Could not read tournament data: {e}", 'retry': True}
+
+        pending = self.__pending.get(key)
+        if pending is not None:
+            if pending[0] != result:
+                return {'status': 'error', 'error': f"Board {key[2] + 1} already has a different result waiting to be saved."}
+            answer = await asyncio.shield(pending[1])
+            return {'status': 'duplicate'} if answer['status'] == 'ok' else answer
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.__queue.put_nowait((key, result))
+        except asyncio.QueueFull:
+            return {'status': 'error', 'error': "Too many results waiting, try again.", 'retry': True}
+        self.__pending[key] = (result, future)
+        return await asyncio.shield(future)
+
+    async def _validate(self, message: dict) -> tuple:
+        """
+        Check a message against the pairings of its round.
+
+        Returns:
+            tuple: ((tournament, round, match index), normalized result).
+
+        Raises:
+            ValueError: If the message is malformed, does not match the pairings,
+                or conflicts with a recorded result.
+        """
+        from src.cli import RESULT_ALIASES
+
+        tournament_name = message.get('tournament')
+        round_number = message.get('round')
+        board = message.get('board')
+        result = message.get('result')
+        result = RESULT_ALIASES.get(result) if isinstance(result, str) else None
+        if not isinstance(tournament_name, str) or not tournament_name:
+            raise ValueError("Missing tournament.")
+        if not isinstance(round_number, int) or not isinstance(board, int) or board < 1:
+            raise ValueError("Round and board must be positive integers.")
+        if result is None:
+            raise ValueError(f"Invalid result '{message.get('result')}'.")
+
+        state = await self._round_state(tournament_name, round_number)
+        if board > len(state.boards):
+            raise ValueError(f"Round {round_number} has only {len(state.boards)} boards.")
+        index = board - 1
+        white, black = state.boards[index]
+        if black is None:
+            raise ValueError(f"Board {board} is a bye.")
+        for side, expected in (('white', white), ('black', black)):
+            if message.get(side) is not None and message[side] != expected:
+                raise ValueError(f"Board {board} {side} is {expected}, not {message[side]}.")
+
+        recorded = state.results[index]
+        if recorded == result:
+            raise _Duplicate()
+        if recorded is not None and not message.get('correction'):
+            raise ValueError(f"Board {board} already has result {recorded}; send 'correction': true to replace it.")
+        return (tournament_name, round_number, index), result
+
+    async def _round_state(self, tournament_name: str, round_number: int) -> _RoundState:
+        """Get the pairings and results of a round, reading the file only when someone else changed it."""
+        state = self.__rounds.get((tournament_name, round_number))
+        signature = self.controller._file_signature()
+        if state is not None and state.signature == signature:
+            return state
+
+        loop = asyncio.get_running_loop()
+        tournament = await loop.run_in_executor(self.__pool, self.controller._get_cached_tournament, tournament_name)
+        round_obj = tournament.get_round(round_number)
+        if round_obj is None:
+            raise ValueError(f"Round {round_number} not found in tournament.")
+        boards = [
+            (game.white.name, None if game.black is None or game.black.name == game.white.name else game.black.name)
+            for game in round_obj.matches
+        ]
+        state = _RoundState(signature, boards, [game.result for game in round_obj.matches])
+        self.__rounds[(tournament_name, round_number)] = state
+        return state
+
+    async def _write_loop(self) -> None:
+        """Drain the queue in batches, one update_match_results call per round."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.__queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                if self.__queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.__queue.get_nowait())
+
+            rounds = {}
+            for (tournament_name, round_number, index), result in batch:
+                rounds.setdefault((tournament_name, round_number), {})[index] = result
+            self.stats['batches'] += 1
+            if METRICS.enabled:
+                METRICS.count('ingest.batches')
+                METRICS.count('ingest.results', len(batch))
+
+            for (tournament_name, round_number), results in rounds.items():
+                try:
+                    signature = await loop.run_in_executor(
+                        self.__pool, self._write, tournament_name, round_number, results)
+                    answer = {'status': 'ok'}
+                    state = self.__rounds.get((tournament_name, round_number))
+                    if state is not None:
+                        for index, result in results.items():
+                            state.results[index] = result
+                        state.signature = signature
+                except Exception as e:
+                    # The writer must survive a failed write (disk full, permissions, a file
+                    # changed by someone else): its clients are told to retry, and the round
+                    # is read again for their next attempt
+                    answer = {'status': 'error', 'error': f"Could not save results: {e}", 'retry': True}
+                    self.__rounds.pop((tournament_name, round_number), None)
+                self.stats['writes'] += 1
+                for index in results:
+                    _, future = self.__pending.pop((tournament_name, round_number, index))
+                    if not future.done():
+                        future.set_result(answer)
+
+            for _ in batch:
+                self.__queue.task_done()
+
+    def _write(self, tournament_name: str, round_number: int, results: dict):
+        """Save the results of one round (runs in the file thread); returns the new file signature."""
+        self.controller.update_match_results(tournament_name, round_number, results)
+        return self.controller._file_signature()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the message lines of one client; messages of a connection are handled concurrently."""
+        tasks = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError
+            except ValueError:
+                response = {'status': 'error', 'error': "Each line must be a JSON object."}
+                self.stats['error'] += 1
+            else:
+                response = await self.submit(message)
+            writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.ensure_future(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 7000, unix_path: str | None = None) -> None:
+        """
+        Accept connections until cancelled.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): TCP port to listen on.
+            unix_path (str | None): Listen on this Unix socket instead of TCP.
+        """
+        self.start()
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, unix_path, limit=MAX_LINE_BYTES)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
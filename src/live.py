@@ -0,0 +1,255 @@
+"""
+Live standings over Server-Sent Events, fed by the change events of the controllers.
+
+GET /tournaments/<name>/live (served by src/server.py) opens a text/event-stream:
+    event: snapshot   {"standings": [...]}         on connect, and after falling behind
+    event: pairings   {"round", "boards": [...]}   a new round was paired
+    event: results    {"round", "boards": [...]}   boards whose result changed
+    event: standings  {"changed": [...], "players"} entries whose position, score or games changed
+
+Results arriving in a burst are coalesced into one results and one standings
+event per tournament, each encoded once and shared by every subscriber.
+"""
+import asyncio
+import json
+from collections import deque
+
+from src.server import board_dict, standings_dicts
+from src.utils.pubsub import BROKER
+
+HEARTBEAT_S = 15.0
+
+
+def encode_event(name: str, data) -> bytes:
+    """Encode one Server-Sent Event."""
+    return f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+class _Subscriber:
+    """One connected client: its backlog of encoded events and a wakeup flag."""
+
+    __slots__ = ('queue', 'wakeup', 'behind', 'closed')
+
+    def __init__(self):
+        self.queue = deque()
+        self.wakeup = asyncio.Event()
+        self.behind = True  # send a snapshot before anything else
+        self.closed = False
+
+
+class _Channel:
+    """The subscribers of one tournament, the standings they have and the changes not yet sent."""
+
+    def __init__(self):
+        self.subscribers = set()
+        self.standings = None       # standings dicts as last sent
+        self.snapshot = None        # encoded snapshot of those standings
+        self.tournament = None      # latest published Tournament
+        self.pairings = []          # rounds paired since the last flush
+        self.results = {}           # round -> set of changed match indexes
+        self.flush_handle = None
+
+
+class LiveHub:
+    """
+    Push channel of standings and results to SSE subscribers, in one asyncio loop.
+
+    Slow clients do not hold anybody back: each subscriber has its own backlog,
+    and one that exceeds max_backlog events is dropped back to a fresh snapshot
+    once it catches up, so its memory use stays bounded.
+    """
+
+    def __init__(self, snapshot_provider, coalesce_s: float = 0.2, max_backlog: int = 32, watch_s: float = 2.0):
+        """
+        Initialize a LiveHub.
+
+        Args:
+            snapshot_provider: Async callable (tournament name) -> standings dicts
+                (see standings_dicts); raises ValueError for unknown tournaments.
+            coalesce_s (float): How long changes are gathered before being sent.
+            max_backlog (int): Events a subscriber may have pending before it is resynchronized.
+            watch_s (float): Interval of the check for standings changed by other
+                processes (e.g. the terminal interface), which publish no events here.
+        """
+        self.snapshot_provider = snapshot_provider
+        self.coalesce_s = coalesce_s
+        self.max_backlog = max_backlog
+        self.watch_s = watch_s
+        self.__channels = {}
+        self.__loop = None
+        self.__watcher = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of connected subscribers."""
+        return sum(len(channel.subscribers) for channel in self.__channels.values())
+
+    def start(self) -> None:
+        """Start receiving controller events; must be called from the running loop."""
+        self.__loop = asyncio.get_running_loop()
+        BROKER.subscribe(self._on_publish)
+        self.__watcher = self.__loop.create_task(self._watch())
+
+    def stop(self) -> None:
+        """Stop receiving controller events."""
+        BROKER.unsubscribe(self._on_publish)
+        if self.__watcher is not None:
+            self.__watcher.cancel()
+            self.__watcher = None
+
+    def _on_publish(self, topic: str, event: dict) -> None:
+        """Broker callback, called in the thread that saved the change."""
+        self.__loop.call_soon_threadsafe(self._queue_event, topic, event)
+
+    def _queue_event(self, topic: str, event: dict) -> None:
+        channel = self.__channels.get(topic)
+        if channel is None:
+            return
+        channel.tournament = event['tournament']
+        if event['type'] == 'pairings':
+            channel.pairings.append(event['round'])
+        else:
+            channel.results.setdefault(event['round'], set()).update(event['matches'])
+        if channel.flush_handle is None:
+            channel.flush_handle = self.__loop.call_later(self.coalesce_s, self._flush, topic)
+
+    def _flush(self, topic: str) -> None:
+        """Send the changes gathered for a tournament, with the resulting standings delta."""
+        channel = self.__channels.get(topic)
+        if channel is None:
+            return
+        channel.flush_handle = None
+        tournament = channel.tournament
+        messages = []
+
+        for round_number in channel.pairings:
+            round_obj = tournament.get_round(round_number)
+            if round_obj is not None:
+                messages.append(encode_event('pairings', {
+                    'round': round_number,
+                    'boards': [board_dict(board, g.white, g.black, g.result)
+                               for board, g in enumerate(round_obj.matches, 1)],
+                }))
+        for round_number, match_indexes in sorted(channel.results.items()):
+            round_obj = tournament.get_round(round_number)
+            if round_obj is not None:
+                matches = round_obj.matches
+                messages.append(encode_event('results', {
+                    'round': round_number,
+                    'boards': [board_dict(i + 1, matches[i].white, matches[i].black, matches[i].result)
+                               for i in sorted(match_indexes) if i < len(matches)],
+                }))
+        channel.pairings = []
+        channel.results = {}
+
+        standings = standings_dicts(tournament.get_standings(), tournament.time_control.value)
+        delta = self._standings_delta(channel, standings)
+        if delta is not None:
+            messages.append(delta)
+        self._broadcast(channel, messages)
+
+    @staticmethod
+    def _standings_delta(channel: _Channel, standings: list) -> bytes | None:
+        """Replace the standings of a channel, returning the encoded delta or None if nothing changed."""
+        previous = {entry['player']: entry for entry in channel.standings or []}
+        changed = [entry for entry in standings if previous.get(entry['player']) != entry]
+        channel.standings = standings
+        channel.snapshot = None
+        if not changed and len(previous) == len(standings):
+            return None
+        return encode_event('standings', {'changed': changed, 'players': len(standings)})
+
+    def _broadcast(self, channel: _Channel, messages: list) -> None:
+        if not messages:
+            return
+        for subscriber in channel.subscribers:
+            if subscriber.behind:
+                continue
+            if len(subscriber.queue) + len(messages) > self.max_backlog:
+                # Too slow: skip the backlog and resend the whole standings when it catches up
+                subscriber.queue.clear()
+                subscriber.behind = True
+            else:
+                subscriber.queue.extend(messages)
+            subscriber.wakeup.set()
+
+    async def _watch(self) -> None:
+        """Push standings changed by writes this process did not see."""
+        while True:
+            await asyncio.sleep(self.watch_s)
+            for topic, channel in list(self.__channels.items()):
+                if channel.flush_handle is not None or channel.standings is None:
+                    continue
+                try:
+                    standings = await self.snapshot_provider(topic)
+                except ValueError:
+                    continue
+                if self.__channels.get(topic) is channel and channel.flush_handle is None:
+                    delta = self._standings_delta(channel, standings)
+                    if delta is not None:
+                        self._broadcast(channel, [delta])
+
+    @staticmethod
+    async def _wait_closed(reader: asyncio.StreamReader, subscriber: _Subscriber) -> None:
+        """Wake a subscriber up when its client closes the connection."""
+        try:
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        subscriber.closed = True
+        subscriber.wakeup.set()
+
+    async def stream(self, tournament_name: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one subscriber until it disconnects.
+
+        Args:
+            tournament_name (str): The tournament to follow.
+            reader (asyncio.StreamReader): The client connection, read only to notice it closing.
+            writer (asyncio.StreamWriter): The client connection; the response
+                headers are written here once the tournament is known.
+
+        Raises:
+            ValueError: If the tournament is not found (nothing is written then).
+        """
+        channel = self.__channels.get(tournament_name)
+        if channel is None or channel.standings is None:
+            standings = await self.snapshot_provider(tournament_name)
+            channel = self.__channels.setdefault(tournament_name, _Channel())
+            if channel.standings is None:
+                channel.standings = standings
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        subscriber = _Subscriber()
+        channel.subscribers.add(subscriber)
+        closing = asyncio.get_running_loop().create_task(self._wait_closed(reader, subscriber))
+        try:
+            while not subscriber.closed:
+                subscriber.wakeup.clear()
+                chunks = []
+                if subscriber.behind:
+                    subscriber.behind = False
+                    if channel.snapshot is None:
+                        channel.snapshot = encode_event('snapshot', {'standings': channel.standings})
+                    chunks.append(channel.snapshot)
+                chunks.extend(subscriber.queue)
+                subscriber.queue.clear()
+                if chunks:
+                    writer.write(b''.join(chunks))
+                    # A slow client waits here while its backlog builds up
+                    await writer.drain()
+                    continue
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), HEARTBEAT_S)
+                except asyncio.TimeoutError:
+                    writer.write(b": ping\n\n")
+                    await writer.drain()
+        finally:
+            closing.cancel()
+            channel.subscribers.discard(subscriber)
+            if not channel.subscribers and self.__channels.get(tournament_name) is channel:
+                if channel.flush_handle is not None:
+                    channel.flush_handle.cancel()
+                del self.__channels[tournament_name]
@@ -0,0 +1,429 @@
+"""
+Local HTTP/JSON API over the controllers, built on asyncio (standard library only).
+
+Endpoints (tournament names are URL-encoded, boards are numbered from 1):
+    GET  /tournaments?offset=0&limit=20&filter=texto
+    GET  /tournaments/<name>
+    GET  /tournaments/<name>/rounds/<n>
+    GET  /tournaments/<name>/standings?round=<n>&limit=<k>
+    GET  /tournaments/<name>/live                   Server-Sent Events (see src/live.py)
+    POST /tournaments/<name>/pairings               {"time_budget": 2.0} (optional)
+    POST /tournaments/<name>/rounds/<n>/results     {"results": {"3": "1-0", "5": "1/2-1/2"}}
+
+GET responses are kept in a hot cache until tournaments.json changes, so
+spectators polling the standings cost a stat() and a dict lookup; clients that
+send If-None-Match with the ETag they already have get an empty 304.
+
+Examples:
+    python main.py serve --port 8000
+    python main.py serve --unix /tmp/xadrez.sock
+"""
+import asyncio
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from src.controllers.base_controller import DataFileError
+from src.controllers.tournament_controller import TournamentController
+from src.dtos.tournament_dto import TournamentDTO
+from src.entities.arena_tournament import ArenaTournament
+from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.round_robin_tournament import RoundRobinTournament
+from src.entities.swiss_tournament import SwissTournament
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 1024 * 1024
+MAX_CACHED_RESPONSES = 1024
+
+
+class ApiError(ValueError):
+    """An error answered with a specific HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def tournament_type(tournament) -> str:
+    """Get the type name of a tournament, as stored in tournaments.json."""
+    if isinstance(tournament, SwissTournament):
+        return 'swiss'
+    if isinstance(tournament, EliminatoryTournament):
+        return 'eliminatory'
+    if isinstance(tournament, RoundRobinTournament):
+        return 'round_robin'
+    if isinstance(tournament, ArenaTournament):
+        return 'arena'
+    return 'basic'
+
+
+def board_dict(board: int, white, black, result: str | None = None) -> dict:
+    """Describe a board for the API; a bye (no black, or a player paired with itself) has black None."""
+    is_bye = black is None or black.name == white.name
+    return {
+        'board': board,
+        'white': white.name,
+        'black': None if is_bye else black.name,
+        'result': result,
+    }
+
+
+def standings_dicts(entries: list, rating_type: str) -> list:
+    """Describe standings entries ({'player', 'score', 'matches_played'}) for the API."""
+    return [
+        {
+            'position': position,
+            'player': entry['player'].name,
+            'rating': getattr(entry['player'].rating, rating_type),
+            'score': entry['score'],
+            'matches_played': entry['matches_played'],
+        }
+        for position, entry in enumerate(entries, 1)
+    ]
+
+
+def _int_param(query: dict, name: str, default: int | None = None) -> int | None:
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        return int(values[0])
+    except ValueError:
+        raise ApiError(400, f"Parameter '{name}' must be an integer.") from None
+
+
+class ApiServer:
+    """
+    HTTP/JSON front end for TournamentController.
+
+    Reads run in one thread and writes in another, each with its own
+    controller, so the event loop never decodes JSON itself. Writes rewrite
+    the whole tournaments.json and therefore run one at a time; at most
+    max_pending_writes may wait, further ones get 503 so that a burst of
+    submissions cannot pile up unbounded.
+    """
+
+    def __init__(self, data_path: str | None = None, max_pending_writes: int = 64):
+        """
+        Initialize an ApiServer.
+
+        Args:
+            data_path (str | None): Directory of the data files (the controllers' default if None).
+            max_pending_writes (int): Maximum number of writes running or waiting.
+        """
+        self.reader = TournamentController()
+        self.writer = TournamentController()
+        if data_path:
+            self.reader.data_path = self.writer.data_path = data_path.rstrip('/') + '/'
+        self.max_pending_writes = max_pending_writes
+        self.__read_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='api-read')
+        self.__write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='api-write')
+        self.__pending_writes = 0
+        self.__responses = {}  # request target -> (etag, body), for the current file signature
+        self.__building = {}   # request target -> Future of a response being built
+        self.__signature = None
+        self.__generation = 0  # bumped by every write
+
+        from src.live import LiveHub
+        self.live = LiveHub(self._standings_snapshot)
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        self.__read_pool.shutdown(wait=True)
+        self.__write_pool.shutdown(wait=True)
+
+    async def handle(self, method: str, target: str, headers: dict | None = None, body: bytes = b'') -> tuple:
+        """
+        Answer one request, without any network I/O.
+
+        Args:
+            method (str): HTTP method.
+            target (str): Request target (path and query string).
+            headers (dict | None): Request headers, with lower-case names.
+            body (bytes): Request body.
+
+        Returns:
+            tuple: (status, dict of response headers, response body).
+        """
+        headers = headers or {}
+        try:
+            if method == 'GET':
+                etag, content = await self._cached(target)
+                response_headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+                if headers.get('if-none-match') == etag:
+                    return 304, response_headers, b''
+                return 200, response_headers, content
+            if method == 'POST':
+                return 200, {}, self._encode(await self._post(target, body))
+            raise ApiError(405, f"Method {method} not allowed.")
+        except ApiError as e:
+            return e.status, {}, self._encode({'error': str(e)})
+        except DataFileError as e:
+            # A damaged data file is a server fault, not a bad request
+            return 503, {'Retry-After': '1'}, self._encode({'error': str(e)})
+        except ValueError as e:
+            return 400, {}, self._encode({'error': str(e)})
+        except Exception as e:
+            return 500, {}, self._encode({'error': f"{type(e).__name__}: {e}"})
+
+    @staticmethod
+    def _encode(data) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+    async def _cached(self, target: str) -> tuple:
+        """Get (etag, body) of a GET request, building it in the read thread on a miss."""
+        signature = self.reader._file_signature()
+        if signature != self.__signature or len(self.__responses) > MAX_CACHED_RESPONSES:
+            self.__responses = {}
+            self.__signature = signature
+
+        cached = self.__responses.get(target)
+        if cached is not None:
+            return cached
+
+        # Concurrent misses on the same target share one build
+        building = self.__building.get(target)
+        if building is None:
+            generation = self.__generation
+            loop = asyncio.get_running_loop()
+            building = loop.run_in_executor(self.__read_pool, self._build, target)
+            self.__building[target] = building
+            try:
+                cached = await building
+            finally:
+                del self.__building[target]
+            if self.__signature == signature and self.__generation == generation:
+                self.__responses[target] = cached
+            return cached
+        return await building
+
+    async def _standings_snapshot(self, tournament_name: str) -> list:
+        """Get the full standings of a tournament through the response cache (for the live channel)."""
+        _, content = await self._cached(f"/tournaments/{quote(tournament_name, safe='')}/standings")
+        return json.loads(content)
+
+    @staticmethod
+    def _live_tournament(target: str) -> str | None:
+        """Get the tournament name of a /tournaments/<name>/live target, or None for other targets."""
+        parts = urlsplit(target).path.strip('/').split('/')
+        if len(parts) == 3 and parts[0] == 'tournaments' and parts[2] == 'live':
+            return unquote(parts[1])
+        return None
+
+    def _build(self, target: str) -> tuple:
+        """Compute the body of a GET request (runs in the read thread)."""
+        content = self._encode(self._get(target))
+        return f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"', content
+
+    def _get(self, target: str):
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip('/').split('/')]
+        query = parse_qs(url.query)
+        if parts[0] != 'tournaments':
+            raise ApiError(404, f"Unknown path '{url.path}'.")
+
+        if len(parts) == 1:
+            filter_values = query.get('filter')
+            tournaments, total = self.reader.get_tournaments_page(
+                _int_param(query, 'offset', 0), _int_param(query, 'limit', 20),
+                filter_values[0] if filter_values else None)
+            return {
+                'total': total,
+                'tournaments': [
+                    {
+                        'name': t.name,
+                        'type': tournament_type(t),
+                        'location': t.location,
+                        'start_date': t.start_date,
+                        'end_date': t.end_date,
+                        'time_control': t.time_control.value,
+                        'players': len(t.players),
+                        'rounds': len(t.rounds),
+                    }
+                    for t in tournaments
+                ],
+            }
+
+        self._find_record(self.reader, parts[1])
+        tournament = self.reader._get_cached_tournament(parts[1])
+        if len(parts) == 2:
+            return TournamentDTO.to_dict(tournament)
+        if len(parts) == 3 and parts[2] == 'standings':
+            standings = self.reader.get_standings(
+                tournament.name, _int_param(query, 'round'), _int_param(query, 'limit'))
+            return standings_dicts(standings, tournament.time_control.value)
+        if len(parts) == 4 and parts[2] == 'rounds' and parts[3].isdigit():
+            round_obj = tournament.get_round(int(parts[3]))
+            if round_obj is None:
+                raise ApiError(404, f"Round {parts[3]} not found in tournament.")
+            return {
+                'round': round_obj.round_,
+                'boards': [
+                    board_dict(board, game.white, game.black, game.result)
+                    for board, game in enumerate(round_obj.matches, 1)
+                ],
+            }
+        raise ApiError(404, f"Unknown path '{url.path}'.")
+
+    async def _post(self, target: str, body: bytes):
+        parts = [unquote(part) for part in urlsplit(target).path.strip('/').split('/')]
+        try:
+            payload = json.loads(body) if body.strip() else {}
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ApiError(400, "Request body must be JSON.") from None
+        if not isinstance(payload, dict):
+            raise ApiError(400, "Request body must be a JSON object.")
+
+        if len(parts) == 3 and parts[0] == 'tournaments' and parts[2] == 'pairings':
+            return await self._write(self._pair, parts[1], payload.get('time_budget'))
+        if len(parts) == 5 and parts[0] == 'tournaments' and parts[2] == 'rounds' \
+                and parts[3].isdigit() and parts[4] == 'results':
+            return await self._write(self._enter_results, parts[1], int(parts[3]), self._parse_results(payload))
+        raise ApiError(404, "Unknown path.")
+
+    @staticmethod
+    def _parse_results(payload: dict) -> dict:
+        """Get match index -> result from {"results": {"<board>": "<result>"}} or {"board": n, "result": r}."""
+        from src.cli import RESULT_ALIASES
+
+        if 'results' in payload:
+            entries = payload['results']
+            if not isinstance(entries, dict):
+                raise ApiError(400, "'results' must map board numbers to results.")
+            entries = list(entries.items())
+        else:
+            entries = [(payload.get('board'), payload.get('result'))]
+
+        results = {}
+        for board, result in entries:
+            if not str(board).isdigit() or int(board) < 1:
+                raise ApiError(400, f"Invalid board '{board}'.")
+            if not isinstance(result, str) or RESULT_ALIASES.get(result) is None:
+                raise ApiError(400, f"Invalid result '{result}'.")
+            results[int(board) - 1] = RESULT_ALIASES[result]
+        return results
+
+    async def _write(self, func, *args):
+        """Run a write in the write thread, refusing it when too many are already waiting."""
+        if self.__pending_writes >= self.max_pending_writes:
+            raise ApiError(503, "Too many pending writes, try again.")
+        self.__pending_writes += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.__write_pool, func, *args)
+        finally:
+            self.__pending_writes -= 1
+            # Writes within the same mtime tick would leave the signature unchanged
+            self.__responses = {}
+            self.__generation += 1
+
+    @staticmethod
+    def _find_record(controller, tournament_name: str, round_number: int | None = None) -> dict:
+        """Get the stored record of a tournament, answering 404 if it (or the given round) does not exist."""
+        for record in controller._get_records():
+            if record.get('name') == tournament_name:
+                break
+        else:
+            raise ApiError(404, f"Tournament '{tournament_name}' not found.")
+        if round_number is not None and not any(
+                r.get('round_number') == round_number for r in record.get('rounds_data', [])):
+            raise ApiError(404, f"Round {round_number} not found in tournament.")
+        return record
+
+    def _pair(self, tournament_name: str, time_budget: float | None) -> dict:
+        self._find_record(self.writer, tournament_name)
+        round_number, pairings, _ = self.writer.generate_round_pairings(tournament_name, time_budget)
+        self.writer.save_round_pairings(tournament_name, round_number, pairings)
+        return {
+            'round': round_number,
+            'boards': [board_dict(board, white, black) for board, (white, black) in enumerate(pairings, 1)],
+        }
+
+    def _enter_results(self, tournament_name: str, round_number: int, results: dict) -> dict:
+        self._find_record(self.writer, tournament_name, round_number)
+        updated = self.writer.update_match_results(tournament_name, round_number, results)
+        return {'round': round_number, 'updated': updated}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the HTTP/1.1 requests of one connection (keep-alive until the client closes)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {}, self._encode({'error': "Malformed request line."}), False)
+                    break
+
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                length = int(headers.get('content-length', 0) or 0)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {}, self._encode({'error': "Request body too large."}), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                # A live channel keeps the connection until the client leaves
+                live_tournament = self._live_tournament(target) if method == 'GET' else None
+                if live_tournament is not None:
+                    try:
+                        await self.live.stream(live_tournament, reader, writer)
+                    except ValueError as e:
+                        status = e.status if isinstance(e, ApiError) else 503 if isinstance(e, DataFileError) else 400
+                        await self._respond(writer, status, {}, self._encode({'error': str(e)}), False)
+                    break
+
+                status, response_headers, content = await self.handle(method, target, headers, body)
+                await self._respond(writer, status, response_headers, content, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, headers: dict, content: bytes,
+                       keep_alive: bool) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        if status != 304:
+            lines.append("Content-Type: application/json; charset=utf-8")
+            lines.append(f"Content-Length: {len(content)}")
+        lines.append("Connection: " + ("keep-alive" if keep_alive else "close"))
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + content)
+        await writer.drain()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8000, unix_path: str | None = None) -> None:
+        """
+        Accept connections until cancelled.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): TCP port to listen on.
+            unix_path (str | None): Listen on this Unix socket instead of TCP.
+        """
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+        self.live.start()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.live.stop()
@@ -0,0 +1,359 @@
+"""
+Incremental static website export: HTML and JSON pages of tournaments, rounds and players.
+
+Layout of the output directory:
+    index.html, index.json                          list of tournaments
+    <torneio>/index.html, index.json                standings and rounds
+    <torneio>/rodada-<n>.html, rodada-<n>.json      pairings and results of a round
+    <torneio>/jogadores/<jogador>.html, .json       games and statistics of a player
+    .manifest.json                                  hashes of the last export
+Names that would share a file name (e.g. 'José Silva' and 'Jose Silva') get a
+short hash of the exact name appended to it.
+
+Each page is keyed by a hash of the stored data it is made from (the round,
+the whole tournament, or a player's own games). Pages whose key did not
+change since the last export are neither rendered nor written, so exporting
+after a round rewrites that round, the standings and the players who played,
+not the whole event. Pages that are rendered are still compared with the
+hash of what is on disk before writing, and the writes run in parallel.
+
+Example:
+    python main.py export-site site/
+"""
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from src.controllers.tournament_controller import TournamentController
+from src.server import board_dict, standings_dicts, tournament_type
+from src.utils.name_index import normalize_name
+
+# Part of every page key: bump it when the page layout changes
+EXPORT_VERSION = 1
+MANIFEST_FILE = '.manifest.json'
+
+RESULT_LABELS = {"1-0": "1-0", "0-1": "0-1", "0.5-0.5": "½-½", None: "-"}
+
+
+def slugify(name: str) -> str:
+    """Get a file name for a tournament or player name (e.g. 'Aberto de Verão' -> 'aberto-de-verao')."""
+    return re.sub(r'[^a-z0-9]+', '-', normalize_name(name)).strip('-') or 'sem-nome'
+
+
+def unique_slugs(names) -> dict:
+    """
+    Get a distinct file name for each name.
+
+    Names whose slugs collide (e.g. 'José Silva' and 'Jose Silva') all get a
+    short hash of the exact name appended, so each keeps the same file name
+    whatever order they come in.
+
+    Args:
+        names: Tournament or player names.
+
+    Returns:
+        dict: Name -> slug.
+    """
+    by_slug = {}
+    for name in dict.fromkeys(names):
+        by_slug.setdefault(slugify(name), []).append(name)
+    slugs = {}
+    for slug, group in by_slug.items():
+        for name in group:
+            if len(group) == 1:
+                slugs[name] = slug
+            else:
+                slugs[name] = f"{slug}-{hashlib.blake2b(name.encode('utf-8'), digest_size=3).hexdigest()}"
+    return slugs
+
+
+def data_hash(data) -> str:
+    """Get a short hash of JSON-serializable data."""
+    encoded = json.dumps([EXPORT_VERSION, data], sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+
+def _html_page(title: str, body: list, depth: int = 0) -> str:
+    home = '../' * depth + 'index.html'
+    return "\n".join([
+        "<!DOCTYPE html>",
+        '<html lang="pt-BR">',
+        '<head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">',
+        f"<title>{html.escape(title)}</title>",
+        "<style>body{font-family:sans-serif;margin:1em}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:.2em .6em}</style></head>",
+        f'<body><p><a href="{home}">Torneios</a></p><h1>{html.escape(title)}</h1>',
+        *body,
+        "</body></html>",
+        "",
+    ])
+
+
+def _html_table(header: list, rows: list) -> str:
+    cells = ["<table><tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in header) + "</tr>"]
+    for row in rows:
+        # Cells given as (text, href) become links
+        cells.append("<tr>" + "".join(
+            f'<td><a href="{html.escape(c[1])}">{html.escape(str(c[0]))}</a></td>' if isinstance(c, tuple)
+            else f"<td>{html.escape(str(c))}</td>"
+            for c in row
+        ) + "</tr>")
+    cells.append("</table>")
+    return "\n".join(cells)
+
+
+class SiteExporter:
+    """
+    Writes the static pages of the tournaments, rewriting only the pages whose data changed.
+    """
+
+    def __init__(self, output_dir: str, data_path: str | None = None, workers: int = 8):
+        """
+        Initialize a SiteExporter.
+
+        Args:
+            output_dir (str): Directory of the website.
+            data_path (str | None): Directory of the data files (the controller's default if None).
+            workers (int): Number of threads writing pages.
+        """
+        self.output_dir = output_dir
+        self.controller = TournamentController()
+        if data_path:
+            self.controller.data_path = data_path.rstrip('/') + '/'
+        self.workers = workers
+
+    def export(self, tournament_names: list | None = None) -> dict:
+        """
+        Bring the website up to date with tournaments.json.
+
+        Args:
+            tournament_names (list | None): Export only these tournaments (all if None).
+                The list of tournaments is always refreshed.
+
+        Returns:
+            dict: Counts of pages 'written', 'unchanged' and 'removed'.
+
+        Raises:
+            ValueError: If a named tournament is not found.
+        """
+        manifest = self._load_manifest()
+        records = self.controller._get_records()
+        if tournament_names is not None:
+            known = {record.get('name') for record in records}
+            for name in tournament_names:
+                if name not in known:
+                    raise ValueError(f"Tournament '{name}' not found.")
+
+        pages = {}     # path -> key, for every page of the exported tournaments
+        rendered = {}  # path -> content, for pages whose key changed
+        summaries = []
+        tournament_slugs = unique_slugs(record['name'] for record in records)
+        for record in records:
+            slug = tournament_slugs[record['name']]
+            summaries.append([record['name'], slug, record.get('type', 'basic'), record.get('start_date'),
+                              len(record.get('players', [])), len(record.get('rounds_data', []))])
+            if tournament_names is None or record['name'] in tournament_names:
+                self._tournament_pages(record, slug, manifest, pages, rendered)
+
+        index_key = data_hash(summaries)
+        for extension in ('html', 'json'):
+            pages[f'index.{extension}'] = index_key
+        if any(manifest.get(f'index.{extension}', [None])[0] != index_key for extension in ('html', 'json')):
+            rendered.update(self._render_index(summaries))
+
+        # Skip pages rendered identical to what is on disk (e.g. unchanged standings)
+        writes = []
+        for path, content in rendered.items():
+            content_hash = hashlib.blake2b(content.encode('utf-8'), digest_size=12).hexdigest()
+            previous = manifest.get(path)
+            if previous is None or previous[1] != content_hash or not os.path.exists(self._path(path)):
+                writes.append((path, content))
+            manifest[path] = [pages[path], content_hash]
+
+        # Pages of exported tournaments that no longer exist (deleted rounds, players or tournaments)
+        exported = None if tournament_names is None else {tournament_slugs[name] + '/' for name in tournament_names}
+        removed = [
+            path for path in manifest
+            if path not in pages and (exported is None or any(path.startswith(prefix) for prefix in exported))
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(lambda item: self._write(*item), writes))
+            list(pool.map(self._remove, removed))
+        for path in removed:
+            del manifest[path]
+        self._write(MANIFEST_FILE, json.dumps(manifest, sort_keys=True, indent=1))
+
+        return {'written': len(writes), 'unchanged': len(pages) - len(writes), 'removed': len(removed)}
+
+    def _tournament_pages(self, record: dict, slug: str, manifest: dict, pages: dict, rendered: dict) -> None:
+        """Key every page of a tournament, rendering those whose key changed."""
+        rounds = record.get('rounds_data', [])
+        games_by_player = {}
+        for round_data in rounds:
+            for match in round_data.get('matches', []):
+                games_by_player.setdefault(match['white']['name'], []).append([round_data['round_number'], match])
+                if match.get('black') and match['black']['name'] != match['white']['name']:
+                    games_by_player.setdefault(match['black']['name'], []).append([round_data['round_number'], match])
+
+        # Every name with games gets a slug, so links to players no longer registered stay distinct
+        player_slugs = unique_slugs([player['name'] for player in record.get('players', [])] + list(games_by_player))
+        keys = {f'{slug}/index': data_hash([record, player_slugs])}
+        for round_data in rounds:
+            keys[f"{slug}/rodada-{round_data['round_number']}"] = data_hash([round_data, player_slugs])
+        player_pages = {}  # page -> player name
+        for player in record.get('players', []):
+            page = f"{slug}/jogadores/{player_slugs[player['name']]}"
+            player_pages[page] = player['name']
+            keys[page] = data_hash([player, games_by_player.get(player['name'], [])])
+
+        stale = set()
+        for page, key in keys.items():
+            for extension in ('html', 'json'):
+                path = f'{page}.{extension}'
+                pages[path] = key
+                if manifest.get(path, [None])[0] != key:
+                    stale.add(page)
+        if not stale:
+            return
+
+        # The Tournament objects and statistics are only built when a page has to be rendered
+        tournament = self.controller._hydrate(record)
+        statistics = None
+        for page in stale:
+            kind = page[len(slug) + 1:]
+            if kind == 'index':
+                rendered.update(self._render_tournament(tournament, slug, player_slugs))
+            elif kind.startswith('rodada-'):
+                rendered.update(self._render_round(tournament, slug, int(kind[len('rodada-'):]), player_slugs))
+            else:
+                if statistics is None:
+                    statistics = self.controller._compute_statistics(tournament)
+                player = next(p for p in tournament.players if p.name == player_pages[page])
+                rendered.update(self._render_player(tournament, page, player, statistics[player.name]))
+
+    @staticmethod
+    def _render_index(summaries: list) -> dict:
+        data = [
+            {'name': name, 'page': f'{slug}/index.html', 'type': kind, 'start_date': start_date,
+             'players': players, 'rounds': rounds}
+            for name, slug, kind, start_date, players, rounds in summaries
+        ]
+        rows = [((name, f'{slug}/index.html'), start_date, players, rounds)
+                for name, slug, _, start_date, players, rounds in summaries]
+        return {
+            'index.json': json.dumps(data, ensure_ascii=False, indent=1),
+            'index.html': _html_page("Torneios", [_html_table(["Torneio", "Início", "Jogadores", "Rodadas"], rows)]),
+        }
+
+    @staticmethod
+    def _render_tournament(tournament, slug: str, player_slugs: dict) -> dict:
+        standings = standings_dicts(tournament.get_standings(), tournament.time_control.value)
+        round_numbers = [round_obj.round_ for round_obj in tournament.rounds]
+        data = {
+            'name': tournament.name,
+            'type': tournament_type(tournament),
+            'location': tournament.location,
+            'start_date': tournament.start_date,
+            'end_date': tournament.end_date,
+            'time_control': tournament.time_control.value,
+            'rounds': round_numbers,
+            'standings': standings,
+        }
+        rows = [
+            (entry['position'], (entry['player'], f"jogadores/{player_slugs[entry['player']]}.html"),
+             entry['rating'], entry['score'], entry['matches_played'])
+            for entry in standings
+        ]
+        links = " ".join(f'<a href="rodada-{n}.html">Rodada {n}</a>' for n in round_numbers)
+        body = [
+            f"<p>{html.escape(tournament.location)} - {html.escape(tournament.start_date)} a "
+            f"{html.escape(tournament.end_date)}</p>",
+            f"<p>{links}</p>",
+            "<h2>Classificação</h2>",
+            _html_table(["#", "Jogador", "Rating", "Pontos", "Partidas"], rows),
+        ]
+        return {
+            f'{slug}/index.json': json.dumps(data, ensure_ascii=False, indent=1),
+            f'{slug}/index.html': _html_page(tournament.name, body, depth=1),
+        }
+
+    @staticmethod
+    def _render_round(tournament, slug: str, round_number: int, player_slugs: dict) -> dict:
+        round_obj = tournament.get_round(round_number)
+        boards = [board_dict(board, game.white, game.black, game.result)
+                  for board, game in enumerate(round_obj.matches, 1)]
+        rows = [
+            (b['board'], (b['white'], f"jogadores/{player_slugs[b['white']]}.html"),
+             RESULT_LABELS.get(b['result'], b['result']),
+             (b['black'], f"jogadores/{player_slugs[b['black']]}.html") if b['black'] else "BYE")
+            for b in boards
+        ]
+        title = f"{tournament.name} - Rodada {round_number}"
+        return {
+            f'{slug}/rodada-{round_number}.json': json.dumps(
+                {'tournament': tournament.name, 'round': round_number, 'boards': boards}, ensure_ascii=False, indent=1),
+            f'{slug}/rodada-{round_number}.html': _html_page(
+                title, [_html_table(["Mesa", "Brancas", "Resultado", "Pretas"], rows)], depth=1),
+        }
+
+    @staticmethod
+    def _render_player(tournament, page: str, player, stats: dict) -> dict:
+        games = []
+        for round_obj in tournament.rounds:
+            for board, game in enumerate(round_obj.matches, 1):
+                if game.white.name == player.name or (game.black is not None and game.black.name == player.name):
+                    entry = board_dict(board, game.white, game.black, game.result)
+                    entry['round'] = round_obj.round_
+                    games.append(entry)
+        data = {
+            'tournament': tournament.name,
+            'player': player.name,
+            'rating': {'classic': player.rating.classic, 'rapid': player.rating.rapid, 'blitz': player.rating.blitz},
+            'statistics': {key: value for key, value in stats.items() if key != 'opponents_ratings'},
+            'games': games,
+        }
+        rows = [
+            (g['round'], g['board'], g['white'], RESULT_LABELS.get(g['result'], g['result']), g['black'] or "BYE")
+            for g in games
+        ]
+        body = [
+            f"<p>Pontos: {stats['points']:.1f}/{stats['games_played']} - "
+            f"V/E/D: {stats['wins']}/{stats['draws']}/{stats['losses']} - "
+            f"Performance: {stats['performance_rating']}</p>",
+            _html_table(["Rodada", "Mesa", "Brancas", "Resultado", "Pretas"], rows),
+        ]
+        return {
+            f'{page}.json': json.dumps(data, ensure_ascii=False, indent=1),
+            f'{page}.html': _html_page(
+                f"{player.name} - {tournament.name}", body, depth=2),
+        }
+
+    def _path(self, page: str) -> str:
+        return os.path.join(self.output_dir, *page.split('/'))
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self._path(MANIFEST_FILE), encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _write(self, page: str, content: str) -> None:
+        """Write a page atomically, so that the site never serves a half-written file."""
+        path = self._path(page)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+
+    def _remove(self, page: str) -> None:
+        try:
+            os.remove(self._path(page))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,203 @@
+import gc
+import json
+import time
+import tracemalloc
+
+# Object types always shown in the per-type counts, even when unchanged
+ENTITY_TYPES = (
+    'Player', 'Rating', 'Game', 'Round', 'Bracket', 'Tournament', 'SwissTournament',
+    'EliminatoryTournament', 'RoundRobinTournament', 'ArenaTournament',
+)
+
+
+def count_objects() -> dict:
+    """
+    Count the live objects tracked by the garbage collector, by type name.
+
+    Instances of the entity classes are always tracked; builtin containers
+    such as dicts holding only strings and numbers may not be, so their
+    counts are a lower bound.
+
+    Returns:
+        dict: Type name -> number of live objects.
+    """
+    counts = {}
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+class MemoryTracker:
+    """
+    Takes tracemalloc snapshots around operations and keeps one report per operation run.
+
+    Only the outermost operation is measured: operations called from inside
+    a measured one are part of its report.
+    """
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        """
+        Initialize a MemoryTracker.
+
+        Args:
+            top (int): Number of allocation sites and object types in each report.
+            frames (int): Stack frames stored per allocation; more frames attribute sites better but cost more.
+        """
+        self.top = top
+        self.frames = frames
+        self.__reports = []
+        self.__depth = 0
+
+    @property
+    def reports(self) -> list:
+        """Get the reports of the measured operations, oldest first."""
+        return self.__reports.copy()
+
+    def clear(self) -> None:
+        """Discard the reports."""
+        self.__reports = []
+
+    def run(self, operation: str, func, *args, **kwargs):
+        """
+        Call func(*args, **kwargs), recording a memory report for it.
+
+        The report has the memory still allocated when the call returned (what
+        the result and the caches keep), the peak during the call, the top
+        allocation sites and the change in live objects per type.
+
+        Args:
+            operation (str): Name of the operation in the report.
+            func: The callable to measure.
+
+        Returns:
+            The result of func.
+        """
+        if self.__depth:
+            return func(*args, **kwargs)
+
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(self.frames)
+        gc.collect()
+        objects_before = count_objects()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        self.__depth += 1
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.__depth -= 1
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            if started_here:
+                tracemalloc.stop()
+
+        top_sites = self._top_sites(before, after)
+        del before, after
+        gc.collect()
+        objects_after = count_objects()
+        self.__reports.append({
+            'operation': operation,
+            'elapsed_s': elapsed,
+            'retained_bytes': current - baseline,
+            'peak_bytes': peak - baseline,
+            'top_sites': top_sites,
+            'objects': self._object_changes(objects_before, objects_after),
+        })
+        return result
+
+    def _top_sites(self, before, after) -> list:
+        """Get the allocation sites that grew the most between two snapshots."""
+        ignored = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+        changes = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), 'lineno')
+        return [
+            {'site': str(change.traceback), 'size_bytes': change.size_diff, 'count': change.count_diff}
+            for change in changes[:self.top] if change.size_diff > 0
+        ]
+
+    def _object_changes(self, before: dict, after: dict) -> dict:
+        """Get live objects per type after an operation and how many it added."""
+        names = set(name for name in ENTITY_TYPES if name in after)
+        changed = sorted(after, key=lambda name: -abs(after[name] - before.get(name, 0)))
+        names.update(name for name in changed[:self.top] if after[name] != before.get(name, 0))
+        return {
+            name: {'live': after.get(name, 0), 'added': after.get(name, 0) - before.get(name, 0)}
+            for name in sorted(names)
+        }
+
+    def save(self, path: str) -> None:
+        """Write the reports to a JSON file, to be compared with diff_reports later."""
+        with open(path, 'w') as file:
+            json.dump(self.__reports, file, indent=4)
+
+
+def load_reports(path: str) -> list:
+    """
+    Load reports saved by MemoryTracker.save.
+
+    Raises:
+        ValueError: If the file is not a list of reports.
+    """
+    with open(path) as file:
+        reports = json.load(file)
+    if not isinstance(reports, list):
+        raise ValueError(f"Invalid memory report file: {path}")
+    return reports
+
+
+def diff_reports(old: list, new: list, threshold: float = 0.1) -> list:
+    """
+    Compare two runs operation by operation.
+
+    Operations measured several times are compared by their largest peak.
+
+    Args:
+        old (list): Reports of the reference run.
+        new (list): Reports of the run to check.
+        threshold (float): Relative growth of peak or retained memory counted as a regression.
+
+    Returns:
+        list: One dict per operation present in both runs, with 'operation',
+            'old_peak_bytes', 'new_peak_bytes', 'old_retained_bytes',
+            'new_retained_bytes', 'objects' (type -> change in objects added)
+            and 'regression' (True if peak or retained memory grew past the threshold).
+    """
+    def by_operation(reports: list) -> dict:
+        largest = {}
+        for report in reports:
+            current = largest.get(report['operation'])
+            if current is None or report['peak_bytes'] > current['peak_bytes']:
+                largest[report['operation']] = report
+        return largest
+
+    old_reports, new_reports = by_operation(old), by_operation(new)
+    differences = []
+    for operation, new_report in new_reports.items():
+        old_report = old_reports.get(operation)
+        if old_report is None:
+            continue
+        objects = {}
+        for name in set(old_report['objects']) | set(new_report['objects']):
+            change = (new_report['objects'].get(name, {}).get('added', 0)
+                      - old_report['objects'].get(name, {}).get('added', 0))
+            if change:
+                objects[name] = change
+        regression = any(
+            new_report[key] > max(old_report[key], 0) * (1 + threshold) and new_report[key] - old_report[key] > 1024
+            for key in ('peak_bytes', 'retained_bytes')
+        )
+        differences.append({
+            'operation': operation,
+            'old_peak_bytes': old_report['peak_bytes'],
+            'new_peak_bytes': new_report['peak_bytes'],
+            'old_retained_bytes': old_report['retained_bytes'],
+            'new_retained_bytes': new_report['retained_bytes'],
+            'objects': objects,
+            'regression': regression,
+        })
+    return differences
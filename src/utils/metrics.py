@@ -0,0 +1,188 @@
+import functools
+import json
+import os
+import time
+import types
+
+
+class MetricsRegistry:
+    """
+    In-process registry of operation timings and counters, off unless enabled.
+
+    Timings are kept per operation name (count, total, min and max wall time);
+    counters accumulate numbers such as JSON decode time, bytes read or
+    entities hydrated. While disabled every hook reduces to a single
+    attribute check.
+
+    A memory tracker (see src.utils.memory_diagnostics) can also be attached;
+    timed operations then run under its tracemalloc snapshots.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        # True while timings or memory tracking are on: the only check made by timed() otherwise
+        self.active = enabled
+        self.__memory_tracker = None
+        self.__timings = {}
+        self.__counters = {}
+        self.__profiler = None
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = self.active = True
+
+    def disable(self) -> None:
+        """Stop recording; what was recorded is kept until reset()."""
+        self.enabled = False
+        self.active = self.__memory_tracker is not None
+
+    @property
+    def memory_tracker(self):
+        """Get the memory tracker timed operations run under, or None."""
+        return self.__memory_tracker
+
+    @memory_tracker.setter
+    def memory_tracker(self, tracker) -> None:
+        """Attach a MemoryTracker, or detach it with None."""
+        self.__memory_tracker = tracker
+        self.active = self.enabled or tracker is not None
+
+    def reset(self) -> None:
+        """Discard every timing and counter."""
+        self.__timings = {}
+        self.__counters = {}
+
+    def record(self, operation: str, seconds: float) -> None:
+        """
+        Record one run of an operation.
+
+        Args:
+            operation (str): Name of the operation (e.g. 'TournamentController.get_standings').
+            seconds (float): Its wall time.
+        """
+        entry = self.__timings.get(operation)
+        if entry is None:
+            self.__timings[operation] = [1, seconds, seconds, seconds]
+            return
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds < entry[2]:
+            entry[2] = seconds
+        if seconds > entry[3]:
+            entry[3] = seconds
+
+    def count(self, counter: str, amount: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            counter (str): Name of the counter (e.g. 'json.bytes_read').
+            amount (float): Amount to add.
+        """
+        self.__counters[counter] = self.__counters.get(counter, 0) + amount
+
+    def to_dict(self) -> dict:
+        """
+        Get everything recorded as plain data.
+
+        Returns:
+            dict: {'enabled', 'operations': name -> {'count', 'total_ms', 'mean_ms', 'min_ms', 'max_ms'},
+                'counters': name -> value}, operations by total time, slowest first.
+        """
+        operations = {}
+        for name, (calls, total, fastest, slowest) in sorted(self.__timings.items(), key=lambda item: -item[1][1]):
+            operations[name] = {
+                'count': calls,
+                'total_ms': total * 1000,
+                'mean_ms': total / calls * 1000,
+                'min_ms': fastest * 1000,
+                'max_ms': slowest * 1000,
+            }
+        return {'enabled': self.enabled, 'operations': operations, 'counters': dict(sorted(self.__counters.items()))}
+
+    def dump_json(self, path: str) -> None:
+        """Write to_dict() to a JSON file."""
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+    @property
+    def profiling(self) -> bool:
+        """Whether the cProfile profiler is running."""
+        return self.__profiler is not None
+
+    def start_profile(self) -> None:
+        """
+        Start profiling every call made in this process with cProfile.
+
+        Raises:
+            ValueError: If the profiler is already running.
+        """
+        if self.__profiler is not None:
+            raise ValueError("The profiler is already running.")
+        import cProfile
+        self.__profiler = cProfile.Profile()
+        self.__profiler.enable()
+
+    def stop_profile(self, path: str | None = None, limit: int = 25) -> str:
+        """
+        Stop the profiler and report the functions with the highest cumulative time.
+
+        Args:
+            path (str | None): Also write the raw statistics here, readable with pstats.
+            limit (int): Number of functions in the report.
+
+        Returns:
+            str: The pstats report.
+
+        Raises:
+            ValueError: If the profiler is not running.
+        """
+        if self.__profiler is None:
+            raise ValueError("The profiler is not running.")
+        import io
+        import pstats
+
+        profiler, self.__profiler = self.__profiler, None
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+
+# Enabled from the start with CHESS_METRICS=1, otherwise from the diagnostics menu
+METRICS = MetricsRegistry(enabled=os.environ.get('CHESS_METRICS') == '1')
+
+
+def timed(func):
+    """
+    Decorator recording the wall time of a method as 'ClassName.method' while metrics are enabled.
+
+    While a memory tracker is attached, the call also runs under its snapshots.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not METRICS.active:
+            return func(*args, **kwargs)
+        tracker = METRICS.memory_tracker
+        if not METRICS.enabled:
+            return tracker.run(name, func, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            if tracker is not None:
+                return tracker.run(name, func, *args, **kwargs)
+            return func(*args, **kwargs)
+        finally:
+            METRICS.record(name, time.perf_counter() - start)
+    return wrapper
+
+
+def timed_methods(cls):
+    """Class decorator applying timed to every public method defined in the class (not static or class methods)."""
+    for name, member in list(vars(cls).items()):
+        if not name.startswith('_') and isinstance(member, types.FunctionType):
+            setattr(cls, name, timed(member))
+    return cls
@@ -0,0 +1,312 @@
+import json
+import os
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for searching: strip accents, casefold and collapse whitespace.
+
+    Args:
+        name (str): The name to normalize.
+
+    Returns:
+        str: The normalized name (e.g. 'José  Raúl' -> 'jose raul').
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(stripped.casefold().split())
+
+
+def trigrams(word: str) -> set:
+    """
+    Get the set of trigrams of a normalized word, padded at its boundaries.
+
+    Args:
+        word (str): A word already passed through normalize_name.
+
+    Returns:
+        set: The trigrams of the word.
+    """
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Incremental search index over player names.
+
+    Supports exact, prefix (on the full name or on any word of it) and trigram
+    fuzzy matching, all case and accent insensitive. Entries are identified by
+    their position in the player registry.
+
+    Fuzzy matching works on the vocabulary of distinct words rather than on
+    whole names: registries repeat the same first and last names over and over,
+    so the vocabulary stays small even when the registry is huge.
+    """
+
+    VERSION = 2
+    FUZZY_THRESHOLD = 0.3
+    MAX_WORD_CANDIDATES = 5
+
+    def __init__(self):
+        self.__names = []          # Original names, by id
+        self.__normalized = []     # Normalized names, by id
+        self.__prefix_keys = []    # Sorted normalized word-suffixes of each name
+        self.__prefix_ids = array('I')
+        self.__words = {}          # word -> array of ids of names containing it
+        self.__word_grams = {}     # trigram -> list of vocabulary words containing it
+        self.source = None         # Signature of the registry file the index mirrors
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    @property
+    def names(self) -> list:
+        """Get the indexed names, by id."""
+        return self.__names
+
+    def add(self, name: str) -> int:
+        """
+        Add a name to the index.
+
+        Args:
+            name (str): The player name.
+
+        Returns:
+            int: The id assigned to the name.
+        """
+        player_id = len(self.__names)
+        normalized = normalize_name(name)
+        self.__names.append(name)
+        self.__normalized.append(normalized)
+
+        words = normalized.split(' ')
+        for i in range(len(words)):
+            key = ' '.join(words[i:])
+            pos = bisect_left(self.__prefix_keys, key)
+            self.__prefix_keys.insert(pos, key)
+            self.__prefix_ids.insert(pos, player_id)
+        self.__add_words(player_id, words)
+        return player_id
+
+    def __add_words(self, player_id: int, words: list) -> None:
+        """Register the words of a name in the vocabulary."""
+        for word in set(words):
+            postings = self.__words.get(word)
+            if postings is None:
+                postings = self.__words[word] = array('I')
+                for gram in trigrams(word):
+                    self.__word_grams.setdefault(gram, []).append(word)
+            postings.append(player_id)
+
+    def find_exact(self, name: str) -> int | None:
+        """
+        Find the id of a name, compared after normalization.
+
+        Args:
+            name (str): The name to look up.
+
+        Returns:
+            int | None: The id if the name is indexed, None otherwise.
+        """
+        normalized = normalize_name(name)
+        pos = bisect_left(self.__prefix_keys, normalized)
+        while pos < len(self.__prefix_keys) and self.__prefix_keys[pos] == normalized:
+            player_id = self.__prefix_ids[pos]
+            if self.__normalized[player_id] == normalized:
+                return player_id
+            pos += 1
+        return None
+
+    def containing(self, text: str) -> list:
+        """
+        Get the ids of the names containing a piece of text.
+
+        Args:
+            text (str): Text to look for anywhere in the name.
+
+        Returns:
+            list: Matching ids, in ascending order.
+        """
+        needle = normalize_name(text)
+        return [player_id for player_id, name in enumerate(self.__normalized) if needle in name]
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Search names matching a query.
+
+        Prefix matches rank above fuzzy matches; an exact match ranks first.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: List of tuples (id, score) sorted by decreasing score.
+        """
+        normalized = normalize_name(query)
+        if not normalized or limit <= 0:
+            return []
+
+        scores = {}
+        pos = bisect_left(self.__prefix_keys, normalized)
+        keys = self.__prefix_keys
+        # Collect a few more than needed so that better-ranked matches are not cut off
+        while pos < len(keys) and keys[pos].startswith(normalized) and len(scores) < limit * 4:
+            player_id = self.__prefix_ids[pos]
+            full = self.__normalized[player_id]
+            if full == normalized:
+                score = 3.0
+            elif full.startswith(normalized):
+                score = 2.0
+            else:
+                score = 1.5
+            if score > scores.get(player_id, 0.0):
+                scores[player_id] = score
+            pos += 1
+
+        if len(scores) < limit:
+            for player_id, similarity in self.__fuzzy(normalized.split(' ')).items():
+                if player_id not in scores:
+                    scores[player_id] = similarity
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.__normalized[item[0]]))
+        return ranked[:limit]
+
+    def __similar_words(self, word: str) -> list:
+        """Get (vocabulary word, similarity) pairs close to a query word, best first."""
+        if word in self.__words:
+            return [(word, 1.0)]
+
+        query_grams = trigrams(word)
+        needed = max(1, int(len(query_grams) * self.FUZZY_THRESHOLD + 0.999))
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.__word_grams.get(gram, ()))
+
+        similar = []
+        for candidate, count in shared.items():
+            if count >= needed:
+                similarity = count / len(query_grams | trigrams(candidate))
+                if similarity >= self.FUZZY_THRESHOLD:
+                    similar.append((candidate, similarity))
+        similar.sort(key=lambda item: -item[1])
+        return similar[:self.MAX_WORD_CANDIDATES]
+
+    def __fuzzy(self, query_words: list) -> dict:
+        """
+        Get names whose words approximately match every matchable query word.
+
+        Returns:
+            dict: id -> similarity in (0, 1], the mean of the per-word similarities.
+        """
+        per_word = []
+        for word in query_words:
+            best = {}
+            for candidate, similarity in self.__similar_words(word):
+                for player_id in self.__words[candidate]:
+                    if similarity > best.get(player_id, 0.0):
+                        best[player_id] = similarity
+            if best:
+                per_word.append(best)
+        if not per_word:
+            return {}
+
+        # Intersect starting from the most selective word
+        per_word.sort(key=len)
+        matches = per_word[0]
+        for best in per_word[1:]:
+            matches = {
+                player_id: similarity + best[player_id]
+                for player_id, similarity in matches.items()
+                if player_id in best
+            }
+        return {player_id: total / len(query_words) for player_id, total in matches.items()}
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a compact JSON file (plain data only, so loading it never runs code).
+
+        Args:
+            path (str): Destination file path.
+        """
+        state = {
+            'version': self.VERSION,
+            'source': self.source,
+            'names': self.__names,
+            'normalized': self.__normalized,
+            'prefix_keys': self.__prefix_keys,
+            'prefix_ids': self.__prefix_ids.tolist(),
+            'words': {word: ids.tolist() for word, ids in self.__words.items()},
+            'word_grams': self.__word_grams,
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'NameIndex | None':
+        """
+        Load an index previously written by save().
+
+        Args:
+            path (str): Source file path.
+
+        Returns:
+            NameIndex | None: The index, or None if the file is missing, damaged or
+                of another version; the caller then rebuilds it.
+        """
+        try:
+            with open(path, encoding='utf-8') as file:
+                state = json.load(file)
+            if not isinstance(state, dict) or state.get('version') != cls.VERSION:
+                return None
+
+            index = cls()
+            source = state['source']
+            index.source = tuple(source) if isinstance(source, list) else source
+            index.__names = state['names']
+            index.__normalized = state['normalized']
+            index.__prefix_keys = state['prefix_keys']
+            index.__prefix_ids = array('I', state['prefix_ids'])
+            index.__words = {word: array('I', ids) for word, ids in state['words'].items()}
+            index.__word_grams = state['word_grams']
+        except Exception:
+            # Any unreadable index is just rebuilt from the registry
+            return None
+        if not (len(index.__names) == len(index.__normalized) and len(index.__prefix_keys) == len(index.__prefix_ids)):
+            return None
+        return index
+
+    @classmethod
+    def build(cls, names) -> 'NameIndex':
+        """
+        Build an index from scratch.
+
+        Args:
+            names: Iterable of player names, in registry order.
+
+        Returns:
+            NameIndex: The populated index.
+        """
+        index = cls()
+        entries = []
+        for player_id, name in enumerate(names):
+            normalized = normalize_name(name)
+            index.__names.append(name)
+            index.__normalized.append(normalized)
+            words = normalized.split(' ')
+            for i in range(len(words)):
+                entries.append((' '.join(words[i:]), player_id))
+            index.__add_words(player_id, words)
+
+        # A single sort is much cheaper than inserting names one by one
+        entries.sort()
+        index.__prefix_keys = [key for key, _ in entries]
+        index.__prefix_ids = array('I', (player_id for _, player_id in entries))
+        return index
@@ -0,0 +1,403 @@
+import math
+import os
+import random
+import time
+from collections import deque
+
+# Penalties of the pairing quality function (lower cost is better)
+REMATCH_WEIGHT = 100000    # Players who already met; only used when nothing else is possible
+FLOAT_WEIGHT = 100         # Per squared half-point of score difference
+ABSOLUTE_COLOR_WEIGHT = 50 # Both players must have the same color
+COLOR_WEIGHT = 5           # Both players would rather have the same color
+SPREAD_WEIGHT = 1          # Per rank away from the ideal top-half vs bottom-half opponent
+
+# Up to this many possible pairings, every one is checked instead of searching
+EXHAUSTIVE_LIMIT = 10395   # 12 players
+# Pair cost evaluations the improvement of the deterministic pairing may use
+# without a time budget (a few tenths of a second); rounds of a few hundred
+# players reach a local optimum well within it
+DETERMINISTIC_MAX_EVALUATIONS = 250000
+
+
+class PairingProblem:
+    """
+    Players of a Swiss round to pair, by position in ranking order (score, then rating).
+
+    Only plain lists are kept, so a problem is cheap to send to worker processes.
+    """
+
+    def __init__(self, scores: list, ratings: list, colors: list, opponents: list):
+        """
+        Initialize a PairingProblem.
+
+        Args:
+            scores (list): Score of each player, in ranking order.
+            ratings (list): Rating of each player.
+            colors (list): Colors played so far by each player, as strings of 'W' and 'B'.
+            opponents (list): Positions of the opponents each player already met, as sets.
+        """
+        self.scores = scores
+        self.ratings = ratings
+        self.opponents = opponents
+        self.preferences = [self.color_preference(history) for history in colors]
+
+        # Rank of each player within their score group, and the size of the group
+        self.group_ranks = []
+        self.group_sizes = []
+        start = 0
+        for i in range(1, len(scores) + 1):
+            if i == len(scores) or scores[i] != scores[start]:
+                self.group_ranks.extend(range(i - start))
+                self.group_sizes.extend([i - start] * (i - start))
+                start = i
+
+    def __len__(self) -> int:
+        """Get the number of players."""
+        return len(self.scores)
+
+    @staticmethod
+    def color_preference(history: str) -> int:
+        """
+        Get a player's color preference from the colors they played.
+
+        Args:
+            history (str): Colors played so far, e.g. 'WBW'.
+
+        Returns:
+            int: 2 (must have white), 1 (prefers white), 0 (none), -1 (prefers black) or -2 (must have black).
+        """
+        balance = history.count('W') - history.count('B')
+        if balance < -1 or history[-2:] == 'BB':
+            return 2
+        if balance > 1 or history[-2:] == 'WW':
+            return -2
+        if balance < 0 or (balance == 0 and history.endswith('B')):
+            return 1
+        if balance > 0 or (balance == 0 and history.endswith('W')):
+            return -1
+        return 0
+
+    def pair_cost(self, a: int, b: int) -> int:
+        """
+        Get the cost of pairing two players: rematch, score float, color clash and rating spread.
+
+        Args:
+            a (int): Position of one player.
+            b (int): Position of the other player.
+
+        Returns:
+            int: The cost; 0 is a perfect pairing.
+        """
+        cost = 0
+        if b in self.opponents[a]:
+            cost += REMATCH_WEIGHT
+
+        half_points = round(abs(self.scores[a] - self.scores[b]) * 2)
+        if half_points:
+            cost += half_points * half_points * FLOAT_WEIGHT
+        else:
+            # Inside a score group the ideal opponent is half the group away (S1 vs S2)
+            distance = abs(self.group_ranks[a] - self.group_ranks[b])
+            cost += abs(distance - self.group_sizes[a] // 2) * SPREAD_WEIGHT
+
+        pa, pb = self.preferences[a], self.preferences[b]
+        if pa * pb > 0:
+            cost += ABSOLUTE_COLOR_WEIGHT if abs(pa) == 2 and abs(pb) == 2 else COLOR_WEIGHT
+        return cost
+
+    def total_cost(self, pairs: list) -> int:
+        """
+        Get the cost of a whole round.
+
+        Args:
+            pairs (list): Tuples (a, b) of player positions.
+
+        Returns:
+            int: Sum of the pair costs.
+        """
+        return sum(self.pair_cost(a, b) for a, b in pairs)
+
+    def orient(self, a: int, b: int) -> tuple:
+        """
+        Give colors to a pair: the stronger white preference gets white; ties favor the higher ranked player.
+
+        Args:
+            a (int): Position of one player.
+            b (int): Position of the other player.
+
+        Returns:
+            tuple: (white position, black position).
+        """
+        if a > b:
+            a, b = b, a
+        pa, pb = self.preferences[a], self.preferences[b]
+        if pb > pa or (pb == pa and pa < 0):
+            return b, a
+        return a, b
+
+
+def matching_count(num_players: int) -> int:
+    """
+    Get the number of ways to pair an even number of players: (n - 1)!!.
+
+    Args:
+        num_players (int): Number of players.
+
+    Returns:
+        int: Number of distinct pairings.
+    """
+    count = 1
+    for odd in range(num_players - 1, 0, -2):
+        count *= odd
+    return count
+
+
+def greedy_pairs(problem: PairingProblem, order: list) -> list:
+    """
+    Pair players in the given order, each with the cheapest partner still unpaired.
+
+    Args:
+        problem (PairingProblem): The players to pair.
+        order (list): Positions in the order they pick a partner.
+
+    Returns:
+        list: Tuples (a, b) of player positions.
+    """
+    unpaired = set(order)
+    pairs = []
+    for a in order:
+        if a not in unpaired:
+            continue
+        unpaired.discard(a)
+        b = min(unpaired, key=lambda other: (problem.pair_cost(a, other), other))
+        unpaired.discard(b)
+        pairs.append((a, b))
+    return pairs
+
+
+def improve_pairs(problem: PairingProblem, pairs: list, deadline: float | None = None,
+                  dirty: list | None = None, max_evaluations: int | None = None) -> tuple:
+    """
+    Improve a pairing by exchanging partners between two pairs until no exchange helps.
+
+    Only pairs that changed are checked again against the others, so fixing
+    up a few modified pairs costs far less than a full pass.
+
+    Args:
+        problem (PairingProblem): The players to pair.
+        pairs (list): Tuples (a, b) to start from; improved in place.
+        deadline (float | None): Moment (time.time()) to stop at, even if not at a local optimum.
+        dirty (list | None): Indices of the pairs to check (all if None).
+        max_evaluations (int | None): Pair cost evaluations to stop after, even if not at a local optimum.
+
+    Returns:
+        tuple: (pairs, cost, pair cost evaluations).
+    """
+    costs = [problem.pair_cost(a, b) for a, b in pairs]
+    evaluated = 0
+    queue = deque(range(len(pairs)) if dirty is None else dirty)
+    queued = set(queue)
+    while queue:
+        if deadline is not None and time.time() >= deadline:
+            break
+        if max_evaluations is not None and evaluated >= max_evaluations:
+            break
+        i = queue.popleft()
+        queued.discard(i)
+        for j in range(len(pairs)):
+            if j == i:
+                continue
+            (a, b), (c, d) = pairs[i], pairs[j]
+            current = costs[i] + costs[j]
+            evaluated += 2
+            ac, bd = problem.pair_cost(a, c), problem.pair_cost(b, d)
+            if ac + bd < current:
+                pairs[i], pairs[j], costs[i], costs[j] = (a, c), (b, d), ac, bd
+            else:
+                ad, bc = problem.pair_cost(a, d), problem.pair_cost(b, c)
+                if ad + bc >= current:
+                    continue
+                pairs[i], pairs[j], costs[i], costs[j] = (a, d), (b, c), ad, bc
+            # Both pairs changed: check them again against everyone
+            for k in (i, j):
+                if k not in queued:
+                    queue.append(k)
+                    queued.add(k)
+            break
+    return pairs, sum(costs), evaluated
+
+
+def exhaustive_pairs(problem: PairingProblem) -> tuple:
+    """
+    Find the best pairing by checking every possible one, pruning partial pairings already too costly.
+
+    Args:
+        problem (PairingProblem): The players to pair (an even number, at most a dozen or so).
+
+    Returns:
+        tuple: (pairs, cost, pair cost evaluations).
+    """
+    best = [None, math.inf]
+    evaluated = [0]
+    chosen = []
+
+    def extend(remaining: list, cost: int) -> None:
+        if not remaining:
+            if cost < best[1]:
+                best[0], best[1] = chosen.copy(), cost
+            return
+        a = remaining[0]
+        for k in range(1, len(remaining)):
+            b = remaining[k]
+            pair_cost = cost + problem.pair_cost(a, b)
+            evaluated[0] += 1
+            if pair_cost >= best[1]:
+                continue
+            chosen.append((a, b))
+            extend(remaining[1:k] + remaining[k + 1:], pair_cost)
+            chosen.pop()
+
+    extend(list(range(len(problem))), 0)
+    return best[0], best[1], evaluated[0]
+
+
+def search_pairings(problem: PairingProblem, seed: int, deadline: float, initial: list | None = None) -> tuple:
+    """
+    Look for better pairings until the deadline (one worker's share of the search).
+
+    Iterated local search: starting from the given pairing, or else from a
+    greedy pairing of the ranking order shuffled a little, a few pairs of
+    the best pairing so far are broken up and re-paired at random, then
+    improved by exchanging partners; the result is kept when it is no worse.
+
+    Args:
+        problem (PairingProblem): The players to pair.
+        seed (int): Seed of this worker's random generator.
+        deadline (float): Moment (time.time()) to stop at.
+        initial (list | None): Pairing to start from, as tuples (a, b).
+
+    Returns:
+        tuple: (cost, pairs, pair cost evaluations, iterations).
+    """
+    rng = random.Random(seed)
+    if initial is not None:
+        best_pairs, best_cost = list(initial), problem.total_cost(initial)
+        evaluated, iterations = 0, 0
+    else:
+        order = sorted(range(len(problem)), key=lambda p: p + rng.uniform(0, 4))
+        best_pairs, best_cost, evaluated = improve_pairs(problem, greedy_pairs(problem, order), deadline)
+        evaluated += len(problem)
+        iterations = 1
+
+    while best_cost > 0 and len(best_pairs) > 1 and time.time() < deadline:
+        pairs = list(best_pairs)
+        broken = rng.sample(range(len(pairs)), min(len(pairs), rng.randint(2, 4)))
+        players = [player for i in broken for player in pairs[i]]
+        rng.shuffle(players)
+        for n, i in enumerate(broken):
+            pairs[i] = (players[2 * n], players[2 * n + 1])
+
+        pairs, cost, count = improve_pairs(problem, pairs, deadline, broken)
+        evaluated += count
+        iterations += 1
+        if cost <= best_cost:
+            best_pairs, best_cost = pairs, cost
+    return best_cost, best_pairs, evaluated, iterations
+
+
+def find_best_pairings(problem: PairingProblem, time_budget: float | None = None,
+                       workers: int | None = None) -> tuple:
+    """
+    Find the pairing of a Swiss round with the lowest cost that can be found in time.
+
+    Small rounds are solved exactly. Otherwise a deterministic pairing (greedy
+    in ranking order, then improved) is computed first; with a time budget,
+    worker processes then search for better ones until the deadline, and the
+    best pairing found by anyone is returned. Without a time budget the
+    improvement stops after DETERMINISTIC_MAX_EVALUATIONS, so that very large
+    rounds are still paired quickly.
+
+    Args:
+        problem (PairingProblem): The players to pair (an even number).
+        time_budget (float | None): Seconds the search may take (deterministic pairing only if None).
+        workers (int | None): Worker processes for the timed search (one per CPU if None).
+
+    Returns:
+        tuple: (pairs, stats). Pairs are tuples (white position, black position),
+            ordered by board. Stats is a dict with 'method', 'workers',
+            'time_budget', 'elapsed', 'cost_evaluations' (pair costs computed),
+            'iterations', 'search_space' (number of possible pairings),
+            'optimal' (whether the best cost is proven to be the lowest possible),
+            'initial_cost' and 'best_cost'.
+    """
+    started = time.time()
+    deadline = started + time_budget if time_budget is not None else None
+    stats = {
+        'method': 'local search',
+        'workers': 0,
+        'time_budget': time_budget,
+        'elapsed': 0.0,
+        'cost_evaluations': 0,
+        'iterations': 0,
+        'search_space': matching_count(len(problem)),
+        'optimal': False,
+        'initial_cost': 0,
+        'best_cost': 0,
+    }
+
+    if len(problem) == 0:
+        pairs, cost = [], 0
+    elif stats['search_space'] <= EXHAUSTIVE_LIMIT:
+        pairs, cost, evaluated = exhaustive_pairs(problem)
+        stats['method'] = 'exhaustive'
+        stats['cost_evaluations'] = evaluated
+        stats['optimal'] = True  # Pruned branches are provably worse
+        stats['initial_cost'] = cost
+    else:
+        max_evaluations = DETERMINISTIC_MAX_EVALUATIONS if deadline is None else None
+        pairs, cost, evaluated = improve_pairs(problem, greedy_pairs(problem, list(range(len(problem)))),
+                                               deadline, max_evaluations=max_evaluations)
+        stats['initial_cost'] = cost
+        stats['cost_evaluations'] = evaluated + len(problem)
+        stats['iterations'] = 1
+
+        workers = workers or os.cpu_count() or 1
+        if deadline is not None and cost > 0 and time.time() < deadline:
+            stats['method'] = 'parallel search'
+            stats['workers'] = workers
+            for result in _run_search(problem, pairs, deadline, time_budget, workers):
+                worker_cost, worker_pairs, worker_evaluated, worker_iterations = result
+                stats['cost_evaluations'] += worker_evaluated
+                stats['iterations'] += worker_iterations
+                if worker_pairs is not None and worker_cost < cost:
+                    pairs, cost = worker_pairs, worker_cost
+
+    # No pairing costs less than nothing
+    stats['optimal'] = stats['optimal'] or cost == 0
+    stats['best_cost'] = cost
+    stats['elapsed'] = time.time() - started
+    oriented = [problem.orient(a, b) for a, b in pairs]
+    oriented.sort(key=lambda pair: min(pair))
+    return oriented, stats
+
+
+def _run_search(problem: PairingProblem, initial: list, deadline: float, time_budget: float, workers: int) -> list:
+    """Run search_pairings from the initial pairing in worker processes and collect the results that arrive by the deadline."""
+    # Workers stop a little early so that their results are back by the deadline
+    search_deadline = deadline - max(0.01, 0.05 * time_budget)
+    if workers <= 1:
+        return [search_pairings(problem, 1, search_deadline, initial)]
+
+    # Imported here: the process pool machinery is only needed for timed searches
+    from concurrent.futures import ProcessPoolExecutor, wait
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(search_pairings, problem, seed, search_deadline, initial)
+            for seed in range(1, workers + 1)
+        ]
+        done, _ = wait(futures, timeout=max(0.0, deadline - time.time()))
+        return [future.result() for future in done if future.exception() is None]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
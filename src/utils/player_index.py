@@ -0,0 +1,185 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+RATING_TYPES = ('classic', 'rapid', 'blitz')
+
+
+def birth_year(birthdate: str) -> int:
+    """
+    Extract the year of a 'YYYY-MM-DD' birthdate.
+
+    Args:
+        birthdate (str): The birthdate string.
+
+    Returns:
+        int: The year, or 0 if the birthdate is malformed.
+    """
+    try:
+        return int(birthdate[:4])
+    except (TypeError, ValueError):
+        return 0
+
+
+class PlayerAttributeIndex:
+    """
+    Per-attribute indexes over the player registry.
+
+    Ratings (one index per time control) and birth years are kept as sorted
+    key arrays with a parallel array of player ids, so range queries are two
+    bisections plus a slice. Genders are kept as id lists. Players are
+    identified by their position in the registry.
+    """
+
+    def __init__(self):
+        self.__ratings = {rt: array('i') for rt in RATING_TYPES}        # by id
+        self.__years = array('i')                                       # by id
+        self.__genders = []                                             # by id
+        self.__rating_keys = {rt: array('i') for rt in RATING_TYPES}    # sorted
+        self.__rating_ids = {rt: array('I') for rt in RATING_TYPES}
+        self.__year_keys = array('i')                                   # sorted
+        self.__year_ids = array('I')
+        self.__gender_ids = {}                                          # gender -> ids
+
+    def __len__(self) -> int:
+        return len(self.__years)
+
+    @staticmethod
+    def _insert(keys: array, ids: array, key: int, player_id: int) -> None:
+        """Insert an entry keeping (key, id) order; ids grow, so it goes after equal keys."""
+        pos = bisect_right(keys, key)
+        keys.insert(pos, key)
+        ids.insert(pos, player_id)
+
+    def add(self, record: dict) -> int:
+        """
+        Add a player record, as produced by PlayerDTO.to_dict.
+
+        Args:
+            record (dict): The player record.
+
+        Returns:
+            int: The id assigned to the player.
+        """
+        player_id = len(self.__years)
+        rating = record.get('rating', {})
+        for rt in RATING_TYPES:
+            value = rating.get(rt, 0)
+            self.__ratings[rt].append(value)
+            self._insert(self.__rating_keys[rt], self.__rating_ids[rt], value, player_id)
+
+        year = birth_year(record.get('birthdate', ''))
+        self.__years.append(year)
+        self._insert(self.__year_keys, self.__year_ids, year, player_id)
+
+        gender = str(record.get('gender', '')).strip().lower()
+        self.__genders.append(gender)
+        self.__gender_ids.setdefault(gender, []).append(player_id)
+        return player_id
+
+    @classmethod
+    def build(cls, records: list) -> 'PlayerAttributeIndex':
+        """
+        Build the index for a whole registry, sorting each attribute once.
+
+        Args:
+            records (list): Player records in registry order.
+
+        Returns:
+            PlayerAttributeIndex: The populated index.
+        """
+        index = cls()
+        for player_id, record in enumerate(records):
+            rating = record.get('rating', {})
+            for rt in RATING_TYPES:
+                index.__ratings[rt].append(rating.get(rt, 0))
+            index.__years.append(birth_year(record.get('birthdate', '')))
+            gender = str(record.get('gender', '')).strip().lower()
+            index.__genders.append(gender)
+            index.__gender_ids.setdefault(gender, []).append(player_id)
+
+        ids = range(len(records))
+        for rt in RATING_TYPES:
+            values = index.__ratings[rt]
+            order = sorted(ids, key=values.__getitem__)
+            index.__rating_ids[rt] = array('I', order)
+            index.__rating_keys[rt] = array('i', (values[i] for i in order))
+        order = sorted(ids, key=index.__years.__getitem__)
+        index.__year_ids = array('I', order)
+        index.__year_keys = array('i', (index.__years[i] for i in order))
+        return index
+
+    def query(self, rating_type: str | None = None, min_rating: int | None = None,
+              max_rating: int | None = None, min_birth_year: int | None = None,
+              max_birth_year: int | None = None, gender: str | None = None,
+              limit: int | None = None) -> list:
+        """
+        Find players matching all the given criteria.
+
+        When rating_type is given, results come ordered by that rating
+        (highest first), so limit yields the top-K without sorting. Otherwise
+        they come in registry order.
+
+        Args:
+            rating_type (str | None): 'classic', 'rapid' or 'blitz'; required for rating bounds.
+            min_rating (int | None): Minimum rating, inclusive.
+            max_rating (int | None): Maximum rating, inclusive.
+            min_birth_year (int | None): Earliest birth year, inclusive.
+            max_birth_year (int | None): Latest birth year, inclusive.
+            gender (str | None): Gender to match.
+            limit (int | None): Maximum number of results.
+
+        Returns:
+            list: Player ids.
+
+        Raises:
+            ValueError: If the rating type is invalid or rating bounds are given without it.
+        """
+        if rating_type is not None and rating_type not in RATING_TYPES:
+            raise ValueError("Rating type must be 'classic', 'rapid', or 'blitz'.")
+        if rating_type is None and (min_rating is not None or max_rating is not None):
+            raise ValueError("A rating type is required to filter by rating.")
+
+        filters = []
+        year_range = None
+        if min_birth_year is not None or max_birth_year is not None:
+            year_range = self.__range(self.__year_keys, min_birth_year, max_birth_year)
+            low = min_birth_year if min_birth_year is not None else -2**31
+            high = max_birth_year if max_birth_year is not None else 2**31 - 1
+            years = self.__years
+            filters.append(lambda i: low <= years[i] <= high)
+        gender_ids = None
+        if gender is not None:
+            gender = gender.strip().lower()
+            gender_ids = self.__gender_ids.get(gender, [])
+            genders = self.__genders
+            filters.append(lambda i: genders[i] == gender)
+
+        if rating_type is not None:
+            start, stop = self.__range(self.__rating_keys[rating_type], min_rating, max_rating)
+            ids = self.__rating_ids[rating_type]
+            # Walk the rating range from the top
+            candidates = (ids[pos] for pos in range(stop - 1, start - 1, -1))
+        else:
+            # Scan the most selective index, then restore registry order
+            options = []
+            if year_range is not None:
+                options.append((year_range[1] - year_range[0],
+                                self.__year_ids[year_range[0]:year_range[1]]))
+            if gender_ids is not None:
+                options.append((len(gender_ids), gender_ids))
+            if options:
+                candidates = iter(sorted(min(options, key=lambda option: option[0])[1]))
+            else:
+                candidates = iter(range(len(self)))
+
+        for check in filters:
+            candidates = filter(check, candidates)
+        return list(islice(candidates, limit))
+
+    @staticmethod
+    def __range(keys: array, low: int | None, high: int | None) -> tuple:
+        """Get the [start, stop) positions of keys within [low, high]."""
+        start = bisect_left(keys, low) if low is not None else 0
+        stop = bisect_right(keys, high) if high is not None else len(keys)
+        return start, max(start, stop)
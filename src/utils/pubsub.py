@@ -0,0 +1,56 @@
+import threading
+
+
+class Broker:
+    """
+    In-process publish/subscribe of tournament changes.
+
+    Controllers publish an event after every saved change; subscribers (such
+    as the live standings channel of src/live.py) receive it synchronously in
+    the publishing thread and must hand it off quickly. While nobody is
+    subscribed, publishers skip building events by checking `active`.
+    """
+
+    def __init__(self):
+        self.__subscribers = []
+        self.__lock = threading.Lock()
+        self.active = False
+
+    def subscribe(self, callback) -> None:
+        """
+        Add a subscriber.
+
+        Args:
+            callback: Called as callback(topic, event) for every published event.
+        """
+        with self.__lock:
+            self.__subscribers = self.__subscribers + [callback]
+            self.active = True
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Remove a subscriber added with subscribe().
+
+        Args:
+            callback: The callback to remove.
+        """
+        with self.__lock:
+            self.__subscribers = [c for c in self.__subscribers if c is not callback]
+            self.active = bool(self.__subscribers)
+
+    def publish(self, topic: str, event: dict) -> None:
+        """
+        Deliver an event to every subscriber.
+
+        Args:
+            topic (str): The name of the tournament that changed.
+            event (dict): The change: 'type' ('results' or 'pairings'), 'round',
+                'matches' (indexes of the changed matches, for results) and
+                'tournament' (the saved Tournament object, not to be modified).
+        """
+        for callback in self.__subscribers:
+            callback(topic, event)
+
+
+# Shared by the controllers of the process
+BROKER = Broker()
@@ -0,0 +1,110 @@
+# FIDE rule: a rating difference of more than 400 points is counted as 400
+MAX_RATING_DIFFERENCE = 400
+
+RESULT_SCORES = {
+    "1-0": (1.0, 0.0),
+    "0-1": (0.0, 1.0),
+    "0.5-0.5": (0.5, 0.5),
+}
+
+# Expected score for every integer rating difference from -400 to +400
+_EXPECTED_SCORES = tuple(
+    1 / (1 + 10 ** (-difference / 400))
+    for difference in range(-MAX_RATING_DIFFERENCE, MAX_RATING_DIFFERENCE + 1)
+)
+
+# FIDE table 8.1(a): rating difference dp for a percentage score p >= 0.50,
+# indexed by round(p * 100) - 50. Scores below 50% use -dp(1 - p).
+_FIDE_DP = (
+    0, 7, 14, 21, 29, 36, 43, 50, 57, 65,
+    72, 80, 87, 95, 102, 110, 117, 125, 133, 141,
+    149, 158, 166, 175, 184, 193, 202, 211, 220, 230,
+    240, 251, 262, 273, 284, 296, 309, 322, 336, 351,
+    366, 383, 401, 422, 444, 470, 501, 538, 589, 677,
+    800,
+)
+
+# dp for every percentage from 0 to 100
+_DP_BY_PERCENT = tuple(
+    _FIDE_DP[percent - 50] if percent >= 50 else -_FIDE_DP[50 - percent]
+    for percent in range(101)
+)
+
+
+def expected_score(rating_difference: float) -> float:
+    """
+    Get the expected score of a player against an opponent.
+
+    Args:
+        rating_difference (float): Player rating minus opponent rating.
+
+    Returns:
+        float: Expected score between 0 and 1.
+    """
+    difference = round(rating_difference)
+    if difference > MAX_RATING_DIFFERENCE:
+        difference = MAX_RATING_DIFFERENCE
+    elif difference < -MAX_RATING_DIFFERENCE:
+        difference = -MAX_RATING_DIFFERENCE
+    return _EXPECTED_SCORES[difference + MAX_RATING_DIFFERENCE]
+
+
+def expected_scores(rating_differences: list) -> list:
+    """
+    Get the expected scores for a batch of rating differences.
+
+    Args:
+        rating_differences (list): Player rating minus opponent rating, per game.
+
+    Returns:
+        list: Expected scores, in the same order.
+    """
+    table = _EXPECTED_SCORES
+    low, high = -MAX_RATING_DIFFERENCE, MAX_RATING_DIFFERENCE
+    return [
+        table[(high if d > high else low if d < low else d) + high]
+        for d in map(round, rating_differences)
+    ]
+
+
+def performance_dps(score_fractions: list) -> list:
+    """
+    Get the FIDE rating differences dp for a batch of fractional scores.
+
+    The performance rating of a player is the average rating of their
+    opponents plus their dp.
+
+    Args:
+        score_fractions (list): Points divided by games (between 0 and 1), per player.
+
+    Returns:
+        list: dp values (from -800 for 0% to +800 for 100%), in the same order.
+    """
+    table = _DP_BY_PERCENT
+    return [table[round(fraction * 100)] for fraction in score_fractions]
+
+
+def k_factor(rating: int, age: int | None, time_control: str) -> int:
+    """
+    Get the development coefficient K of a player, following the FIDE rules.
+
+    Rapid and blitz ratings always use K = 20. For classical ratings, players
+    under 18 rated below 2300 use K = 40, players who never reached 2400 use
+    K = 20 and the others K = 10. Rating history is not stored, so the current
+    rating stands in for "has ever reached 2400".
+
+    Args:
+        rating (int): The player's rating before the rating period.
+        age (int | None): Age reached during the rating period (None if unknown).
+        time_control (str): 'classic', 'rapid' or 'blitz'.
+
+    Returns:
+        int: The K-factor.
+    """
+    if time_control != 'classic':
+        return 20
+    if age is not None and age < 18 and rating < 2300:
+        return 40
+    if rating < 2400:
+        return 20
+    return 10
@@ -0,0 +1,294 @@
+import os
+import random
+
+from src.utils.rating_math import RESULT_SCORES, expected_score
+
+# Share of the non-decisive expectation that ends in a draw: at equal ratings
+# 30% of the games are drawn, fewer as the rating gap (and so the favorite's edge) grows
+DRAW_RATE = 0.3
+
+
+def build_model(tournament) -> dict:
+    """
+    Capture the state of a tournament as plain data for the simulation workers.
+
+    Players are referred to by their position in tournament.players. Scores
+    are kept in half-points so that runs only add small integers.
+
+    Args:
+        tournament: A Swiss, round-robin, eliminatory or basic Tournament.
+
+    Returns:
+        dict: The model, with keys 'mode', 'ratings', 'scores', 'pending',
+            'opponents', 'had_bye' and a mode-specific 'remaining' entry.
+
+    Raises:
+        ValueError: If the tournament type cannot be simulated or has no players.
+    """
+    from src.entities.swiss_tournament import SwissTournament
+    from src.entities.eliminatory_tournament import EliminatoryTournament
+    from src.entities.round_robin_tournament import RoundRobinTournament
+    from src.entities.arena_tournament import ArenaTournament
+
+    if isinstance(tournament, ArenaTournament):
+        raise ValueError("Arena tournaments cannot be simulated: their pairings depend on game timing.")
+
+    players = tournament.players
+    if len(players) < 2:
+        raise ValueError("At least 2 players are required to simulate a tournament.")
+
+    rating_type = tournament.time_control.value
+    position = {p.name: i for i, p in enumerate(players)}
+    model = {
+        'mode': 'fixed',
+        'ratings': [getattr(p.rating, rating_type) for p in players],
+        'scores': [0] * len(players),
+        'pending': [],
+        'opponents': [set() for _ in players],
+        'had_bye': [False] * len(players),
+        'remaining': None,
+    }
+
+    scores = model['scores']
+    for round_obj in tournament.rounds:
+        for match in round_obj.matches:
+            w = position.get(match.white.name)
+            if match.black is None or match.black.name == match.white.name:
+                if w is not None:
+                    scores[w] += 2
+                    model['had_bye'][w] = True
+                continue
+            b = position.get(match.black.name)
+            if w is None or b is None:
+                continue
+            model['opponents'][w].add(b)
+            model['opponents'][b].add(w)
+            result = RESULT_SCORES.get(match.result)
+            if result is None:
+                model['pending'].append((w, b))
+            else:
+                scores[w] += round(result[0] * 2)
+                scores[b] += round(result[1] * 2)
+
+    if isinstance(tournament, SwissTournament):
+        model['mode'] = 'swiss'
+        model['remaining'] = max(0, tournament.num_rounds - len(tournament.rounds))
+    elif isinstance(tournament, RoundRobinTournament):
+        schedule = tournament.generate_schedule()[len(tournament.rounds):]
+        model['remaining'] = [
+            [(position[w.name], position[b.name] if b is not None else None) for w, b in pairings]
+            for pairings in schedule
+        ]
+    elif isinstance(tournament, EliminatoryTournament):
+        model['mode'] = 'knockout'
+        model['pending'] = []
+        model['remaining'] = _knockout_state(tournament, position)
+    return model
+
+
+def _knockout_state(tournament, position: dict) -> dict:
+    """Get the wins so far and the first undecided bracket round, by player position."""
+    from src.entities.bracket import Bracket
+
+    bracket = tournament.bracket
+    if bracket is None:
+        bracket = Bracket.seeded(tournament.get_players_by_rating(tournament.time_control.value))
+
+    wins = [0] * len(position)
+    current = None
+    for matches in bracket.get_rounds():
+        entries = []
+        for player_a, player_b, winner in matches:
+            if winner is not None:
+                wins[position[winner.name]] += 1
+            entries.append(tuple(position[p.name] if p is not None else None for p in (player_a, player_b, winner)))
+        if current is None and any(winner is None for _, _, winner in entries):
+            current = entries
+    return {'wins': wins, 'current': current or []}
+
+
+def simulate_runs(model: dict, runs: int, seed: int | None) -> list:
+    """
+    Play out the rest of a tournament many times (one worker's share).
+
+    Args:
+        model (dict): The model from build_model().
+        runs (int): Number of simulated tournaments.
+        seed (int | None): Seed of the random generator.
+
+    Returns:
+        list: counts[player][place - 1], how often each player finished in each place.
+    """
+    rng = random.Random(seed)
+    ratings = model['ratings']
+    n = len(ratings)
+    counts = [[0] * n for _ in range(n)]
+
+    # Cumulative outcome thresholds per pair (white win, white win or draw), filled on demand
+    thresholds = {}
+    knockout = model['mode'] == 'knockout'
+
+    def play(a: int, b: int) -> int:
+        """Sample a game; returns a's score in half-points."""
+        key = (a, b)
+        limits = thresholds.get(key)
+        if limits is None:
+            expected = expected_score(ratings[a] - ratings[b])
+            draw = 0.0 if knockout else DRAW_RATE * (1 - abs(2 * expected - 1))
+            win = expected - draw / 2
+            limits = thresholds[key] = (win, win + draw)
+        r = rng.random()
+        return 2 if r < limits[0] else 1 if r < limits[1] else 0
+
+    rating_order = sorted(range(n), key=ratings.__getitem__, reverse=True)
+
+    for _ in range(runs):
+        if knockout:
+            key = _play_knockout(model['remaining'], play)
+        else:
+            scores = list(model['scores'])
+            for a, b in model['pending']:
+                score = play(a, b)
+                scores[a] += score
+                scores[b] += 2 - score
+            if model['mode'] == 'swiss':
+                _play_swiss(model, scores, play, rating_order)
+            elif model['remaining']:
+                for pairings in model['remaining']:
+                    for a, b in pairings:
+                        if b is None:
+                            scores[a] += 2
+                        else:
+                            score = play(a, b)
+                            scores[a] += score
+                            scores[b] += 2 - score
+            key = scores
+
+        # Places by score, then rating, as in Tournament.get_standings
+        standings = sorted(rating_order, key=key.__getitem__, reverse=True)
+        for place, i in enumerate(standings):
+            counts[i][place] += 1
+    return counts
+
+
+def _play_swiss(model: dict, scores: list, play, rating_order: list) -> None:
+    """
+    Simulate the remaining Swiss rounds, re-pairing by score after each one.
+
+    Pairing is a fast approximation of the real one: players are ranked by
+    score and rating, and each takes the next ranked player they have not met.
+    """
+    base_opponents = model['opponents']
+    extra = [[] for _ in scores]
+    had_bye = list(model['had_bye'])
+    for _ in range(model['remaining']):
+        # Stable sort: players on equal scores stay in rating order
+        order = sorted(rating_order, key=scores.__getitem__, reverse=True)
+        if len(order) % 2:
+            # Bye for the lowest ranked player who has not had one
+            bye = next((i for i in reversed(order) if not had_bye[i]), order[-1])
+            order.remove(bye)
+            had_bye[bye] = True
+            scores[bye] += 2
+
+        paired = set()
+        last = len(order)
+        for x in range(last):
+            a = order[x]
+            if a in paired:
+                continue
+            met = base_opponents[a]
+            met_now = extra[a]
+            b = None
+            for y in range(x + 1, last):
+                candidate = order[y]
+                if candidate not in paired and candidate not in met and candidate not in met_now:
+                    b = candidate
+                    break
+            if b is None:
+                # Everyone left already met a: allow the rematch
+                b = next(order[y] for y in range(x + 1, last) if order[y] not in paired)
+            paired.add(a)
+            paired.add(b)
+            score = play(a, b)
+            scores[a] += score
+            scores[b] += 2 - score
+            met_now.append(b)
+            extra[b].append(a)
+
+
+def _play_knockout(state: dict, play) -> list:
+    """Simulate the rest of a bracket; returns the number of matches won by each player."""
+    wins = list(state['wins'])
+    alive = []
+    for a, b, winner in state['current']:
+        if winner is None and a is not None and b is not None:
+            winner = a if play(a, b) == 2 else b
+            wins[winner] += 1
+        alive.append(winner)
+
+    while len(alive) > 1:
+        next_round = []
+        for k in range(0, len(alive), 2):
+            a, b = alive[k], alive[k + 1]
+            winner = a if play(a, b) == 2 else b
+            wins[winner] += 1
+            next_round.append(winner)
+        alive = next_round
+    return wins
+
+
+def simulate_tournament(tournament, runs: int = 10000, prize_places: int = 3,
+                        workers: int | None = None, seed: int | None = None) -> list:
+    """
+    Estimate each player's chances from the current state of a tournament by Monte Carlo.
+
+    Games still to be played are sampled from the Elo expected score (with
+    draws, except in knockouts); Swiss rounds are re-paired by score after
+    every simulated round. Runs are split across worker processes.
+
+    Args:
+        tournament: A Swiss, round-robin, eliminatory or basic Tournament.
+        runs (int): Number of simulated tournaments.
+        prize_places (int): Places that win a prize.
+        workers (int | None): Worker processes (one per CPU if None; 1 runs in this process).
+        seed (int | None): Seed for reproducible results.
+
+    Returns:
+        list: One dict per player with 'player', 'win_probability',
+            'prize_probability', 'expected_place' and 'place_distribution'
+            (probability of each place), most likely winner first.
+
+    Raises:
+        ValueError: If the tournament cannot be simulated or runs is not positive.
+    """
+    if runs <= 0:
+        raise ValueError("The number of runs must be positive.")
+
+    model = build_model(tournament)
+    workers = max(1, min(workers or os.cpu_count() or 1, runs))
+    shares = [runs // workers + (1 if k < runs % workers else 0) for k in range(workers)]
+    seeds = [None if seed is None else seed * 1000 + k for k in range(workers)]
+
+    if workers == 1:
+        partials = [simulate_runs(model, runs, seeds[0])]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(simulate_runs, [model] * workers, shares, seeds))
+
+    n = len(model['ratings'])
+    counts = [[sum(partial[i][place] for partial in partials) for place in range(n)] for i in range(n)]
+
+    report = []
+    for player, places in zip(tournament.players, counts):
+        distribution = [count / runs for count in places]
+        report.append({
+            'player': player,
+            'win_probability': distribution[0],
+            'prize_probability': sum(distribution[:prize_places]),
+            'expected_place': sum(place * p for place, p in enumerate(distribution, 1)),
+            'place_distribution': distribution,
+        })
+    report.sort(key=lambda entry: (-entry['win_probability'], entry['expected_place']))
+    return report
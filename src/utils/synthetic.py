@@ -0,0 +1,220 @@
+import os
+import random
+
+from src.utils.rating_math import expected_score
+from src.utils.simulation import DRAW_RATE
+
+FIRST_NAMES = (
+    "Ana", "Beatriz", "Bruno", "Camila", "Carlos", "Daniel", "Eduarda", "Felipe",
+    "Fernanda", "Gabriel", "Gustavo", "Helena", "Igor", "Isabela", "João", "Julia",
+    "Larissa", "Leonardo", "Lucas", "Luiza", "Marcos", "Mariana", "Mateus", "Natália",
+    "Paulo", "Pedro", "Rafael", "Renata", "Rodrigo", "Sofia", "Thiago", "Vitória",
+)
+
+LAST_NAMES = (
+    "Almeida", "Alves", "Araújo", "Barbosa", "Cardoso", "Carvalho", "Castro", "Costa",
+    "Dias", "Fernandes", "Ferreira", "Gomes", "Kayser", "Lima", "Martins", "Melo",
+    "Moreira", "Nascimento", "Oliveira", "Pereira", "Ribeiro", "Rocha", "Rodrigues", "Santos",
+    "Schmidt", "Silva", "Souza", "Teixeira", "Vieira",
+)
+
+# Shares of each gender in the generated registry
+GENDER_WEIGHTS = {"male": 0.8, "female": 0.18, "other": 0.02}
+
+MIN_RATING = 1000
+MAX_RATING = 2800
+
+
+def generate_players(count: int, rng: random.Random, mean_rating: int = 1600, rating_spread: int = 300) -> list:
+    """
+    Generate a registry of players with realistic names, ages and ratings.
+
+    Classical ratings follow a normal distribution; rapid and blitz ratings
+    scatter around the classical one, as they do for real players.
+
+    Args:
+        count (int): Number of players.
+        rng (random.Random): Random generator, for reproducible registries.
+        mean_rating (int): Mean classical rating.
+        rating_spread (int): Standard deviation of the classical rating.
+
+    Returns:
+        list: Player objects with unique names.
+    """
+    from src.entities.player import Player
+    from src.entities.rating import Rating
+
+    def clamp(value: float) -> int:
+        return int(min(MAX_RATING, max(MIN_RATING, round(value))))
+
+    genders = list(GENDER_WEIGHTS)
+    weights = list(GENDER_WEIGHTS.values())
+    names = set()
+    players = []
+    for number in range(1, count + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if name in names:
+            # Common names repeat: number them like homonyms in a federation list
+            name = f"{name} {number}"
+        names.add(name)
+
+        classic = clamp(rng.gauss(mean_rating, rating_spread))
+        rating = Rating(classic, clamp(rng.gauss(classic, 80)), clamp(rng.gauss(classic, 120)))
+        birthdate = f"{rng.randint(1950, 2015)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        players.append(Player(name, birthdate, rng.choices(genders, weights)[0], rating))
+    return players
+
+
+def sample_result(white_rating: int, black_rating: int, rng: random.Random, draws: bool = True) -> str:
+    """
+    Sample the result of a game from the Elo expected score.
+
+    Args:
+        white_rating (int): Rating of the white player.
+        black_rating (int): Rating of the black player.
+        rng (random.Random): Random generator.
+        draws (bool): Whether the game can be drawn (False for knockout games).
+
+    Returns:
+        str: '1-0', '0-1' or '0.5-0.5'.
+    """
+    expected = expected_score(white_rating - black_rating)
+    draw = DRAW_RATE * (1 - abs(2 * expected - 1)) if draws else 0.0
+    r = rng.random()
+    if r < expected - draw / 2:
+        return "1-0"
+    if r < expected + draw / 2:
+        return "0.5-0.5"
+    return "0-1"
+
+
+def generate_swiss_tournament(name: str, players: list, num_rounds: int, rng: random.Random,
+                              played_rounds: int | None = None, time_control: str = 'classic'):
+    """
+    Generate a Swiss tournament paired by the real pairing engine.
+
+    Args:
+        name (str): Name of the tournament.
+        players (list): Its players.
+        num_rounds (int): Number of rounds of the tournament.
+        rng (random.Random): Random generator for the results.
+        played_rounds (int | None): Rounds paired and played (all if None).
+        time_control (str): 'classic', 'rapid' or 'blitz'.
+
+    Returns:
+        SwissTournament: The tournament with its rounds and results.
+    """
+    from src.controllers.tournament_controller import TournamentController
+    from src.entities.swiss_tournament import SwissTournament
+    from src.entities.time_control import TimeControl
+
+    tournament = SwissTournament(name, "Cidade Sintética", "2026-01-01", "2026-01-07",
+                                 TimeControl.from_string(time_control), num_rounds)
+    for player in players:
+        tournament.add_player(player)
+
+    played_rounds = num_rounds if played_rounds is None else played_rounds
+    for round_number in range(1, played_rounds + 1):
+        pairings = tournament.generate_swiss_pairings(round_number)
+        round_obj = TournamentController._build_round(round_number, pairings)
+        for game in round_obj.matches:
+            if game.result is None:
+                game.result = sample_result(getattr(game.white.rating, time_control),
+                                            getattr(game.black.rating, time_control), rng)
+        tournament.add_round(round_obj)
+    return tournament
+
+
+def generate_eliminatory_tournament(name: str, players: list, rng: random.Random,
+                                    time_control: str = 'classic'):
+    """
+    Generate a fully played eliminatory tournament, advancing winners through its bracket.
+
+    Args:
+        name (str): Name of the tournament.
+        players (list): Its players.
+        rng (random.Random): Random generator for the results.
+        time_control (str): 'classic', 'rapid' or 'blitz'.
+
+    Returns:
+        EliminatoryTournament: The tournament with its rounds, results and bracket.
+    """
+    from src.controllers.tournament_controller import TournamentController
+    from src.entities.eliminatory_tournament import EliminatoryTournament
+    from src.entities.time_control import TimeControl
+
+    tournament = EliminatoryTournament(name, "Cidade Sintética", "2026-02-01", "2026-02-03",
+                                       TimeControl.from_string(time_control))
+    for player in players:
+        tournament.add_player(player)
+
+    for round_number in range(1, tournament.get_bracket_info()['total_rounds'] + 1):
+        round_obj = TournamentController._build_round(round_number, tournament.generate_bracket_pairings(round_number))
+        tournament.add_round(round_obj)
+        for match_index, game in enumerate(round_obj.matches):
+            if game.result is None:
+                game.result = sample_result(getattr(game.white.rating, time_control),
+                                            getattr(game.black.rating, time_control), rng, draws=False)
+                tournament.record_match_result(round_number, match_index)
+    return tournament
+
+
+def generate_dataset(data_path: str, num_players: int = 10000, num_tournaments: int = 100,
+                     tournament_size: int = 100, num_rounds: int = 7, swiss_share: float = 0.75,
+                     seed: int = 0) -> dict:
+    """
+    Generate a registry and a set of played tournaments and write them as the application's data files.
+
+    Files are written through the real DTOs and BaseController._save_data,
+    so they are exactly what the application would have saved.
+
+    Args:
+        data_path (str): Directory to write players.json and tournaments.json to.
+        num_players (int): Players in the registry.
+        num_tournaments (int): Tournaments to generate.
+        tournament_size (int): Players per tournament.
+        num_rounds (int): Rounds per Swiss tournament.
+        swiss_share (float): Share of Swiss tournaments; the others are eliminatory.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        dict: The data path and the number of players, tournaments and games written.
+
+    Raises:
+        ValueError: If the tournaments would be larger than the registry.
+    """
+    from src.controllers.base_controller import BaseController
+    from src.dtos.player_dto import PlayerDTO
+    from src.dtos.tournament_dto import TournamentDTO
+
+    if tournament_size > num_players:
+        raise ValueError("Tournaments cannot have more players than the registry.")
+
+    rng = random.Random(seed)
+    players = generate_players(num_players, rng)
+
+    tournaments = []
+    games = 0
+    swiss_count = round(num_tournaments * swiss_share)
+    for number in range(1, num_tournaments + 1):
+        entrants = rng.sample(players, tournament_size)
+        if number <= swiss_count:
+            tournament = generate_swiss_tournament(f"Aberto Sintético {number}", entrants, num_rounds, rng)
+        else:
+            tournament = generate_eliminatory_tournament(f"Copa Sintética {number}", entrants, rng)
+        games += sum(len(round_obj.matches) for round_obj in tournament.rounds)
+        tournaments.append(TournamentDTO.to_dict(tournament))
+
+    os.makedirs(data_path, exist_ok=True)
+    writer = BaseController()
+    writer.data_path = os.path.join(data_path, '')
+    writer._save_data([PlayerDTO.to_dict(player) for player in players], 'players.json')
+    writer._save_data(tournaments, 'tournaments.json')
+    writer._save_data([], 'events.json')
+
+    return {
+        'data_path': data_path,
+        'players': num_players,
+        'tournaments': num_tournaments,
+        'games': games,
+    }
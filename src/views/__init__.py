@@ -1,6 +1,22 @@
 from .main_view import MainView
-from .player_view import PlayerView
-from .tournament_view import TournamentView
 from .base_view import BaseView
 
-__all__ = ['MainView', 'PlayerView', 'TournamentView', 'BaseView']
+__all__ = ['MainView', 'PlayerView', 'TournamentView', 'EventView', 'DiagnosticsView', 'BaseView']
+
+# The other views are imported on first access, so that starting the main menu
+# does not load every controller, entity and DTO module up front
+_LAZY_VIEWS = {
+    'PlayerView': '.player_view',
+    'TournamentView': '.tournament_view',
+    'EventView': '.event_view',
+    'DiagnosticsView': '.diagnostics_view',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_VIEWS:
+        from importlib import import_module
+        view = getattr(import_module(_LAZY_VIEWS[name], __name__), name)
+        globals()[name] = view
+        return view
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,13 @@
+from .terminal import TERMINAL
+
+
 class BaseView:
     """Base class for all views in the system."""
 
     @staticmethod
     def clear_screen():
-        """Clear the console screen."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the console screen (with ANSI escapes, without starting a subprocess)."""
+        TERMINAL.clear()
 
     @staticmethod
     def display_message(message: str):
@@ -59,3 +61,72 @@ class BaseView:
     def pause():
         """Pause execution until user presses Enter."""
         input("\nPressione Enter para continuar...")
+
+    def browse_pages(self, title: str, fetch_page, format_item, selectable: bool = False):
+        """
+        Paginated list screen with jump-to-page and name filter.
+
+        Only the current page is requested from the controller and formatted,
+        one line per item, so the screen costs the same for 10 or 10.000 records.
+
+        Args:
+            title (str): The screen title.
+            fetch_page: Callable (offset, limit, name_filter) -> (items, total).
+            format_item: Callable (number, item) -> str, the line of an item.
+            selectable (bool): Whether typing an item number returns that item.
+
+        Returns:
+            The selected item, or None when the user leaves the screen.
+        """
+        _, rows = TERMINAL.size()
+        # Title and status rows above the items; commands, message and prompt below
+        page_size = max(5, rows - 8)
+        page = 0
+        name_filter = None
+        message = ""
+
+        self.clear_screen()
+        while True:
+            items, total = fetch_page(page * page_size, page_size, name_filter)
+            pages = max(1, -(-total // page_size))
+            if page >= pages:
+                page = pages - 1
+                continue
+
+            status = f"Página {page + 1} de {pages} - {total} registro(s)"
+            if name_filter:
+                status += f" com '{name_filter}'"
+            lines = ["=" * 60, f"           {title}", "=" * 60, status]
+            if items:
+                lines += [format_item(page * page_size + i, item) for i, item in enumerate(items, 1)]
+            else:
+                lines.append("Nenhum registro encontrado.")
+            lines.append("=" * 60)
+            commands = "Enter - Próxima  A - Anterior  I <n> - Ir à página  F <texto> - Filtrar  Q - Voltar"
+            lines.append(("número - Escolher  " if selectable else "") + commands)
+            lines.append(message)
+            TERMINAL.render(lines)
+            message = ""
+
+            command = self.get_input("Comando: ").strip()
+            action, _, argument = command.partition(' ')
+            action = action.upper()
+
+            if action in ('', 'N'):
+                page = (page + 1) % pages
+            elif action == 'A':
+                page = (page - 1) % pages
+            elif action == 'I' and argument.strip().isdigit() and 1 <= int(argument) <= pages:
+                page = int(argument) - 1
+            elif action == 'F':
+                name_filter = argument.strip() or None
+                page = 0
+            elif action == 'Q':
+                TERMINAL.invalidate()
+                return None
+            elif selectable and command.isdigit() and 1 <= int(command) <= total:
+                TERMINAL.invalidate()
+                selected, _ = fetch_page(int(command) - 1, 1, name_filter)
+                return selected[0]
+            else:
+                message = "❌ Erro: Comando inválido!"
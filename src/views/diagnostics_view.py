@@ -0,0 +1,233 @@
+from .base_view import BaseView
+from src.utils.metrics import METRICS
+from src.utils.memory_diagnostics import MemoryTracker, diff_reports, load_reports
+
+
+class DiagnosticsView(BaseView):
+    """Hidden view for the performance metrics, the profiler and memory diagnostics (main menu option 'D')."""
+
+    def show_menu(self):
+        """Display the diagnostics menu and handle user input."""
+        menu_options = {
+            '1': self.toggle_metrics_screen,
+            '2': self.show_metrics_screen,
+            '3': self.toggle_profiler_screen,
+            '4': self.export_metrics_screen,
+            '5': self.reset_metrics_screen,
+            '6': self.memory_menu,
+            '7': None  # Sair
+        }
+
+        while True:
+            self.clear_screen()
+            self.display_separator()
+            print("           DIAGNÓSTICO DE DESEMPENHO")
+            self.display_separator()
+            print(f"Métricas: {'ativadas' if METRICS.enabled else 'desativadas'}")
+            print(f"Profiler: {'em execução' if METRICS.profiling else 'parado'}")
+            print(f"Memória: {'monitorada' if METRICS.memory_tracker is not None else 'não monitorada'}")
+            self.display_separator()
+            print("1 - Ativar/desativar métricas")
+            print("2 - Exibir métricas")
+            print("3 - Iniciar/parar profiler (cProfile)")
+            print("4 - Exportar métricas (JSON)")
+            print("5 - Zerar métricas")
+            print("6 - Diagnóstico de memória")
+            print("7 - Voltar ao menu principal")
+            self.display_separator()
+
+            choice = self.get_input("\nEscolha uma opção: ")
+            action = menu_options.get(choice)
+
+            if action:
+                action()
+            elif choice == '7':
+                break
+            else:
+                self.display_error("Opção inválida!")
+                self.pause()
+
+    def toggle_metrics_screen(self):
+        """Turn the metrics registry on or off."""
+        if METRICS.enabled:
+            METRICS.disable()
+            self.display_success("Métricas desativadas (os dados coletados foram mantidos).")
+        else:
+            METRICS.enable()
+            self.display_success("Métricas ativadas.")
+        self.pause()
+
+    def show_metrics_screen(self):
+        """Screen showing the recorded operation timings and counters."""
+        self.clear_screen()
+        self.display_separator()
+        print("           MÉTRICAS COLETADAS")
+        self.display_separator()
+
+        metrics = METRICS.to_dict()
+        if not metrics['operations'] and not metrics['counters']:
+            print("\nNenhuma métrica coletada. Ative as métricas e use o sistema.")
+            self.pause()
+            return
+
+        print(f"\n{'Operação':<45}{'Qtd':>6}{'Total ms':>11}{'Média ms':>11}{'Máx ms':>10}")
+        for name, entry in metrics['operations'].items():
+            print(f"{name[:44]:<45}{entry['count']:>6}{entry['total_ms']:>11.1f}"
+                  f"{entry['mean_ms']:>11.1f}{entry['max_ms']:>10.1f}")
+
+        if metrics['counters']:
+            print("\nContadores:")
+            for name, value in metrics['counters'].items():
+                print(f"   {name}: {value:.4f}" if isinstance(value, float) else f"   {name}: {value}")
+        self.pause()
+
+    def toggle_profiler_screen(self):
+        """Start the profiler, or stop it and show its report."""
+        try:
+            if not METRICS.profiling:
+                METRICS.start_profile()
+                self.display_success("Profiler iniciado. Use o sistema e volte aqui para pará-lo.")
+            else:
+                path = self.get_input("\nArquivo para salvar as estatísticas pstats (Enter para não salvar): ").strip()
+                print(METRICS.stop_profile(path or None))
+                if path:
+                    self.display_success(f"Estatísticas salvas em '{path}' (leia com python -m pstats {path}).")
+        except ValueError as e:
+            self.display_error(str(e))
+        except OSError as e:
+            self.display_error(f"Erro ao salvar estatísticas: {str(e)}")
+        self.pause()
+
+    def export_metrics_screen(self):
+        """Screen for writing the metrics to a JSON file."""
+        path = self.get_input("\nArquivo de destino (Enter para metrics.json): ").strip() or 'metrics.json'
+        try:
+            METRICS.dump_json(path)
+            self.display_success(f"Métricas exportadas para '{path}'.")
+        except OSError as e:
+            self.display_error(f"Erro ao exportar métricas: {str(e)}")
+        self.pause()
+
+    def reset_metrics_screen(self):
+        """Discard the recorded metrics."""
+        METRICS.reset()
+        self.display_success("Métricas zeradas.")
+        self.pause()
+
+    def memory_menu(self):
+        """Display the memory diagnostics menu and handle user input."""
+        menu_options = {
+            '1': self.toggle_memory_screen,
+            '2': self.show_memory_reports_screen,
+            '3': self.save_memory_reports_screen,
+            '4': self.compare_memory_reports_screen,
+            '5': None  # Voltar
+        }
+
+        while True:
+            self.clear_screen()
+            self.display_separator()
+            print("           DIAGNÓSTICO DE MEMÓRIA")
+            self.display_separator()
+            tracker = METRICS.memory_tracker
+            status = f"ativo ({len(tracker.reports)} operações medidas)" if tracker is not None else "desativado"
+            print(f"Modo de memória: {status}")
+            self.display_separator()
+            print("1 - Ativar/desativar modo de memória")
+            print("2 - Exibir relatórios")
+            print("3 - Salvar relatórios (JSON)")
+            print("4 - Comparar duas execuções")
+            print("5 - Voltar")
+            self.display_separator()
+
+            choice = self.get_input("\nEscolha uma opção: ")
+            action = menu_options.get(choice)
+
+            if action:
+                action()
+            elif choice == '5':
+                break
+            else:
+                self.display_error("Opção inválida!")
+                self.pause()
+
+    def toggle_memory_screen(self):
+        """Attach or detach the memory tracker."""
+        if METRICS.memory_tracker is None:
+            METRICS.memory_tracker = MemoryTracker()
+            self.display_success("Modo de memória ativado: cada operação será medida com tracemalloc (mais lento).")
+        else:
+            METRICS.memory_tracker = None
+            self.display_success("Modo de memória desativado.")
+        self.pause()
+
+    def show_memory_reports_screen(self):
+        """Screen showing the memory report of every measured operation."""
+        self.clear_screen()
+        self.display_separator()
+        print("           RELATÓRIOS DE MEMÓRIA")
+        self.display_separator()
+
+        tracker = METRICS.memory_tracker
+        if tracker is None or not tracker.reports:
+            print("\nNenhuma operação medida. Ative o modo de memória e use o sistema.")
+            self.pause()
+            return
+
+        for report in tracker.reports:
+            print(f"\n{report['operation']} ({report['elapsed_s'] * 1000:.0f} ms)")
+            print(f"   Pico: {self._format_bytes(report['peak_bytes'])}"
+                  f" | Retido: {self._format_bytes(report['retained_bytes'])}")
+            print("   Maiores alocações:")
+            for site in report['top_sites'][:5]:
+                print(f"      {self._format_bytes(site['size_bytes']):>10}  {site['site']}")
+            print("   Objetos (vivos / criados):")
+            for name, entry in report['objects'].items():
+                if entry['added']:
+                    print(f"      {name}: {entry['live']} / {entry['added']:+d}")
+        self.pause()
+
+    def save_memory_reports_screen(self):
+        """Screen for writing the memory reports to a JSON file."""
+        tracker = METRICS.memory_tracker
+        if tracker is None or not tracker.reports:
+            self.display_error("Nenhuma operação medida.")
+            self.pause()
+            return
+
+        path = self.get_input("\nArquivo de destino (Enter para memory.json): ").strip() or 'memory.json'
+        try:
+            tracker.save(path)
+            self.display_success(f"Relatórios salvos em '{path}'.")
+        except OSError as e:
+            self.display_error(f"Erro ao salvar relatórios: {str(e)}")
+        self.pause()
+
+    def compare_memory_reports_screen(self):
+        """Screen comparing two saved runs operation by operation."""
+        try:
+            old = load_reports(self.get_input("\nArquivo da execução de referência: ").strip())
+            new = load_reports(self.get_input("Arquivo da execução a comparar: ").strip())
+            differences = diff_reports(old, new)
+            if not differences:
+                print("\nNenhuma operação em comum entre as duas execuções.")
+            for entry in differences:
+                flag = "⚠️  " if entry['regression'] else ""
+                print(f"\n{flag}{entry['operation']}")
+                print(f"   Pico: {self._format_bytes(entry['old_peak_bytes'])} -> "
+                      f"{self._format_bytes(entry['new_peak_bytes'])}")
+                print(f"   Retido: {self._format_bytes(entry['old_retained_bytes'])} -> "
+                      f"{self._format_bytes(entry['new_retained_bytes'])}")
+                for name, change in sorted(entry['objects'].items(), key=lambda item: -abs(item[1]))[:5]:
+                    print(f"   {name}: {change:+d} objetos")
+        except (OSError, ValueError, KeyError) as e:
+            self.display_error(f"Erro ao comparar relatórios: {str(e)}")
+        self.pause()
+
+    @staticmethod
+    def _format_bytes(size: int) -> str:
+        for unit in ('B', 'KB', 'MB'):
+            if abs(size) < 1024:
+                return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
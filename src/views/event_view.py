@@ -0,0 +1,243 @@
+from .base_view import BaseView
+from src.controllers.event_controller import EventController
+from src.controllers.tournament_controller import TournamentController
+from src.entities.event import Event
+
+
+class EventView(BaseView):
+    """View class for managing multi-section events."""
+
+    def __init__(self):
+        self.controller = EventController()
+        self.tournament_controller = TournamentController()
+
+    def show_menu(self):
+        """Display the event menu and handle user input."""
+        menu_options = {
+            '1': self.create_event_screen,
+            '2': self.list_events_screen,
+            '3': self.add_section_screen,
+            '4': self.remove_section_screen,
+            '5': self.pair_event_screen,
+            '6': self.event_standings_screen,
+            '7': None  # Sair
+        }
+
+        while True:
+            self.clear_screen()
+            self.display_separator()
+            print("           MENU DE EVENTOS")
+            self.display_separator()
+            print("1 - Criar novo evento")
+            print("2 - Listar eventos")
+            print("3 - Adicionar seção")
+            print("4 - Remover seção")
+            print("5 - Emparceirar todas as seções")
+            print("6 - Classificação das seções")
+            print("7 - Voltar ao menu principal")
+            self.display_separator()
+
+            choice = self.get_input("\nEscolha uma opção: ")
+            action = menu_options.get(choice)
+
+            if action:
+                action()
+            elif choice == '7':
+                break
+            else:
+                self.display_error("Opção inválida!")
+                self.pause()
+
+    def create_event_screen(self):
+        """Screen for creating a new event."""
+        self.clear_screen()
+        self.display_separator()
+        print("           CRIAR NOVO EVENTO")
+        self.display_separator()
+
+        try:
+            name = self.get_input("\nNome do evento: ")
+            location = self.get_input("Local: ")
+            start_date = self.get_input("Data de início (YYYY-MM-DD): ")
+            end_date = self.get_input("Data de término (YYYY-MM-DD): ")
+
+            self.controller.create_event(Event(name, location, start_date, end_date))
+            self.display_success(f"Evento '{name}' criado com sucesso!")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao criar evento: {str(e)}")
+
+        self.pause()
+
+    def list_events_screen(self):
+        """Screen for listing all events and their sections."""
+        self.clear_screen()
+        self.display_separator()
+        print("           LISTA DE EVENTOS")
+        self.display_separator()
+
+        try:
+            events = self.controller.get_all_events()
+            if not events:
+                print("\nNenhum evento cadastrado.")
+            for i, event in enumerate(events, 1):
+                print(f"\n{i}. {event.name}")
+                print(f"   Local: {event.location}")
+                print(f"   Data: {event.start_date} a {event.end_date}")
+                sections = ", ".join(event.sections) if event.sections else "nenhuma"
+                print(f"   Seções: {sections}")
+        except Exception as e:
+            self.display_error(f"Erro ao listar eventos: {str(e)}")
+
+        self.pause()
+
+    def add_section_screen(self):
+        """Screen for adding a Swiss tournament to an event as a section."""
+        event = self._get_event_choice()
+        if event is None:
+            return
+
+        try:
+            candidates = [
+                t for t in self.tournament_controller.get_tournaments_by_type('swiss')
+                if t.name not in event.sections
+            ]
+            if not candidates:
+                self.display_message("\nNenhum torneio suíço disponível para adicionar.")
+                self.pause()
+                return
+
+            print("\nTorneios suíços disponíveis:")
+            for i, tournament in enumerate(candidates, 1):
+                print(f"{i}. {tournament.name} ({len(tournament.players)} jogadores)")
+
+            choice = self.get_input("\nEscolha o número do torneio (0 para cancelar): ")
+            if choice == '0':
+                return
+            index = int(choice) - 1
+            if not 0 <= index < len(candidates):
+                raise ValueError("Opção inválida!")
+
+            self.controller.add_section(event.name, candidates[index].name)
+            self.display_success(f"Seção '{candidates[index].name}' adicionada ao evento!")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao adicionar seção: {str(e)}")
+
+        self.pause()
+
+    def remove_section_screen(self):
+        """Screen for removing a section from an event."""
+        event = self._get_event_choice()
+        if event is None:
+            return
+
+        try:
+            sections = event.sections
+            if not sections:
+                self.display_message("\nO evento não possui seções.")
+                self.pause()
+                return
+
+            print("\nSeções:")
+            for i, section in enumerate(sections, 1):
+                print(f"{i}. {section}")
+
+            choice = self.get_input("\nEscolha o número da seção (0 para cancelar): ")
+            if choice == '0':
+                return
+            index = int(choice) - 1
+            if not 0 <= index < len(sections):
+                raise ValueError("Opção inválida!")
+
+            self.controller.remove_section(event.name, sections[index])
+            self.display_success(f"Seção '{sections[index]}' removida do evento!")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao remover seção: {str(e)}")
+
+        self.pause()
+
+    def pair_event_screen(self):
+        """Screen for pairing the next round of every section at once."""
+        event = self._get_event_choice()
+        if event is None:
+            return
+
+        try:
+            if not event.sections:
+                self.display_message("\nO evento não possui seções.")
+                self.pause()
+                return
+
+            confirm = self.get_input(f"\nGerar e salvar a próxima rodada de {len(event.sections)} seções? (S/N): ")
+            if confirm.upper() != 'S':
+                self.display_message("Operação cancelada.")
+                self.pause()
+                return
+
+            report = self.controller.pair_event(event.name)
+            for section, outcome in report.items():
+                print(f"\n{section}:")
+                if outcome['error']:
+                    print(f"   ❌ {outcome['error']}")
+                    continue
+                print(f"   Rodada {outcome['round_number']} - {len(outcome['pairings'])} mesas")
+                for board, (white, black) in enumerate(outcome['pairings'], 1):
+                    print(f"   Mesa {board}: {white} x {black if black is not None else 'BYE'}")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao emparceirar evento: {str(e)}")
+
+        self.pause()
+
+    def event_standings_screen(self):
+        """Screen for showing the leaders of every section."""
+        event = self._get_event_choice()
+        if event is None:
+            return
+
+        try:
+            limit_input = self.get_input("\nQuantos jogadores por seção? (Enter para 10): ").strip()
+            limit = int(limit_input) if limit_input else 10
+
+            for section, entries in self.controller.get_event_standings(event.name, limit).items():
+                print(f"\n{section}:")
+                for position, entry in enumerate(entries, 1):
+                    print(f"   {position}º {entry['player'].name} - {entry['score']} pts")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao exibir classificação: {str(e)}")
+
+        self.pause()
+
+    def _get_event_choice(self):
+        events = self.controller.get_all_events()
+
+        if not events:
+            print("\nNenhum evento cadastrado.")
+            self.pause()
+            return None
+
+        print("\nEventos disponíveis:")
+        for i, event in enumerate(events, 1):
+            print(f"{i}. {event.name}")
+
+        choice = self.get_input("\nEscolha o número do evento (0 para cancelar): ")
+        if choice == '0':
+            return None
+
+        try:
+            index = int(choice) - 1
+            if 0 <= index < len(events):
+                return events[index]
+            self.display_error("Opção inválida!")
+        except ValueError:
+            self.display_error("Entrada inválida!")
+        self.pause()
+        return None
@@ -1,14 +1,48 @@
 from .base_view import BaseView
-from .player_view import PlayerView
-from .tournament_view import TournamentView
 
 
 class MainView(BaseView):
     """Main view class for the chess tournament management system."""
 
     def __init__(self):
-        self.player_view = PlayerView()
-        self.tournament_view = TournamentView()
+        # Sub-views (and with them the controllers, entities and DTOs) are
+        # imported and built the first time their menu is opened
+        self.__player_view = None
+        self.__tournament_view = None
+        self.__event_view = None
+        self.__diagnostics_view = None
+
+    @property
+    def player_view(self):
+        """Get the player view, creating it on first use."""
+        if self.__player_view is None:
+            from .player_view import PlayerView
+            self.__player_view = PlayerView()
+        return self.__player_view
+
+    @property
+    def tournament_view(self):
+        """Get the tournament view, creating it on first use."""
+        if self.__tournament_view is None:
+            from .tournament_view import TournamentView
+            self.__tournament_view = TournamentView()
+        return self.__tournament_view
+
+    @property
+    def event_view(self):
+        """Get the event view, creating it on first use."""
+        if self.__event_view is None:
+            from .event_view import EventView
+            self.__event_view = EventView()
+        return self.__event_view
+
+    @property
+    def diagnostics_view(self):
+        """Get the diagnostics view, creating it on first use."""
+        if self.__diagnostics_view is None:
+            from .diagnostics_view import DiagnosticsView
+            self.__diagnostics_view = DiagnosticsView()
+        return self.__diagnostics_view
 
     def show_main_menu(self):
         """Display the main menu and handle user navigation."""
@@ -19,7 +53,8 @@ class MainView(BaseView):
             self.display_separator()
             print("1 - Jogador")
             print("2 - Torneio")
-            print("3 - Sair")
+            print("3 - Evento (múltiplas seções)")
+            print("4 - Sair")
             self.display_separator()
 
             choice = self.get_input("\nEscolha uma opção: ")
@@ -29,6 +64,11 @@ class MainView(BaseView):
             elif choice == '2':
                 self.tournament_view.show_menu()
             elif choice == '3':
+                self.event_view.show_menu()
+            elif choice.upper() == 'D':
+                # Hidden: performance metrics and profiler
+                self.diagnostics_view.show_menu()
+            elif choice == '4':
                 self.clear_screen()
                 self.display_success("Encerrando o sistema. Até logo!")
                 break
@@ -19,7 +19,9 @@ class PlayerView(BaseView):
             self.display_separator()
             print("1 - Registrar novo jogador")
             print("2 - Listar todos os jogadores")
-            print("3 - Voltar ao menu principal")
+            print("3 - Buscar jogador")
+            print("4 - Consultar jogadores por rating, idade e gênero")
+            print("5 - Voltar ao menu principal")
             self.display_separator()
 
             choice = self.get_input("\nEscolha uma opção: ")
@@ -29,6 +31,10 @@ class PlayerView(BaseView):
             elif choice == '2':
                 self.list_players_screen()
             elif choice == '3':
+                self.search_players_screen()
+            elif choice == '4':
+                self.query_players_screen()
+            elif choice == '5':
                 break
             else:
                 self.display_error("Opção inválida!")
@@ -64,29 +70,90 @@ class PlayerView(BaseView):
         self.pause()
 
     def list_players_screen(self):
-        """Screen for listing all registered players."""
+        """Screen for listing the registered players, one page at a time."""
+        try:
+            self.browse_pages("LISTA DE JOGADORES", self.controller.get_players_page, self.format_player_line)
+        except Exception as e:
+            self.display_error(f"Erro ao listar jogadores: {str(e)}")
+            self.pause()
+
+    @staticmethod
+    def format_player_line(number: int, player: Player) -> str:
+        """
+        Format a player as a single list line.
+
+        Args:
+            number (int): The position of the player in the list.
+            player (Player): The player.
+
+        Returns:
+            str: The line, e.g. '12. Ana Souza (1990-05-01, F) | Clássico: 1850 | Rápido: 1800 | Blitz: 1790'.
+        """
+        return (f"{number}. {player.name} ({player.birthdate}, {player.gender}) | "
+                f"Clássico: {player.rating.classic} | Rápido: {player.rating.rapid} | Blitz: {player.rating.blitz}")
+
+
+    def search_players_screen(self):
+        """Screen for searching players by name."""
         self.clear_screen()
         self.display_separator()
-        print("           LISTA DE JOGADORES")
+        print("           BUSCAR JOGADOR")
         self.display_separator()
 
         try:
-            players = self.controller.get_all_players()
-            
+            query = self.get_input("\nNome (ou parte do nome): ").strip()
+            players = self.controller.search_players(query, limit=20)
+
             if not players:
-                print("\nNenhum jogador registrado ainda.")
+                print("\nNenhum jogador encontrado.")
             else:
-                print(f"\nTotal de jogadores: {len(players)}\n")
+                print(f"\nJogadores encontrados: {len(players)}\n")
                 for i, player in enumerate(players, 1):
                     print(f"{i}. {player.name}")
-                    print(f"   Data de Nascimento: {player.birthdate}")
-                    print(f"   Gênero: {player.gender}")
-                    print(f"   Ratings:")
-                    print(f"     - Clássico: {player.rating.classic}")
-                    print(f"     - Rápido: {player.rating.rapid}")
-                    print(f"     - Blitz: {player.rating.blitz}")
-                    print()
+                    print(f"   Ratings: Clássico: {player.rating.classic} | Rápido: {player.rating.rapid} | Blitz: {player.rating.blitz}")
         except Exception as e:
-            self.display_error(f"Erro ao listar jogadores: {str(e)}")
+            self.display_error(f"Erro ao buscar jogadores: {str(e)}")
+
+        self.pause()
+
+    def query_players_screen(self):
+        """Screen for filtering players by rating range, birth year range and gender."""
+        self.clear_screen()
+        self.display_separator()
+        print("           CONSULTAR JOGADORES")
+        self.display_separator()
+        print("\nDeixe em branco os critérios que não deseja usar.")
+
+        try:
+            rating_map = {'1': 'classic', '2': 'rapid', '3': 'blitz'}
+            rating_choice = self.get_input("\nRating (1 - Clássico, 2 - Rápido, 3 - Blitz): ").strip()
+            rating_type = rating_map.get(rating_choice)
+            min_rating = max_rating = None
+            if rating_type:
+                min_rating = self._get_optional_int("Rating mínimo: ")
+                max_rating = self._get_optional_int("Rating máximo: ")
+            min_birth_year = self._get_optional_int("Nascidos a partir do ano: ")
+            max_birth_year = self._get_optional_int("Nascidos até o ano: ")
+            gender = self.get_input("Gênero: ").strip() or None
+            limit = self._get_optional_int("Quantidade máxima de resultados: ")
+
+            players = self.controller.query_players(rating_type, min_rating, max_rating,
+                                                    min_birth_year, max_birth_year, gender, limit)
+
+            if not players:
+                print("\nNenhum jogador encontrado.")
+            else:
+                print(f"\nJogadores encontrados: {len(players)}\n")
+                for i, player in enumerate(players, 1):
+                    print(f"{i}. {player.name} ({player.birthdate}, {player.gender})")
+                    print(f"   Ratings: Clássico: {player.rating.classic} | Rápido: {player.rating.rapid} | Blitz: {player.rating.blitz}")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao consultar jogadores: {str(e)}")
 
         self.pause()
+
+    def _get_optional_int(self, prompt: str) -> int | None:
+        value = self.get_input(prompt).strip()
+        return int(value) if value else None
@@ -0,0 +1,155 @@
+import os
+import shutil
+import sys
+
+# ANSI escape sequences
+HOME_AND_CLEAR = "\x1b[H\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_SCREEN_END = "\x1b[J"
+
+
+def _move(row: int) -> str:
+    """Escape sequence moving the cursor to the start of a screen row (0-based)."""
+    return f"\x1b[{row + 1};1H"
+
+
+def _enable_windows_ansi(stream) -> bool:
+    """Turn on escape sequence processing in a Windows console; False if it is not available."""
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (ImportError, AttributeError, OSError, ValueError):
+        return False
+
+
+class Terminal:
+    """
+    Screen output with ANSI escapes instead of a 'clear' subprocess per screen.
+
+    render() keeps the lines currently on screen and rewrites only the rows
+    that changed, gathering all escapes and text into a single write. When
+    the output is not an ANSI terminal (a pipe, TERM=dumb, an old Windows
+    console) it falls back to printing whole screens.
+    """
+
+    def __init__(self, stream=None):
+        self.__stream = stream
+        self.__ansi = None
+        self.__frame = None  # lines on screen since the last clear, None if unknown
+
+    @property
+    def stream(self):
+        """Get the output stream (the current sys.stdout unless one was given)."""
+        return self.__stream or sys.stdout
+
+    @property
+    def ansi(self) -> bool:
+        """Whether the output understands ANSI escape sequences (checked once)."""
+        if self.__ansi is None:
+            stream = self.stream
+            if not hasattr(stream, 'isatty') or not stream.isatty() or os.environ.get('TERM') == 'dumb':
+                self.__ansi = False
+            elif os.name == 'nt':
+                self.__ansi = _enable_windows_ansi(stream)
+            else:
+                self.__ansi = True
+        return self.__ansi
+
+    def size(self) -> tuple:
+        """Get the terminal size as (columns, rows)."""
+        size = shutil.get_terminal_size()
+        return size.columns, size.lines
+
+    def clear(self) -> None:
+        """Clear the screen and move the cursor to the top left corner."""
+        if self.ansi:
+            self.stream.write(HOME_AND_CLEAR)
+            self.stream.flush()
+        elif os.name == 'nt' and self.stream.isatty():
+            # Console without escape sequence support
+            os.system('cls')
+        self.__frame = []
+
+    def invalidate(self) -> None:
+        """Forget what is on screen, so that the next render redraws everything."""
+        self.__frame = None
+
+    def render(self, lines: list) -> None:
+        """
+        Show a full screen of lines, rewriting only those that changed since the last render.
+
+        The cursor is left on the row below the last line, ready for a prompt;
+        anything below it (e.g. the previous prompt and its answer) is erased.
+
+        Args:
+            lines (list): The lines of the screen, from the top row. Longer
+                lines are cut to the terminal width so they never wrap.
+        """
+        stream = self.stream
+        if not self.ansi:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+            return
+
+        columns, _ = self.size()
+        lines = [line[:columns - 1] for line in lines]
+        previous = self.__frame
+        out = []
+        if previous is None:
+            out.append(HOME_AND_CLEAR)
+            previous = []
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                out.append(_move(row) + line + CLEAR_LINE_END)
+        out.append(_move(len(lines)) + CLEAR_SCREEN_END)
+        stream.write("".join(out))
+        stream.flush()
+        self.__frame = lines
+
+
+class ScrollWindow:
+    """
+    Virtual scrolling over a long list: only the items in the window are rendered.
+
+    The window follows the cursor, moving only when the cursor leaves it.
+    """
+
+    def __init__(self, total: int, height: int):
+        """
+        Initialize a ScrollWindow.
+
+        Args:
+            total (int): Number of items in the list.
+            height (int): Number of items that fit on screen.
+        """
+        self.total = total
+        self.height = max(1, height)
+        self.top = 0
+
+    def follow(self, cursor: int) -> range:
+        """
+        Scroll so that the cursor item is visible.
+
+        Args:
+            cursor (int): Index of the selected item.
+
+        Returns:
+            range: Indexes of the items to render.
+        """
+        if cursor < self.top:
+            self.top = cursor
+        elif cursor >= self.top + self.height:
+            self.top = cursor - self.height + 1
+        self.top = max(0, min(self.top, self.total - self.height))
+        return range(self.top, min(self.total, self.top + self.height))
+
+
+# Shared by every view, so that the frame on screen is tracked in one place
+TERMINAL = Terminal()
@@ -1,9 +1,14 @@
 from .base_view import BaseView
+from .terminal import TERMINAL, ScrollWindow
 from src.controllers.tournament_controller import TournamentController
 from src.controllers.player_controller import PlayerController
+from src.controllers.rating_controller import RatingController
 from src.entities.swiss_tournament import SwissTournament
 from src.entities.eliminatory_tournament import EliminatoryTournament
+from src.entities.round_robin_tournament import RoundRobinTournament
+from src.entities.arena_tournament import ArenaTournament
 from src.entities.time_control import TimeControl
+import time
 import traceback
 
 class TournamentView(BaseView):
@@ -12,6 +17,7 @@ class TournamentView(BaseView):
     def __init__(self):
         self.controller = TournamentController()
         self.player_controller = PlayerController()
+        self.rating_controller = RatingController()
 
     def show_menu(self):
         """Display the tournament menu and handle user input."""
@@ -19,7 +25,8 @@ class TournamentView(BaseView):
             '1': self.create_tournament_screen,
             '2': self.list_tournaments_screen,
             '3': self.manage_tournament_screen,
-            '4': None  # Sair
+            '4': self.update_ratings_screen,
+            '5': None  # Sair
         }
 
         while True:
@@ -30,7 +37,8 @@ class TournamentView(BaseView):
             print("1 - Criar novo torneio")
             print("2 - Listar torneios")
             print("3 - Gerenciar torneio")
-            print("4 - Voltar ao menu principal")
+            print("4 - Atualizar ratings dos jogadores")
+            print("5 - Voltar ao menu principal")
             self.display_separator()
 
             choice = self.get_input("\nEscolha uma opção: ")
@@ -38,7 +46,7 @@ class TournamentView(BaseView):
 
             if action:
                 action()
-            elif choice == '4':
+            elif choice == '5':
                 break
             else:
                 self.display_error("Opção inválida!")
@@ -71,33 +79,71 @@ class TournamentView(BaseView):
         self.pause()
 
     def list_tournaments_screen(self):
-        """Screen for listing all tournaments."""
+        """Screen for listing the tournaments, one page at a time."""
+        try:
+            self.browse_pages("LISTA DE TORNEIOS", self.controller.get_tournaments_page, self._format_tournament_line)
+        except Exception as e:
+            self.display_error(f"Erro ao listar torneios: {str(e)}")
+            self.pause()
+
+    def update_ratings_screen(self):
+        """Screen for rating finished tournaments and updating the registry ratings."""
         self.clear_screen()
         self.display_separator()
-        print("           LISTA DE TORNEIOS")
+        print("           ATUALIZAR RATINGS")
         self.display_separator()
 
         try:
-            tournaments = self.controller.get_all_tournaments()
-
+            rated = self.rating_controller.get_rated_tournaments()
+            tournaments = [t for t in self.controller.get_all_tournaments()
+                           if t.name not in rated and t.is_finished()]
             if not tournaments:
-                print("\nNenhum torneio registrado ainda.")
+                print("\nNenhum torneio encerrado aguardando atualização de ratings.")
+                self.pause()
+                return
+
+            print("\nTorneios encerrados ainda não avaliados:")
+            for i, tournament in enumerate(tournaments, 1):
+                print(f"{i}. {tournament.name} ({tournament.end_date})")
+
+            choice = self.get_input("\nNúmeros dos torneios separados por vírgula (0 para cancelar): ").strip()
+            if choice in ('', '0'):
+                return
+
+            names = []
+            for part in choice.split(','):
+                index = int(part) - 1
+                if not 0 <= index < len(tournaments):
+                    raise ValueError("Opção inválida!")
+                names.append(tournaments[index].name)
+
+            report = self.rating_controller.update_ratings(names, dry_run=True)
+            if not report:
+                print("\nNenhuma partida com resultado para avaliar.")
+                self.pause()
+                return
+
+            print(f"\n{'Jogador':<30} {'Ritmo':<8} {'Antes':>6} {'Depois':>7} {'Var.':>5} {'K':>3} {'Pts':>5}")
+            for entry in report:
+                print(f"{entry['name'][:30]:<30} {entry['time_control']:<8} {entry['old_rating']:>6} "
+                      f"{entry['new_rating']:>7} {entry['change']:>+5} {entry['k_factor']:>3} "
+                      f"{entry['score']:>3.1f}/{entry['games']}")
+
+            confirm = self.get_input("\nSalvar os novos ratings? (S/N): ")
+            if confirm.upper() == 'S':
+                self.rating_controller.update_ratings(names)
+                self.display_success(f"Ratings de {len(report)} jogadores atualizados!")
             else:
-                print(f"\nTotal de torneios: {len(tournaments)}\n")
-                for i, tournament in enumerate(tournaments, 1):
-                    self._display_tournament_info(i, tournament)
+                self.display_message("Operação cancelada.")
+        except ValueError as e:
+            self.display_error(str(e))
         except Exception as e:
-            self.display_error(f"Erro ao listar torneios: {str(e)}")
+            self.display_error(f"Erro ao atualizar ratings: {str(e)}")
 
         self.pause()
 
     def manage_tournament_screen(self):
         """Screen for managing a specific tournament."""
-        self.clear_screen()
-        self.display_separator()
-        print("           GERENCIAR TORNEIO")
-        self.display_separator()
-
         try:
             selected_tournament = self._get_tournament_choice()
             if selected_tournament:
@@ -136,6 +182,8 @@ class TournamentView(BaseView):
         print("\nTipo de torneio:")
         print("1 - Torneio Suíço")
         print("2 - Torneio Eliminatório")
+        print("3 - Torneio Todos contra Todos (Round-Robin)")
+        print("4 - Torneio Arena (emparceiramento contínuo)")
         tournament_type = self.get_input("\nEscolha o tipo: ")
 
         if tournament_type == '1':
@@ -143,54 +191,45 @@ class TournamentView(BaseView):
             return SwissTournament(name, location, start_date, end_date, time_control, rounds)
         elif tournament_type == '2':
             return EliminatoryTournament(name, location, start_date, end_date, time_control)
+        elif tournament_type == '3':
+            double = self.get_input("Turno e returno (duplo round-robin)? (S/N): ").upper() == 'S'
+            return RoundRobinTournament(name, location, start_date, end_date, time_control, double)
+        elif tournament_type == '4':
+            duration = int(self.get_input("Duração da arena (minutos): "))
+            return ArenaTournament(name, location, start_date, end_date, time_control, duration)
         else:
             self.display_error("Tipo de torneio inválido!")
             self.pause()
             return None
 
-    def _display_tournament_info(self, index, tournament):
-        print(f"{index}. {tournament.name}")
-        print(f"   Local: {tournament.location}")
-        print(f"   Data: {tournament.start_date} a {tournament.end_date}")
-        print(f"   Ritmo: {tournament.time_control}")
+    def _format_tournament_line(self, number, tournament):
+        return (f"{number}. {tournament.name} | {tournament.location} | "
+                f"{tournament.start_date} a {tournament.end_date} | {tournament.time_control} | "
+                f"{self._tournament_type_name(tournament)}")
 
+    def _tournament_type_name(self, tournament):
         if isinstance(tournament, SwissTournament):
-            print(f"   Tipo: Suíço ({tournament.num_rounds} rodadas)")
+            return f"Suíço ({tournament.num_rounds} rodadas)"
         elif isinstance(tournament, EliminatoryTournament):
-            print(f"   Tipo: Eliminatório")
+            return "Eliminatório"
+        elif isinstance(tournament, RoundRobinTournament):
+            return self._round_robin_type_name(tournament)
+        elif isinstance(tournament, ArenaTournament):
+            return f"Arena ({tournament.duration} minutos)"
         else:
-            print(f"   Tipo: Básico")
-        print()
+            return "Básico"
 
-    def _get_tournament_choice(self):
-        tournaments = self.controller.get_all_tournaments()
-
-        if not tournaments:
-            print("\nNenhum torneio disponível para gerenciar.")
-            self.pause()
-            return None
-
-        print("\nTorneios disponíveis:")
-        for i, tournament in enumerate(tournaments, 1):
-            print(f"{i}. {tournament.name}")
-
-        choice = self.get_input("\nEscolha o número do torneio (0 para cancelar): ")
-
-        if choice == '0':
-            return None
+    def _round_robin_type_name(self, tournament):
+        kind = "Duplo Round-Robin" if tournament.double_round_robin else "Round-Robin"
+        return f"{kind} ({tournament.num_rounds} rodadas)"
 
-        try:
-            index = int(choice) - 1
-            if 0 <= index < len(tournaments):
-                return tournaments[index]
-            else:
-                self.display_error("Opção inválida!")
-                self.pause()
-                return None
-        except ValueError:
-            self.display_error("Entrada inválida!")
-            self.pause()
-            return None
+    def _get_tournament_choice(self):
+        return self.browse_pages(
+            "GERENCIAR TORNEIO",
+            self.controller.get_tournaments_page,
+            lambda number, tournament: f"{number}. {tournament.name} | {self._tournament_type_name(tournament)}",
+            selectable=True
+        )
 
     def _manage_tournament_menu(self, tournament):
         """Display management menu for a specific tournament."""
@@ -215,7 +254,9 @@ class TournamentView(BaseView):
             print("5 - Listar jogadores inscritos")
 
             can_generate = self._can_generate_next_round(tournament)
-            if can_generate:
+            if isinstance(tournament, ArenaTournament):
+                print("6 - Arena: partidas e resultados")
+            elif can_generate:
                 print(f"6 - Gerar emparceiramento ({tournament.get_current_round_number()}ª rodada)")
             else:
                 print(f"6 - Anotar resultados ({len(tournament.rounds)}ª rodada) - OBRIGATÓRIO")
@@ -236,7 +277,9 @@ class TournamentView(BaseView):
                 if choice in ['2', '3', '6', '7', '8']:
                     tournament = self.controller.get_tournament_by_name(tournament.name)
             elif choice == '6':
-                if can_generate:
+                if isinstance(tournament, ArenaTournament):
+                    self._manage_arena(tournament)
+                elif can_generate:
                     self._generate_round_pairings(tournament)
                 else:
                     self._annotate_results(tournament)
@@ -270,11 +313,34 @@ class TournamentView(BaseView):
             print(f"Número de rodadas: {tournament.num_rounds}")
         elif isinstance(tournament, EliminatoryTournament):
             print(f"Tipo: Torneio Eliminatório")
+            self._display_bracket(tournament)
+        elif isinstance(tournament, RoundRobinTournament):
+            print(f"Tipo: Torneio {self._round_robin_type_name(tournament)}")
+            print(f"Número de rodadas: {tournament.num_rounds}")
+        elif isinstance(tournament, ArenaTournament):
+            print(f"Tipo: Torneio Arena")
+            print(f"Duração: {tournament.duration} minutos")
+            print(f"Situação: {self._arena_status(tournament)}")
         else:
             print(f"Tipo: Torneio Básico")
         
         self.pause()
 
+    def _display_bracket(self, tournament):
+        bracket_rounds = self.controller.get_bracket(tournament.name)
+        if not bracket_rounds:
+            return
+
+        round_names = self.controller.get_bracket_info(tournament.name)['round_names']
+        print("\nChave:")
+        for round_num, matches in enumerate(bracket_rounds, 1):
+            print(f"\n  {round_names.get(round_num, f'Rodada {round_num}')}:")
+            for player_a, player_b, winner in matches:
+                name_a = player_a.name if player_a else ("BYE" if round_num == 1 else "?")
+                name_b = player_b.name if player_b else ("BYE" if round_num == 1 else "?")
+                winner_display = f" → {winner.name}" if winner else ""
+                print(f"    {name_a} x {name_b}{winner_display}")
+
     def _edit_tournament(self, tournament):
         """Edit tournament information."""
         self.clear_screen()
@@ -299,6 +365,13 @@ class TournamentView(BaseView):
                 updated_tournament = SwissTournament(name, location, start_date, end_date, time_control, rounds)
             elif isinstance(tournament, EliminatoryTournament):
                 updated_tournament = EliminatoryTournament(name, location, start_date, end_date, time_control)
+            elif isinstance(tournament, RoundRobinTournament):
+                updated_tournament = RoundRobinTournament(name, location, start_date, end_date, time_control,
+                                                          tournament.double_round_robin)
+            elif isinstance(tournament, ArenaTournament):
+                duration_input = self.get_input(f"Duração da arena em minutos [{tournament.duration}]: ")
+                duration = int(duration_input) if duration_input else tournament.duration
+                updated_tournament = ArenaTournament(name, location, start_date, end_date, time_control, duration)
             else:
                 from src.entities.tournament import Tournament
                 updated_tournament = Tournament(name, location, start_date, end_date, time_control)
@@ -348,51 +421,60 @@ class TournamentView(BaseView):
         self.display_separator()
 
         try:
-            all_players = self.player_controller.get_all_players()
-            
-            if not all_players:
-                print("\nNenhum jogador cadastrado no sistema.")
-                print("Por favor, cadastre jogadores primeiro.")
-                self.pause()
-                return
-
-            current_players = tournament.players
-            if current_players:
-                print(f"\nJogadores já inscritos ({len(current_players)}):")
-                for p in current_players:
-                    print(f"  - {p.name}")
-
-            available_players = [p for p in all_players if p.name not in [cp.name for cp in current_players]]
-            
-            if not available_players:
-                print("\nTodos os jogadores cadastrados já estão inscritos neste torneio.")
-                self.pause()
-                return
+            current_names = {p.name for p in tournament.players}
+            if current_names:
+                print(f"\nJogadores já inscritos: {len(current_names)}")
 
-            print(f"\nJogadores disponíveis:")
-            for i, player in enumerate(available_players, 1):
-                print(f"{i}. {player.name} (Rating Clássico: {player.rating.classic})")
-
-            choice = self.get_input("\nEscolha o número do jogador (0 para cancelar): ")
-            
-            if choice == '0':
+            query = self.get_input("\nBuscar jogador pelo nome (Enter para listar todos): ").strip()
+            if query:
+                selected_player = self._choose_searched_player(query, current_names)
+            else:
+                # Registered players not yet in the tournament, one page at a time
+                selected_player = self.browse_pages(
+                    "ADICIONAR JOGADOR AO TORNEIO",
+                    lambda offset, limit, name_filter: self.player_controller.get_players_page(
+                        offset, limit, name_filter, current_names),
+                    lambda number, player: f"{number}. {player.name} (Rating Clássico: {player.rating.classic})",
+                    selectable=True
+                )
+            if selected_player is None:
                 return
 
-            try:
-                index = int(choice) - 1
-                if 0 <= index < len(available_players):
-                    selected_player = available_players[index]
-                    self.controller.add_player_to_tournament(tournament.name, selected_player)
-                    self.display_success(f"Jogador '{selected_player.name}' adicionado ao torneio!")
-                else:
-                    self.display_error("Opção inválida!")
-            except ValueError:
-                self.display_error("Entrada inválida!")
+            self.controller.add_player_to_tournament(tournament.name, selected_player)
+            self.display_success(f"Jogador '{selected_player.name}' adicionado ao torneio!")
         except Exception as e:
             self.display_error(f"Erro ao adicionar jogador: {str(e)}")
 
         self.pause()
 
+    def _choose_searched_player(self, query, current_names):
+        found = self.player_controller.search_players(query, limit=20)
+        if not found:
+            print("\nNenhum jogador encontrado.")
+            return None
+
+        available_players = [p for p in found if p.name not in current_names]
+        if not available_players:
+            print("\nTodos os jogadores encontrados já estão inscritos neste torneio.")
+            return None
+
+        print(f"\nJogadores disponíveis:")
+        for i, player in enumerate(available_players, 1):
+            print(f"{i}. {player.name} (Rating Clássico: {player.rating.classic})")
+
+        choice = self.get_input("\nEscolha o número do jogador (0 para cancelar): ")
+        if choice == '0':
+            return None
+        try:
+            index = int(choice) - 1
+        except ValueError:
+            self.display_error("Entrada inválida!")
+            return None
+        if not 0 <= index < len(available_players):
+            self.display_error("Opção inválida!")
+            return None
+        return available_players[index]
+
     def _remove_player_from_tournament(self, tournament):
         """Remove a player from the tournament."""
         self.clear_screen()
@@ -451,6 +533,10 @@ class TournamentView(BaseView):
                 status = "✓" if all_results else "⚠"
                 print(f"{i + 1} - Ranking após {i}ª rodada {status}")
 
+            if tournament.rounds:
+                print("C - Rankings por categoria (premiação)")
+            if not isinstance(tournament, ArenaTournament):
+                print("S - Chances de título e premiação (simulação)")
             print("0 - Voltar")
             self.display_separator()
 
@@ -460,6 +546,10 @@ class TournamentView(BaseView):
                 break
             elif choice == '1':
                 self._view_tournament_ranking(tournament)
+            elif choice.upper() == 'C' and tournament.rounds:
+                self._view_category_rankings(tournament)
+            elif choice.upper() == 'S' and not isinstance(tournament, ArenaTournament):
+                self._view_outcome_chances(tournament)
             else:
                 try:
                     round_index = int(choice) - 2
@@ -489,7 +579,8 @@ class TournamentView(BaseView):
             if rating_type is None:
                 return
 
-            ranked_players = self.controller.get_tournament_ranking(tournament.name, rating_type)
+            limit = self._get_ranking_limit()
+            ranked_players = self.controller.get_tournament_ranking(tournament.name, rating_type, limit)
             self._display_rankings(ranked_players, rating_name, rating_type)
 
         except Exception as e:
@@ -516,6 +607,14 @@ class TournamentView(BaseView):
 
         return rating_type, rating_name
 
+    def _get_ranking_limit(self):
+        limit_input = self.get_input("Quantos jogadores exibir? (Enter para todos): ").strip()
+        try:
+            limit = int(limit_input) if limit_input else None
+        except ValueError:
+            return None
+        return limit if limit and limit > 0 else None
+
     def _display_rankings(self, ranked_players, rating_name, rating_type):
         print(f"\n{'='*60}")
         print(f"RANKING INICIAL - Rating {rating_name}")
@@ -547,14 +646,11 @@ class TournamentView(BaseView):
                 self.pause()
                 return
 
-            player_scores = self._calculate_player_scores(tournament, round_number)
+            limit = self._get_ranking_limit()
             rating_type = tournament.time_control.value
             rating_name = str(tournament.time_control)
-            
-            sorted_players = sorted(
-                player_scores.values(),
-                key=lambda x: (-x['score'], -getattr(x['player'].rating, rating_type))
-            )
+
+            sorted_players = self.controller.get_standings(tournament.name, round_number, limit)
 
             self._display_round_rankings_with_stats(tournament, sorted_players, rating_name, round_number, rating_type)
                 
@@ -564,35 +660,62 @@ class TournamentView(BaseView):
 
         self.pause()
 
+    def _view_category_rankings(self, tournament):
+        """View the standings of each prize category after the last round."""
+        self.clear_screen()
+        self.display_separator()
+        print("           RANKINGS POR CATEGORIA")
+        self.display_separator()
+
+        try:
+            limit_input = self.get_input("\nPrêmios por categoria (Enter para 3): ").strip()
+            limit = int(limit_input) if limit_input else 3
+
+            tables = self.controller.get_category_standings(tournament.name, limit=limit)
+            for category_name, entries in tables.items():
+                if not entries:
+                    continue
+                print(f"\n{category_name}")
+                print("-" * 60)
+                for i, (position, data) in enumerate(entries, 1):
+                    print(f"  {i}º - {data['player'].name}: {data['score']:.1f} pontos ({position}º geral)")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao visualizar rankings por categoria: {str(e)}")
+
+        self.pause()
+
+    def _view_outcome_chances(self, tournament):
+        """Show each player's chance to win and to finish in the prizes, by simulating the rest of the event."""
+        self.clear_screen()
+        self.display_separator()
+        print("       CHANCES DE TÍTULO E PREMIAÇÃO")
+        self.display_separator()
+
+        try:
+            runs_input = self.get_input("\nNúmero de simulações (Enter para 10000): ").strip()
+            runs = int(runs_input) if runs_input else 10000
+            prizes_input = self.get_input("Colocações premiadas (Enter para 3): ").strip()
+            prize_places = int(prizes_input) if prizes_input else 3
+            limit = self._get_ranking_limit()
+
+            print("\nSimulando...")
+            report = self.controller.simulate_outcomes(tournament.name, runs, prize_places)
+            print(f"\n{'Jogador':<30} {'Título':>8} {'Top ' + str(prize_places):>8} {'Posição média':>14}")
+            print("-" * 64)
+            for entry in report[:limit]:
+                print(f"{entry['player'].name:<30} {entry['win_probability']:>8.1%} "
+                      f"{entry['prize_probability']:>8.1%} {entry['expected_place']:>14.1f}")
+        except ValueError as e:
+            self.display_error(str(e))
+        except Exception as e:
+            self.display_error(f"Erro ao simular o torneio: {str(e)}")
+
+        self.pause()
+
     def _calculate_player_scores(self, tournament, round_number):
-        player_scores = {
-            p.name: {'player': p, 'score': 0.0, 'matches_played': 0}
-            for p in tournament.players
-        }
-        for i in range(round_number):
-            if i >= len(tournament.rounds):
-                break
-            round_obj = tournament.rounds[i]
-            for match in round_obj.matches:
-                self._update_scores_from_match(player_scores, match)
-        return player_scores
-
-    def _update_scores_from_match(self, player_scores, match):
-        white_name = match.white.name
-        if match.black is None:
-            player_scores[white_name]['score'] += 1.0
-            player_scores[white_name]['matches_played'] += 1
-        elif match.result:
-            player_scores[white_name]['matches_played'] += 1
-            black_name = match.black.name
-            player_scores[black_name]['matches_played'] += 1
-            if match.result == "1-0":
-                player_scores[white_name]['score'] += 1.0
-            elif match.result == "0-1":
-                player_scores[black_name]['score'] += 1.0
-            elif match.result == "0.5-0.5":
-                player_scores[white_name]['score'] += 0.5
-                player_scores[black_name]['score'] += 0.5
+        return tournament.get_scores(round_number)
 
     def _display_round_rankings(self, sorted_players, rating_name, round_number, rating_type):
         print(f"\nRitmo do torneio: {rating_name}")
@@ -665,67 +788,36 @@ class TournamentView(BaseView):
             print()
 
     def _list_tournament_players(self, tournament):
-        """List all players registered in the tournament with their statistics."""
-        self.clear_screen()
-        self.display_separator()
-        print("           JOGADORES INSCRITOS NO TORNEIO")
-        self.display_separator()
+        """List the players registered in the tournament with their statistics, one page at a time."""
+        # Statistics are shown once there are rounds
+        has_rounds = bool(tournament.rounds)
+        rating_type = tournament.time_control.value
+
+        def format_line(number, entry):
+            player, stats = entry
+            line = (f"{number}. {player.name} | Clássico: {player.rating.classic} | "
+                    f"Rápido: {player.rating.rapid} | Blitz: {player.rating.blitz}")
+            if stats is not None:
+                line += (f" | Pontos: {stats['points']:.1f}/{stats['games_played']} "
+                         f"(V/E/D {stats['wins']}/{stats['draws']}/{stats['losses']})")
+                if stats['average_opponent_rating'] > 0:
+                    # Estimated rating change (simplified)
+                    rating_change = stats['performance_rating'] - getattr(player.rating, rating_type)
+                    change_symbol = "+" if rating_change > 0 else ""
+                    line += (f" | Média adv.: {stats['average_opponent_rating']:.0f}"
+                             f" | Performance: {stats['performance_rating']} ({change_symbol}{rating_change:.0f})")
+            return line
 
         try:
-            players = tournament.players
-            
-            if not players:
-                print("\nNenhum jogador inscrito neste torneio.")
-            else:
-                # Check if there are any rounds (to show statistics)
-                has_rounds = tournament.rounds and len(tournament.rounds) > 0
-                
-                print(f"\nTotal de jogadores inscritos: {len(players)}")
-                
-                if has_rounds:
-                    print("\n(Incluindo estatísticas do torneio)")
-                
-                print()
-                
-                # Get rating type for this tournament
-                rating_type = tournament.time_control.value
-                
-                for i, player in enumerate(players, 1):
-                    current_rating = getattr(player.rating, rating_type)
-                    
-                    print(f"{i}. {player.name}")
-                    print(f"   Data de Nascimento: {player.birthdate}")
-                    print(f"   Gênero: {player.gender}")
-                    print(f"   Ratings:")
-                    print(f"     - Clássico: {player.rating.classic}")
-                    print(f"     - Rápido: {player.rating.rapid}")
-                    print(f"     - Blitz: {player.rating.blitz}")
-                    
-                    # Show tournament statistics if there are rounds
-                    if has_rounds:
-                        try:
-                            stats = self.controller.get_player_statistics(tournament.name, player.name)
-                            
-                            print(f"   Desempenho no Torneio:")
-                            print(f"     - Pontos: {stats['points']:.1f}/{stats['games_played']}")
-                            print(f"     - Vitórias/Empates/Derrotas: {stats['wins']}/{stats['draws']}/{stats['losses']}")
-                            
-                            if stats['average_opponent_rating'] > 0:
-                                print(f"     - Rating Médio dos Adversários: {stats['average_opponent_rating']:.0f}")
-                                print(f"     - Rating Performance: {stats['performance_rating']}")
-                                
-                                # Calculate rating change (simplified)
-                                rating_change = stats['performance_rating'] - current_rating
-                                change_symbol = "+" if rating_change > 0 else ""
-                                print(f"     - Ganho Estimado de Rating: {change_symbol}{rating_change:.0f}")
-                        except Exception as e:
-                            print(f"     - Estatísticas não disponíveis: {str(e)}")
-                    
-                    print()
+            self.browse_pages(
+                "JOGADORES INSCRITOS NO TORNEIO",
+                lambda offset, limit, name_filter: self.controller.get_tournament_players_page(
+                    tournament.name, offset, limit, name_filter, has_rounds),
+                format_line
+            )
         except Exception as e:
             self.display_error(f"Erro ao listar jogadores: {str(e)}")
-
-        self.pause()
+            self.pause()
 
     def _generate_round_pairings(self, tournament):
         """Generate and display pairings for the next round."""
@@ -745,13 +837,30 @@ class TournamentView(BaseView):
             if isinstance(tournament, EliminatoryTournament):
                 self._display_bracket_info(tournament)
 
+            if isinstance(tournament, RoundRobinTournament):
+                full = self.get_input("\nGerar e salvar a tabela completa de rodadas? (S/N): ")
+                if full.upper() == 'S':
+                    saved = self.controller.save_schedule(tournament.name)
+                    self.display_success(f"{saved} rodadas salvas com sucesso!")
+                    self.pause()
+                    return
+
             confirm = self.get_input("\nGerar emparceiramento da próxima rodada? (S/N): ")
             if confirm.upper() != 'S':
                 self.display_message("Operação cancelada.")
                 self.pause()
                 return
 
-            round_number, pairings, _ = self.controller.generate_round_pairings(tournament.name)
+            time_budget = None
+            if isinstance(tournament, SwissTournament) and tournament.rounds:
+                budget_input = self.get_input("Tempo máximo de busca em segundos (Enter para rápido): ").strip()
+                time_budget = float(budget_input) if budget_input else None
+
+            round_number, pairings, paired_tournament = self.controller.generate_round_pairings(
+                tournament.name, time_budget
+            )
+            if isinstance(paired_tournament, SwissTournament) and paired_tournament.last_pairing_stats:
+                self._display_pairing_stats(paired_tournament.last_pairing_stats)
             self._display_and_save_pairings(tournament, round_number, pairings)
 
         except ValueError as e:
@@ -761,9 +870,97 @@ class TournamentView(BaseView):
 
         self.pause()
 
+    def _manage_arena(self, tournament):
+        """Start an arena and enter its results; players are paired again as soon as their game ends."""
+        result_map = {'B': "1-0", 'P': "0-1", 'E': "0.5-0.5"}
+        try:
+            if tournament.started_at is None:
+                self.clear_screen()
+                self.display_separator()
+                print(f"       ARENA: {tournament.name}")
+                self.display_separator()
+                print(f"\nJogadores inscritos: {len(tournament.players)}")
+                print(f"Duração: {tournament.duration} minutos")
+                confirm = self.get_input("\nIniciar a arena agora? (S/N): ")
+                if confirm.upper() != 'S':
+                    return
+                self.controller.start_arena(tournament.name)
+
+            while True:
+                tournament = self.controller.get_tournament_by_name(tournament.name)
+                games = tournament.get_round(1).matches
+                ongoing = [(i, game) for i, game in enumerate(games) if game.result is None]
+
+                self.clear_screen()
+                self.display_separator()
+                print(f"       ARENA: {tournament.name}")
+                self.display_separator()
+                print(f"\nSituação: {self._arena_status(tournament)}")
+                print(f"Partidas jogadas: {len(games) - len(ongoing)} | Em andamento: {len(ongoing)} | "
+                      f"Na fila: {len(tournament.waiting)}")
+                print("\nComandos:")
+                print("  <mesa>B - Brancas vencem (1-0)   ex: 12B")
+                print("  <mesa>P - Pretas vencem (0-1)")
+                print("  <mesa>E - Empate (½-½)")
+                print("  F - Emparceirar jogadores na fila")
+                print("  Q - Sair")
+                self.display_separator()
+
+                for i, game in ongoing:
+                    print(f"Mesa {i + 1}: {game.white.name} x {game.black.name}")
+
+                command = self.get_input("\nComando: ").strip().upper()
+                if command == 'Q':
+                    break
+                elif command == 'F':
+                    pairings = self.controller.pair_arena(tournament.name)
+                    self.display_message(f"{len(pairings)} nova(s) partida(s).")
+                    self.pause()
+                elif len(command) > 1 and command[:-1].isdigit() and command[-1] in result_map:
+                    pairings = self.controller.record_arena_result(
+                        tournament.name, int(command[:-1]) - 1, result_map[command[-1]]
+                    )
+                    for white, black in pairings:
+                        print(f"  Nova partida: {white.name} x {black.name}")
+                    if pairings:
+                        self.pause()
+                else:
+                    self.display_error("Comando inválido!")
+                    self.pause()
+
+        except ValueError as e:
+            self.display_error(str(e))
+            self.pause()
+        except Exception as e:
+            self.display_error(f"Erro na arena: {str(e)}")
+            self.pause()
+
+    def _arena_status(self, tournament):
+        if tournament.started_at is None:
+            return "Não iniciada"
+        remaining = tournament.ends_at - time.time()
+        if remaining <= 0:
+            return "Encerrada (partidas em andamento ainda podem terminar)"
+        return f"Em andamento ({int(remaining // 60)}min {int(remaining % 60)}s restantes)"
+
+    def _display_pairing_stats(self, stats):
+        print(f"\nBusca de emparceiramento ({stats['method']}):")
+        print(f"  - Tempo: {stats['elapsed']:.2f}s | Processos: {stats['workers']}")
+        print(f"  - Iterações: {stats['iterations']} | Custos de pares calculados: {stats['cost_evaluations']} "
+              f"(~10^{len(str(stats['search_space'])) - 1} emparceiramentos possíveis)")
+        if stats['optimal']:
+            print("  - O emparceiramento encontrado é comprovadamente o melhor possível")
+        print(f"  - Custo inicial: {stats['initial_cost']} | Melhor custo: {stats['best_cost']}")
+        self.pause()
+
     def _display_tournament_summary(self, tournament):
         print(f"\nTorneio: {tournament.name}")
-        print(f"Tipo: {'Suíço' if isinstance(tournament, SwissTournament) else 'Eliminatório'}")
+        if isinstance(tournament, SwissTournament):
+            print("Tipo: Suíço")
+        elif isinstance(tournament, RoundRobinTournament):
+            print(f"Tipo: {self._round_robin_type_name(tournament)}")
+        else:
+            print("Tipo: Eliminatório")
         print(f"Ritmo: {tournament.time_control}")
         print(f"Jogadores inscritos: {len(tournament.players)}")
 
@@ -870,9 +1067,6 @@ class TournamentView(BaseView):
             
             if match.black is None:
                 print(f"  → BYE (vitória automática para {match.white.name})")
-                # Set result as 1-0 for BYE
-                if match.result is None:
-                    self.controller.update_match_result(tournament.name, round_number, i-1, "1-0")
             else:
                 current_result = self._format_eliminatory_result(match.result)
                 if current_result:
@@ -967,45 +1161,53 @@ class TournamentView(BaseView):
             return None
 
     def _annotate_matches_cursor_based(self, tournament, round_number, matches):
+        header = [
+            "=" * 60,
+            f"       ANOTAR RESULTADOS - Rodada {round_number}",
+            "=" * 60,
+            "Comandos: B - Brancas vencem (1-0)   P - Pretas vencem (0-1)",
+            "          E - Empate (½-½)   Enter - Próxima   número - Ir para a mesa",
+            "          Q - Sair e salvar",
+            "=" * 60,
+        ]
+        # Header, board list, then position, message and prompt rows
+        _, rows = TERMINAL.size()
+        window = ScrollWindow(len(matches), rows - len(header) - 4)
         cursor_pos = 0
-        while True:
-            self.clear_screen()
-            self.display_separator()
-            print(f"       ANOTAR RESULTADOS - Rodada {round_number}")
-            self.display_separator()
-            print("\nComandos:")
-            print("  B - Brancas vencem (1-0)")
-            print("  P - Pretas vencem (0-1)")
-            print("  E - Empate (½-½)")
-            print("  Enter - Próxima partida")
-            print("  Q - Sair e salvar")
-            self.display_separator()
+        message = ""
 
-            for i, match in enumerate(matches):
-                cursor = ">>>" if i == cursor_pos else "   "
-                result_display = self._get_result_display(match.result)
-                print(f"\n{cursor} Mesa {i+1}:{result_display}")
-                print(f"    Brancas: {match.white.name}")
-                if match.black is None:
-                    print(f"    Pretas: BYE (vitória automática)")
-                else:
-                    print(f"    Pretas: {match.black.name}")
+        self.clear_screen()
+        while True:
+            # Only the boards in the window are formatted; unchanged rows are not rewritten
+            visible = window.follow(cursor_pos)
+            lines = header + [self._format_board_line(i, matches[i], i == cursor_pos) for i in visible]
+            lines.append(f"Mesas {visible.start + 1}-{visible.stop} de {len(matches)}")
+            lines.append(message)
+            TERMINAL.render(lines)
+            message = ""
 
-            command = self.get_input("\nComando: ").upper()
+            command = self.get_input("Comando: ").strip().upper()
 
             if command in ['B', 'P', 'E']:
-                self._update_match_result(tournament, round_number, cursor_pos, command, matches)
-                matches = self.controller.get_round_matches(tournament.name, round_number)
-                cursor_pos = min(cursor_pos + 1, len(matches) - 1)
-            elif command == '' or command == '\n':
+                message = self._update_match_result(tournament, round_number, cursor_pos, command, matches)
+                if not message:
+                    cursor_pos = min(cursor_pos + 1, len(matches) - 1)
+            elif command == '':
                 cursor_pos = (cursor_pos + 1) % len(matches)
+            elif command.isdigit() and 1 <= int(command) <= len(matches):
+                cursor_pos = int(command) - 1
             elif command == 'Q':
+                TERMINAL.invalidate()
                 self.display_success("Resultados salvos com sucesso!")
                 self.pause()
                 break
             else:
-                self.display_error("Comando inválido!")
-                self.pause()
+                message = "❌ Erro: Comando inválido!"
+
+    def _format_board_line(self, index, match, selected):
+        cursor = ">>>" if selected else "   "
+        black = match.black.name if match.black is not None and match.black.name != match.white.name else "BYE"
+        return f"{cursor} Mesa {index + 1:>3}:{self._get_result_display(match.result)}  {match.white.name} x {black}"
 
     def _get_result_display(self, result):
         if result == "1-0":
@@ -1018,14 +1220,20 @@ class TournamentView(BaseView):
             return " [ - ]"
 
     def _update_match_result(self, tournament, round_number, cursor_pos, command, matches):
+        """Save the result of a board; returns an error message for the screen, or '' if saved."""
         result_map = {'B': "1-0", 'P': "0-1", 'E': "0.5-0.5"}
-        if matches[cursor_pos].black is None:
-            self.display_error("Esta partida já é BYE (vitória automática)!")
-            self.pause()
-        else:
+        match = matches[cursor_pos]
+        if match.black is None or match.black.name == match.white.name:
+            return "❌ Erro: Esta partida já é BYE (vitória automática)!"
+        try:
             self.controller.update_match_result(
                 tournament.name, 
                 round_number, 
                 cursor_pos, 
                 result_map[command]
-            )
\ No newline at end of file
+            )
+        except ValueError as e:
+            return f"❌ Erro: {e}"
+        # The saved round is not reloaded: only this board changed
+        match.result = result_map[command]
+        return ""
\ No newline at end of file